@@ -0,0 +1,84 @@
+"""
+Rendering benchmark for the display_* views on a large chapter.
+
+Times a 2,000-quest chapter list plus 200 quest detail screens written to /dev/null,
+with colour forced on and with --no-color, against a baseline that prints the same
+lines one by one through colorama's autoreset wrapper (how the views used to write).
+
+Run from the repository root:
+    python benchmarks/bench_render.py [--quests N] [--details N] [--repeat N]
+"""
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from colorama.ansitowin32 import AnsiToWin32
+
+from module.model.quest_models import Chapter, Item, Quest, Task
+from module.view import render
+from module.view.display_quests import display_quest_details, display_quests, render_quest_details, render_quests
+
+
+def build_chapter(quest_count: int) -> Chapter:
+    quests = [
+        Quest(
+            id=f"{i:016X}", title=f"Quest {i}", x=float(i % 50), y=float(i // 50),
+            dependencies=[f"{i - 1:016X}"] if i else [],
+            tasks=[Task(id=f"T{i:015X}", type="item", item=Item(id="minecraft:stone", count=4))],
+        )
+        for i in range(quest_count)
+    ]
+    return Chapter(id="BENCH", filename="bench", group="", order_index=0, quests=quests)
+
+
+def time_it(label: str, run, repeat: int) -> float:
+    run()  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        run()
+    elapsed = (time.perf_counter() - start) / repeat * 1000
+    print(f"{label:<34} {elapsed:9.2f} ms", file=sys.stderr)
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--quests', type=int, default=2000)
+    parser.add_argument('--details', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    chapter = build_chapter(args.quests)
+    detailed = chapter.quests[:args.details]
+
+    def buffered() -> None:
+        display_quests(chapter)
+        for quest in detailed:
+            display_quest_details(quest)
+
+    def line_by_line(stream) -> None:
+        # Same screens, one print per line through an autoreset wrapper
+        for text in (render_quests(chapter), *(render_quest_details(quest) for quest in detailed)):
+            for line in text.split("\n"):
+                print(line, file=stream)
+
+    print(f"{args.quests} quests + {args.details} detail screens, mean of {args.repeat} runs", file=sys.stderr)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        wrapped = AnsiToWin32(devnull, convert=False, strip=False, autoreset=True).stream
+        baseline = time_it("print per line (autoreset)", lambda: line_by_line(wrapped), args.repeat)
+        try:
+            render.set_color(True)
+            colour = time_it("one write per screen, colour", buffered, args.repeat)
+            render.set_color(False)
+            plain = time_it("one write per screen, --no-color", buffered, args.repeat)
+        finally:
+            render.set_color(None)
+    print(f"speed-up: {baseline / colour:.1f}x (colour), {baseline / plain:.1f}x (--no-color)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
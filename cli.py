@@ -1,39 +1,106 @@
 import argparse
+import json
+import shlex
 import sys
-from typing import Dict, Optional, List, Tuple, Union
+
+try:
+    import readline
+except ImportError:  # e.g. Windows without pyreadline3: no tab completion
+    readline = None
+from typing import Any, Dict, Optional, List, Tuple, Union
 
 # Import all necessary components from the module
 from module import (
-    display_chapters, display_quests, display_quest_details, display_task_details, display_reward_details,
-    load_chapter_data, load_language_data, parse_chapters, find_chapters_directory,
+    display_chapters, display_quest_details, display_task_details, display_reward_details,
+    load_chapter_data, parse_chapters, find_chapters_directory, LangStore,
     Chapter, Quest,
-    edit_chapter_title, edit_quest_in_chapter, edit_quest_position
+    edit_chapter_title, edit_quest_in_chapter, edit_quest_position,
+    transform_quest_positions, autolayout_chapter,
+    export_to_sqlite, load_chapters_from_sqlite, load_language_from_sqlite,
+    export_jsonl, import_jsonl,
+    load_book_from_directory, diff_books, display_diff_report,
+    lint_book, display_lint_report,
+    DEFAULT_LOCALE, lang_coverage, display_lang_coverage,
+    expand_roots, batch_analyze, display_batch_report,
+    economy_report, display_economy_report,
+    progression_report, display_progression_report,
+    ChapterGraph, display_chapter_graph,
+    book_stats, display_stats,
+    load_item_mapping, migrate_items,
+    IdAllocator, is_valid_id,
+    set_color, QuestPager,
+    JSON_FORMATS, chapter_records, quest_record, write_record, write_records,
+    PrefixIndex, QuestIndex, Completer, quest_detail_completions, CHAPTER_COMMANDS,
+    IncrementalValidator, changed_chapter_keys, save_changed_chapters
 )
 
 # --- Shared Utility ---
 
-def load_data_for_cli() -> Optional[Dict[str, Chapter]]:
-    """Loads and parses data once for any CLI mode."""
+# Where the current book came from, filled in by load_data_for_cli (used by exporters).
+# 'lang' is the LangStore used to resolve titles at display time; 'raw' holds the raw
+# SNBT data by filename so saved chapters keep fields the models do not know about.
+_session: Dict[str, Any] = {'chapters_dir': None, 'lang': None, 'raw': {}}
+
+def _lang_data() -> Dict[str, Any]:
+    """The session locale's lang entries (with fallback) as one dict, for exporters and lint."""
+    return _session['lang'].merged() if _session['lang'] else {}
+
+def _locale() -> str:
+    return _session['lang'].locale if _session['lang'] else DEFAULT_LOCALE
+
+# Commands that work on their own inputs and must not trigger book discovery/loading.
+STANDALONE_COMMANDS = {'import', 'diff', 'batch'}
+
+def load_data_for_cli(db_path: Optional[str] = None, locale: Optional[str] = None, root: Optional[str] = None) -> Optional[Dict[str, Chapter]]:
+    """
+    Loads and parses data once for any CLI mode (from SQLite when db_path is given).
+    With root, chapters are only searched for under that directory.
+    """
+    locale = locale or DEFAULT_LOCALE
     try:
+        if db_path:
+            # Chapters are fetched lazily from the database on first access
+            lang = LangStore(locale=locale, preloaded={
+                candidate: load_language_from_sqlite(db_path, candidate) for candidate in {locale, DEFAULT_LOCALE}
+            })
+            _session['lang'] = lang
+            return load_chapters_from_sqlite(db_path)
+
         # 1. Discover chapters directory
-        chapters_dir = find_chapters_directory()
+        chapters_dir = find_chapters_directory(root)
         
         # 2. Load chapter data
         raw_chapter_data = load_chapter_data(chapters_dir)
         
-        # --- FIX: Load language data using the discovered chapters directory ---
-        lang_data = load_language_data(chapters_dir)
-        # ----------------------------------------------------------------------
+        # Lang files next to the chapters directory are read lazily, per locale, on first use
+        lang = LangStore.for_chapters_dir(chapters_dir, locale=locale)
+        _session['chapters_dir'] = chapters_dir
+        _session['lang'] = lang
+        _session['raw'] = raw_chapter_data
         
-        # 3. Parse and return
-        return parse_chapters(raw_chapter_data, lang_data)
+        # 3. Parse and return (titles are resolved at display time through the LangStore)
+        return parse_chapters(raw_chapter_data)
         
     except Exception as e:
-        print(f"Error loading quest data: {e}")
+        print(f"Error loading quest data: {e}", file=sys.stderr)
         return None
 
 # --- Interactive CLI Helper Functions ---
 
+# Tab completion for the interactive prompts; the active index follows the current level
+_completer = Completer()
+
+def _install_completion() -> None:
+    """Hook the completer into readline (whole-line completion, so titles may contain spaces)."""
+    if readline is None:
+        return
+    readline.set_completer(_completer.complete)
+    readline.set_completer_delims("")
+    if 'libedit' in (readline.__doc__ or ''):
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+
 def _handle_chapter_level_input(
     parsed_chapters: Dict[str, Chapter], 
     chapter_keys: List[str], 
@@ -56,6 +123,7 @@ def _handle_chapter_level_input(
 
 def _handle_chapter_edit(current_chapter: Chapter) -> Chapter:
     """Handles the 'edit' command at the Chapter level (currently title only)."""
+    _completer.set_index(PrefixIndex(['title ', 'back']))
     print("Edit chapter: Type 'title <new_title>' or 'back'")
     edit_input = input().strip()
     match edit_input.split():
@@ -72,6 +140,7 @@ def _handle_chapter_edit(current_chapter: Chapter) -> Chapter:
 
 def _handle_quest_detail_edit(selected_quest: Quest, current_chapter: Chapter) -> Tuple[Quest, Chapter]:
     """Handles the 'edit' command at the Quest Detail level (e.g., position)."""
+    _completer.set_index(PrefixIndex(['position ', 'back']))
     print("Edit quest: Type 'position x y' or 'back'")
     edit_input = input().strip()
     match edit_input.split():
@@ -97,7 +166,8 @@ def _handle_quest_detail_level_loop(selected_quest: Quest, current_chapter: Chap
     
     # Loop while viewing details of the selected quest
     while True:
-        display_quest_details(selected_quest)
+        display_quest_details(selected_quest, _session['lang'])
+        _completer.set_index(quest_detail_completions(selected_quest))
         sub_input = input("Select task/reward index (e.g., 'task 0'), 'edit', 'back', or 'exit': ").strip().lower()
         
         match sub_input.split():
@@ -106,9 +176,9 @@ def _handle_quest_detail_level_loop(selected_quest: Quest, current_chapter: Chap
             case ['back']:
                 return 'break', current_chapter, None
             case ['task', t_index] if t_index.isdigit() and 0 <= int(t_index) < len(selected_quest.tasks):
-                display_task_details(selected_quest.tasks[int(t_index)], selected_quest.id)
+                display_task_details(selected_quest.tasks[int(t_index)], selected_quest.id, lang=_session['lang'])
             case ['reward', r_index] if r_index.isdigit() and 0 <= int(r_index) < len(selected_quest.rewards):
-                display_reward_details(selected_quest.rewards[int(r_index)], selected_quest.id)
+                display_reward_details(selected_quest.rewards[int(r_index)], selected_quest.id, lang=_session['lang'])
             case ['edit']:
                 # Edit returns the new quest and the new chapter object
                 selected_quest, current_chapter = _handle_quest_detail_edit(selected_quest, current_chapter)
@@ -118,13 +188,68 @@ def _handle_quest_detail_level_loop(selected_quest: Quest, current_chapter: Chap
     
     return 'continue', current_chapter, selected_quest # Fall-Through Safegaurd
 
-def _handle_quest_level_input(current_chapter: Chapter, user_input: str) -> Tuple[str, Chapter]:
+def _is_exact_pager_command(words: List[str]) -> bool:
+    """'next', 'n', 'prev', 'p' and 'page <digits>' always page, even if a quest has that title."""
+    return words in (['next'], ['n'], ['prev'], ['p']) or (len(words) == 2 and words[0] == 'page' and words[1].isdigit())
+
+def _handle_pager_input(pager: QuestPager, words: List[str]) -> bool:
+    """Apply a paging/filter command. Returns True if the visible window changed."""
+    match words:
+        case ['next'] | ['n']:
+            moved = pager.next_page()
+        case ['prev'] | ['p']:
+            moved = pager.prev_page()
+        case ['page', number] if number.isdigit():
+            moved = pager.go_to(int(number))
+        case ['filter', *text]:
+            pager.set_filter(' '.join(text))
+            return True
+        case ['page', *_]:
+            print("Usage: page <n>")
+            return False
+        case _:
+            return False
+    if not moved:
+        print(f"No such page (1-{pager.page_count}).")
+    return moved
+
+def _select_quest(current_chapter: Chapter, index: int) -> Tuple[str, Chapter]:
+    """Open the detail view of the quest at `index` and return the resulting (action, chapter)."""
+    selected_quest = current_chapter.quests[index]
+    
+    # Enter Quest Details loop
+    action, updated_chapter, _ = _handle_quest_detail_level_loop(selected_quest, current_chapter)
+    
+    if action == 'exit':
+        return 'exit', current_chapter # Propagate exit
+    
+    # Action 'break' (go back to quest list) or 'continue' (edit finished).
+    # We return to the main loop with the potentially updated chapter.
+    return 'continue', updated_chapter if updated_chapter else current_chapter
+
+def _handle_quest_level_input(
+    current_chapter: Chapter,
+    user_input: str,
+    pager: Optional[QuestPager] = None,
+    quest_index: Optional[QuestIndex] = None,
+) -> Tuple[str, Chapter]:
     """
     Handles input when at the Quest selection level for a specific chapter.
+    Quests can be picked by list number, or by ID or title when a QuestIndex is given.
+    The exact pager commands ('next', 'n', 'prev', 'p', 'page <n>') take precedence over
+    quest titles; any other input that matches a quest ID or title selects that quest, so
+    titles starting with 'filter' or 'page' stay reachable.
     Returns: (action, updated_chapter)
-    Action can be 'exit', 'back', or 'continue' (to repeat loop with potentially updated chapter).
+    Action can be 'exit', 'back', 'continue' (to repeat loop with potentially updated chapter),
+    or 'stay' (nothing changed, so the quest list does not need to be redrawn).
     """
-    match user_input.split():
+    words = user_input.split()
+    found = quest_index.find(user_input) if quest_index is not None else None
+    if pager is not None and words and (
+            _is_exact_pager_command(words) or (found is None and words[0] in ('page', 'filter'))):
+        return ('continue' if _handle_pager_input(pager, words) else 'stay'), current_chapter
+
+    match words:
         case ['exit']:
             return 'exit', current_chapter
         case ['back']:
@@ -133,20 +258,12 @@ def _handle_quest_level_input(current_chapter: Chapter, user_input: str) -> Tupl
             updated_chapter = _handle_chapter_edit(current_chapter)
             return 'continue', updated_chapter
         case [index] if index.isdigit() and 0 <= int(index) < len(current_chapter.quests):
-            selected_quest = current_chapter.quests[int(index)]
-            
-            # Enter Quest Details loop
-            action, updated_chapter, _ = _handle_quest_detail_level_loop(selected_quest, current_chapter)
-            
-            if action == 'exit':
-                return 'exit', current_chapter # Propagate exit
-            
-            # Action 'break' (go back to quest list) or 'continue' (edit finished).
-            # We return to the main loop with the potentially updated chapter.
-            return 'continue', updated_chapter if updated_chapter else current_chapter
+            return _select_quest(current_chapter, int(index))
+        case _ if found is not None:
+            return _select_quest(current_chapter, found)
         case _:
-            print("Invalid. Try 'back', 'edit', or a number.")
-            return 'continue', current_chapter
+            print("Invalid. Try 'back', 'edit', 'next', 'prev', 'page <n>', 'filter <text>', a number, an ID or a title.")
+            return 'stay', current_chapter
 
 # --- 2. Interactive CLI Main Function (Refactored) ---
 
@@ -158,16 +275,26 @@ def interactive_cli_main(parsed_chapters: Dict[str, Chapter]):
     # State variables
     current_chapter: Optional[Chapter] = None
     chapter_keys = list(parsed_chapters.keys())
+    # Only the visible window of a chapter is rendered; redraw only when something changed
+    pager = QuestPager(lang=_session['lang'])
+    redraw = True
+    # Prebuilt completion indexes: chapter keys once, quest IDs/titles per shown chapter
+    chapter_completions = PrefixIndex([*chapter_keys, *CHAPTER_COMMANDS])
+    quest_index: Optional[QuestIndex] = None
+    _install_completion()
 
     print("FTB Quests CLI (Interactive Mode).")
 
     while True:
         if current_chapter is None:
             # Chapter selection level
-            display_chapters(parsed_chapters)
+            if redraw:
+                display_chapters(parsed_chapters)
+            _completer.set_index(chapter_completions)
             user_input = input("Select chapter index, key, or 'exit': ").strip().lower()
 
             result = _handle_chapter_level_input(parsed_chapters, chapter_keys, user_input)
+            redraw = result is not None
             
             if result == 'EXIT':
                 break
@@ -175,11 +302,16 @@ def interactive_cli_main(parsed_chapters: Dict[str, Chapter]):
                 current_chapter = result
                 
         else:
-            # Quest selection level
-            display_quests(current_chapter)
-            user_input = input("Select quest index, 'back', 'edit', or 'exit': ").strip().lower()
+            # Quest selection level (one page at a time)
+            if redraw:
+                pager.display(current_chapter)
+            if quest_index is None or quest_index.chapter is not current_chapter:
+                quest_index = QuestIndex(current_chapter, _session['lang'])
+            _completer.set_index(quest_index.completions)
+            user_input = input("Select quest index, 'next', 'prev', 'page <n>', 'filter <text>', 'back', 'edit', or 'exit': ").strip().lower()
 
-            action, updated_chapter = _handle_quest_level_input(current_chapter, user_input)
+            action, updated_chapter = _handle_quest_level_input(current_chapter, user_input, pager, quest_index)
+            redraw = action != 'stay'
 
             if action == 'exit':
                 break
@@ -194,104 +326,521 @@ def interactive_cli_main(parsed_chapters: Dict[str, Chapter]):
 
 # --- 3. Rapid Argparse Tool Main Function (Unchanged) ---
 
-def argparse_cli_main(args: argparse.Namespace, chapters: Dict[str, Chapter]):
+def _moved_count(old: Chapter, new: Chapter) -> int:
+    """Number of quests whose position differs between two versions of a chapter."""
+    return sum(1 for a, b in zip(old.quests, new.quests) if (a.x, a.y) != (b.x, b.y))
+
+def _store_edit(book: Optional[Dict[str, Chapter]], chapter_key: str, chapter: Chapter) -> None:
+    """Keep an edited chapter in the script's working book (single commands are never saved)."""
+    if book is not None:
+        book[chapter_key] = chapter
+
+def argparse_cli_main(args: argparse.Namespace, chapters: Dict[str, Chapter], book: Optional[Dict[str, Chapter]] = None):
     """
     A single-command, non-interactive CLI using argparse.
     Suitable for quick data lookups and atomic edits.
+    In script mode, edited chapters are written into `book` (usually the same dict as `chapters`).
     """
     
     if args.command == 'view':
         if args.entity == 'chapters':
-            display_chapters(chapters)
+            if args.format == 'text':
+                display_chapters(chapters)
+            else:
+                write_records(chapter_records(chapters, _session['lang']), args.format)
         elif args.entity == 'quest' and args.id:
             # Search for the quest across all chapters
-            found_quest = next((
-                quest for chapter in chapters.values() for quest in chapter.quests 
+            found = next((
+                (chapter_key, quest) for chapter_key, chapter in chapters.items() for quest in chapter.quests 
                 if quest.id.startswith(args.id)
             ), None)
             
-            if found_quest:
-                display_quest_details(found_quest)
+            if not found:
+                print(f"Error: Quest with ID starting with '{args.id}' not found.", file=sys.stderr if args.format != 'text' else sys.stdout)
+            elif args.format == 'text':
+                display_quest_details(found[1], _session['lang'])
             else:
-                print(f"Error: Quest with ID starting with '{args.id}' not found.")
+                write_record(quest_record(*found, _session['lang']))
                 
     elif args.command == 'edit':
         if args.entity == 'chapter' and args.field == 'title':
             chapter_key = args.id
             if chapter_key in chapters:
                 updated_chapter = edit_chapter_title(chapters[chapter_key], args.value)
-                # NOTE: You must add file saving logic here for persistent edits.
+                _store_edit(book, chapter_key, updated_chapter)
                 print(f"✅ Chapter '{chapter_key}' title changed to '{updated_chapter.title}' (Unsaved).")
             else:
                 print(f"Error: Chapter '{chapter_key}' not found.")
+                sys.exit(1)
         
         elif args.entity == 'quest' and args.field == 'position' and args.x is not None and args.y is not None:
             # Find the quest
-            found_quest = next((
-                quest for chapter in chapters.values() for quest in chapter.quests 
+            found = next((
+                (chapter_key, quest) for chapter_key, chapter in chapters.items() for quest in chapter.quests 
                 if quest.id.startswith(args.id)
             ), None)
             
-            if found_quest:
+            if found:
+                chapter_key, found_quest = found
                 updated_quest = edit_quest_position(found_quest, args.x, args.y)
-                # NOTE: You must add file saving logic here for persistent edits.
+                _store_edit(book, chapter_key, edit_quest_in_chapter(chapters[chapter_key], found_quest.id, updated_quest))
                 print(f"✅ Quest '{found_quest.id}' position updated to ({updated_quest.x}, {updated_quest.y}) (Unsaved).")
             else:
                 print(f"Error: Quest with ID starting with '{args.id}' not found.")
+                sys.exit(1)
         
         else:
             print("Error: Invalid or incomplete edit command.")
+            sys.exit(1)
+
+    elif args.command == 'transform':
+        chapter_key = args.chapter
+        if chapter_key not in chapters:
+            print(f"Error: Chapter '{chapter_key}' not found.")
+            sys.exit(1)
+
+        chapter = chapters[chapter_key]
+        updated_chapter = transform_quest_positions(
+            chapter,
+            quest_ids=args.ids,
+            bbox=tuple(args.bbox) if args.bbox else None,
+            translate=tuple(args.translate),
+            scale=tuple(args.scale),
+            rotate=args.rotate,
+            snap=args.snap,
+            origin=tuple(args.origin) if args.origin else None,
+        )
+        moved = _moved_count(chapter, updated_chapter)
+        _store_edit(book, chapter_key, updated_chapter)
+        print(f"✅ Transformed {moved} quest(s) in chapter '{chapter_key}' (Unsaved).")
+
+    elif args.command == 'autolayout':
+        chapter_key = args.chapter
+        if chapter_key not in chapters:
+            print(f"Error: Chapter '{chapter_key}' not found.")
+            sys.exit(1)
+
+        chapter = chapters[chapter_key]
+        pinned = set(args.pin or [])
+        if args.pin_placed:
+            pinned.update(q.id for q in chapter.quests if (q.x, q.y) != (0.0, 0.0))
+
+        updated_chapter = autolayout_chapter(chapter, pinned=pinned, spacing=tuple(args.spacing), sweeps=args.sweeps)
+        moved = sum(1 for old, new in zip(chapter.quests, updated_chapter.quests) if old is not new)
+        _store_edit(book, chapter_key, updated_chapter)
+        print(f"✅ Laid out {moved} quest(s) in chapter '{chapter_key}' ({len(pinned)} pinned) (Unsaved).")
+
+    elif args.command == 'export':
+        if args.format == 'sqlite':
+            stats = export_to_sqlite(chapters, args.path, _lang_data(), locale=_locale())
+            print(
+                f"✅ Exported to '{args.path}': {stats['written']} chapter(s) written, "
+                f"{stats['skipped']} unchanged, {stats['removed']} removed."
+            )
+        elif args.format == 'jsonl':
+            count = export_jsonl(chapters, args.path, _lang_data())
+            # Keep stdout clean when the records themselves go to stdout
+            print(f"✅ Exported {count} record(s) to '{args.path}'.", file=sys.stderr if args.path == '-' else sys.stdout)
+
+    elif args.command == 'import':
+        if args.format == 'jsonl':
+            try:
+                imported = import_jsonl(args.path, batch_size=args.batch_size)
+            except (OSError, ValueError) as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+            quest_count = sum(len(chapter.quests) for chapter in imported.values())
+            print(f"✅ Imported {quest_count} quest(s) in {len(imported)} chapter(s) from '{args.path}'.")
+            if not args.sqlite:
+                print("Validation only: nothing was written (use --sqlite DB to keep the imported book).")
+            else:
+                stats = export_to_sqlite(imported, args.sqlite)
+                print(f"✅ Wrote {stats['written']} chapter(s) to '{args.sqlite}'.")
+
+    elif args.command == 'diff':
+        try:
+            old_chapters = load_book_from_directory(args.old)
+            new_chapters = load_book_from_directory(args.new)
+        except FileNotFoundError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        report = diff_books(old_chapters, new_chapters)
+        if args.format == 'json':
+            print(json.dumps(report, indent=2, ensure_ascii=False))
+        else:
+            display_diff_report(report)
+
+    elif args.command == 'lint':
+        diagnostics = lint_book(chapters, _lang_data(), workers=args.workers)
+        if args.format == 'json':
+            print(json.dumps([d.model_dump() for d in diagnostics], indent=2, ensure_ascii=False))
+        elif args.format == 'ndjson':
+            for d in diagnostics:
+                print(d.model_dump_json())
+        else:
+            display_lint_report(diagnostics)
+        # Non-zero exit lets CI fail on errors
+        if any(d.severity == 'error' for d in diagnostics):
+            sys.exit(1)
+
+    elif args.command == 'lang':
+        if args.action == 'coverage':
+            if _session['lang'] is None:
+                print("Error: No lang data available for this quest book.")
+                sys.exit(1)
+            report = lang_coverage(chapters, _session['lang'], locales=args.locales)
+            if args.format == 'json':
+                print(json.dumps(report, indent=2, ensure_ascii=False))
+            else:
+                display_lang_coverage(report, show_keys=args.show_keys)
+            # Unreadable lang files fail the command rather than passing as untranslated
+            if 'error' in report or any('error' in stats for stats in report['locales'].values()):
+                sys.exit(1)
+
+    elif args.command == 'economy':
+        report = economy_report(chapters, items=args.items)
+        if args.format == 'json':
+            write_record(report)
+        else:
+            display_economy_report(report, top_items=None if args.items else args.top, breakdown=bool(args.items))
+
+    elif args.command == 'progression':
+        report = progression_report(chapters, target=args.target, lang=_session['lang'])
+        if args.format == 'json':
+            write_record(report)
+        else:
+            display_progression_report(report)
+        if args.target and not report['target']:
+            sys.exit(1)
+
+    elif args.command == 'chapter-graph':
+        report = ChapterGraph(chapters).report()
+        if args.format == 'json':
+            write_record(report)
+        else:
+            display_chapter_graph(report)
+
+    elif args.command == 'stats':
+        stats = book_stats(chapters)
+        if args.format == 'json':
+            write_record(stats)
+        else:
+            display_stats(stats)
+
+    elif args.command == 'migrate-items':
+        try:
+            mapping = load_item_mapping(args.mapping)
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot read item mapping '{args.mapping}': {e}")
+            sys.exit(1)
+        updated, counts = migrate_items(chapters, mapping)
+        for old_id, count in counts.items():
+            print(f"{old_id} -> {mapping[old_id]['id']}: {count} occurrence(s)")
+        print(f"✅ {sum(counts.values())} item occurrence(s) migrated in {len(updated)} chapter(s).")
+        if args.dry_run or not updated:
+            return
+        if book is not None:
+            # Script mode: leave saving to the script's 'save'
+            for chapter_key, chapter in updated.items():
+                _store_edit(book, chapter_key, chapter)
+            return
+        if _session['chapters_dir'] is None:
+            print("Error: Migrating needs a book loaded from SNBT files.")
+            sys.exit(1)
+        written = save_changed_chapters({**chapters, **updated}, chapters, _session['chapters_dir'], _session['raw'])
+        print(f"✅ Saved {len(written)} chapter file(s).")
+
+    elif args.command == 'ids':
+        allocator = IdAllocator.from_chapters(chapters)
+        if args.action == 'new':
+            for object_id in allocator.allocate_many(args.count):
+                print(object_id)
+        elif args.action == 'check':
+            unavailable = 0
+            for object_id in args.ids:
+                if not is_valid_id(object_id):
+                    status = "invalid (expected 16 hex digits, not all zero)"
+                elif object_id in allocator:
+                    status = "taken"
+                else:
+                    status = "available"
+                unavailable += status != "available"
+                print(f"{object_id}: {status}")
+            if unavailable:
+                sys.exit(1)
+
+    elif args.command == 'save':
+        print("Nothing to save: 'save' writes the edits of a 'run' script.")
+
+    elif args.command == 'run':
+        if not run_script(args.script, chapters):
+            sys.exit(1)
+
+    elif args.command == 'batch':
+        roots = expand_roots(args.roots)
+        if not roots:
+            print("Error: No modpack roots matched.")
+            sys.exit(1)
+        report = batch_analyze(roots, workers=args.workers)
+        if args.format == 'json':
+            print(json.dumps(report, indent=2, ensure_ascii=False))
+        else:
+            display_batch_report(report, top_items=args.top)
+
+
+# --- 4. Script Mode ---
+
+# Commands a script may not contain
+SCRIPT_EXCLUDED_COMMANDS = {None, 'run'}
+
+def _parse_script(lines, source: str) -> Optional[List[Tuple[int, argparse.Namespace]]]:
+    """Parse every script line up front, so a typo is reported before anything runs."""
+    parser = build_arg_parser()
+    commands = []
+    for line_number, line in enumerate(lines, 1):
+        try:
+            tokens = shlex.split(line, comments=True)
+        except ValueError as e:
+            print(f"Error: {source}:{line_number}: {e}")
+            return None
+        if not tokens:
+            continue
+        try:
+            command_args = parser.parse_args(tokens)
+        except SystemExit:
+            print(f"Error: {source}:{line_number}: invalid command: {line.strip()}")
+            return None
+        if command_args.command in SCRIPT_EXCLUDED_COMMANDS:
+            print(f"Error: {source}:{line_number}: '{line.strip()}' cannot be used in a script.")
+            return None
+        commands.append((line_number, command_args))
+    return commands
+
+def run_script(source: str, chapters: Dict[str, Chapter]) -> bool:
+    """
+    Run a script of CLI commands (one per line, '#' comments allowed) against one loaded
+    book. Edits accumulate in memory; if the script contains 'save', the changed chapters
+    are validated and written once, after the last command. Returns False on any failure.
+    """
+    try:
+        if source == '-':
+            commands = _parse_script(sys.stdin, '<stdin>')
+        else:
+            with open(source, "r", encoding="utf-8") as f:
+                commands = _parse_script(f, source)
+    except OSError as e:
+        print(f"Error: Cannot read script '{source}': {e}")
+        return False
+    if commands is None:
+        return False
+
+    # Edits go into a working copy; `chapters` stays the book as loaded
+    book = dict(chapters)
+    save_requested = False
+    failed = []
+    for line_number, command_args in commands:
+        if command_args.command == 'save':
+            save_requested = True
+            continue
+        try:
+            argparse_cli_main(command_args, book, book)
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                failed.append(line_number)
+
+    changed = changed_chapter_keys(book, chapters)
+    print(f"✅ Ran {len(commands)} command(s); {len(changed)} chapter(s) changed.")
+    if failed:
+        print(f"Error: Command(s) on line(s) {', '.join(map(str, failed))} failed.")
+    if not save_requested or not changed:
+        return not failed
+    if failed:
+        print("Error: Not saving because of the failed command(s).")
+        return False
+    if _session['chapters_dir'] is None:
+        print("Error: 'save' needs a book loaded from SNBT files.")
+        return False
+
+    # Re-validate only what the script edited before anything is written
+    validator = IncrementalValidator(chapters)
+    errors = [d for key in changed for d in validator.apply(key, book[key]) if d.severity == 'error']
+    if errors:
+        display_lint_report(errors)
+        print("Error: Not saving because the edits are invalid.")
+        return False
+
+    written = save_changed_chapters(book, chapters, _session['chapters_dir'], _session['raw'])
+    print(f"✅ Saved {len(written)} chapter file(s).")
+    return True
 
 
 # --- Main Entry Point (Called by console scripts) ---
 
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the argparse parser for all single-command modes."""
+    parser = argparse.ArgumentParser(description="FTB Quest Viewer Command-Line Interface. Run without arguments for interactive mode.")
+    parser.add_argument('--locale', type=str, default=None, help=f'Lang locale for titles (default: {DEFAULT_LOCALE}, which is also the fallback).')
+    parser.add_argument('--db', type=str, default=None, metavar='PATH', help='Load the quest book from an exported SQLite database instead of SNBT files.')
+    parser.add_argument('--root', type=str, default=None, metavar='PATH', help='Modpack root, chapters directory or launcher instances folder to search (never prompts; fails unless exactly one book is found).')
+    parser.add_argument('--no-color', action='store_true', help='Plain output without ANSI colours (also set by the NO_COLOR environment variable).')
+    subparsers = parser.add_subparsers(dest='command')
+
+    # --- 'view' command setup ---
+    view_parser = subparsers.add_parser('view', help='View quest data (e.g., view chapters or view quest <ID>).')
+    view_subparsers = view_parser.add_subparsers(dest='entity', required=True)
+    chapters_view_parser = view_subparsers.add_parser('chapters', help='View all chapter titles.')
+    chapters_view_parser.add_argument('--format', choices=['text', *JSON_FORMATS], default='text', help='Output format (json: one array, ndjson: one chapter per line).')
+    quest_parser = view_subparsers.add_parser('quest', help='View details for a specific quest ID (partial IDs allowed).')
+    quest_parser.add_argument('id', type=str, help='The full or partial ID of the quest to view.')
+    quest_parser.add_argument('--format', choices=['text', *JSON_FORMATS], default='text', help='Output format.')
+
+    # --- 'edit' command setup (simplified) ---
+    edit_parser = subparsers.add_parser('edit', help='Edit quest data (edits are NOT saved by this example code).')
+    edit_subparsers = edit_parser.add_subparsers(dest='entity', required=True)
+
+    # Edit Chapter: title
+    chapter_edit_parser = edit_subparsers.add_parser('chapter', help='Edit a chapter property.')
+    chapter_edit_parser.add_argument('id', type=str, help='The key of the chapter to edit (e.g., "chapter_1").')
+    chapter_edit_parser.add_argument('field', choices=['title'], help='The field to edit.')
+    chapter_edit_parser.add_argument('value', type=str, help='The new value for the field.')
+
+    # Edit Quest: position
+    quest_edit_parser = edit_subparsers.add_parser('quest', help='Edit a quest property.')
+    quest_edit_parser.add_argument('id', type=str, help='The full or partial ID of the quest to edit.')
+    quest_edit_parser.add_argument('field', choices=['position'], help='The field to edit.')
+    quest_edit_parser.add_argument('x', type=float, help='The new X coordinate.')
+    quest_edit_parser.add_argument('y', type=float, help='The new Y coordinate.')
+
+    # --- 'transform' command setup ---
+    transform_parser = subparsers.add_parser('transform', help='Bulk translate/scale/rotate/snap quest positions in a chapter.')
+    transform_parser.add_argument('chapter', type=str, help='The key of the chapter to transform.')
+    transform_parser.add_argument('--ids', nargs='+', metavar='ID', help='Only transform these quest IDs.')
+    transform_parser.add_argument('--bbox', nargs=4, type=float, metavar=('X1', 'Y1', 'X2', 'Y2'), help='Only transform quests inside this box.')
+    transform_parser.add_argument('--translate', nargs=2, type=float, default=[0.0, 0.0], metavar=('DX', 'DY'), help='Offset to add.')
+    transform_parser.add_argument('--scale', nargs=2, type=float, default=[1.0, 1.0], metavar=('SX', 'SY'), help='Scale factors.')
+    transform_parser.add_argument('--rotate', type=float, default=0.0, metavar='DEG', help='Rotation in degrees (counter-clockwise).')
+    transform_parser.add_argument('--snap', type=float, default=None, metavar='GRID', help='Snap resulting positions to this grid size.')
+    transform_parser.add_argument('--origin', nargs=2, type=float, metavar=('X', 'Y'), help='Pivot for scale/rotate (default: selection centre).')
+
+    # --- 'autolayout' command setup ---
+    layout_parser = subparsers.add_parser('autolayout', help='Lay out a chapter from its quest dependencies.')
+    layout_parser.add_argument('chapter', type=str, help='The key of the chapter to lay out.')
+    layout_parser.add_argument('--pin', nargs='+', metavar='ID', help='Quest IDs that must keep their position.')
+    layout_parser.add_argument('--pin-placed', action='store_true', help='Keep every quest that is not at (0, 0) in place.')
+    layout_parser.add_argument('--spacing', nargs=2, type=float, default=[1.5, 1.5], metavar=('X', 'Y'), help='Grid spacing between quests.')
+    layout_parser.add_argument('--sweeps', type=int, default=4, help='Crossing-reduction sweeps.')
+
+    # --- 'export' command setup ---
+    export_parser = subparsers.add_parser('export', help='Export the quest book to another format.')
+    export_subparsers = export_parser.add_subparsers(dest='format', required=True)
+    sqlite_export_parser = export_subparsers.add_parser('sqlite', help='Write the book to an indexed SQLite database.')
+    sqlite_export_parser.add_argument('path', type=str, help='Path of the SQLite database file.')
+    jsonl_export_parser = export_subparsers.add_parser('jsonl', help='Stream one JSON record per chapter header and quest.')
+    jsonl_export_parser.add_argument('path', type=str, help="Output file, or '-' for stdout.")
+
+    # --- 'import' command setup ---
+    import_parser = subparsers.add_parser('import', help='Import and validate a quest book from another format.')
+    import_subparsers = import_parser.add_subparsers(dest='format', required=True)
+    jsonl_import_parser = import_subparsers.add_parser('jsonl', help='Read and validate records written by "export jsonl" (only validates unless --sqlite is given).')
+    jsonl_import_parser.add_argument('path', type=str, help="Input file, or '-' for stdin.")
+    jsonl_import_parser.add_argument('--batch-size', type=int, default=1000, help='Quests validated per batch.')
+    jsonl_import_parser.add_argument('--sqlite', type=str, metavar='DB', help='Write the imported book to this SQLite database.')
+
+    # --- 'diff' command setup ---
+    diff_parser = subparsers.add_parser('diff', help='Changelog of quests/tasks/rewards between two modpack versions.')
+    diff_parser.add_argument('old', type=str, help='Old modpack root or chapters directory.')
+    diff_parser.add_argument('new', type=str, help='New modpack root or chapters directory.')
+    diff_parser.add_argument('--format', choices=['text', 'json'], default='text', help='Report format.')
+
+    # --- 'lint' command setup ---
+    lint_parser = subparsers.add_parser('lint', help='Check the whole book for broken IDs, dependencies and lang keys.')
+    lint_parser.add_argument('--format', choices=['text', 'json', 'ndjson'], default='text', help='Diagnostics format.')
+    lint_parser.add_argument('--workers', type=int, default=1, help='Worker processes for per-chapter checks (default 1 = inline, 0 = one per CPU).')
+
+    # --- 'lang' command setup ---
+    lang_parser = subparsers.add_parser('lang', help='Translation tools.')
+    lang_subparsers = lang_parser.add_subparsers(dest='action', required=True)
+    coverage_parser = lang_subparsers.add_parser('coverage', help='Missing, orphaned and untranslated keys per locale.')
+    coverage_parser.add_argument('--locales', nargs='+', metavar='LOCALE', help='Only report these locales (default: all).')
+    coverage_parser.add_argument('--format', choices=['text', 'json'], default='text', help='Report format.')
+    coverage_parser.add_argument('--show-keys', action='store_true', help='List every missing/orphaned/identical key.')
+
+    # --- 'economy' command setup ---
+    economy_parser = subparsers.add_parser('economy', help='Reward totals by item, type, chapter and group, against task requirements.')
+    economy_parser.add_argument('--item', dest='items', action='append', metavar='ID', help='Only report this item, with its per-chapter and per-group breakdown (repeatable).')
+    economy_parser.add_argument('--top', type=int, default=20, help='Items to list (ignored with --item).')
+    economy_parser.add_argument('--format', choices=['text', 'json'], default='text', help='Report format.')
+
+    # --- 'progression' command setup ---
+    progression_parser = subparsers.add_parser('progression', help='Quest depths, per-chapter depth histograms and the critical path to a quest.')
+    progression_parser.add_argument('--target', type=str, metavar='ID', help='Show the longest prerequisite chain to this quest (partial IDs allowed).')
+    progression_parser.add_argument('--format', choices=['text', 'json'], default='text', help='Report format.')
+
+    # --- 'chapter-graph' command setup ---
+    graph_parser = subparsers.add_parser('chapter-graph', help='Which chapters gate which, from cross-chapter quest dependencies.')
+    graph_parser.add_argument('--format', choices=['text', 'json'], default='text', help='Report format.')
+
+    # --- 'stats' command setup ---
+    stats_parser = subparsers.add_parser('stats', help='Quest, task and reward counts, hidden flags, dependency fan-in/out and extents.')
+    stats_parser.add_argument('--format', choices=['text', 'json'], default='text', help='Report format.')
+
+    # --- 'migrate-items' command setup ---
+    migrate_parser = subparsers.add_parser('migrate-items', help='Rename item IDs (and components) in every task, reward and chapter icon.')
+    migrate_parser.add_argument('mapping', type=str, help='JSON object of old item ID -> new ID, or -> {"id": ..., "components": ...}.')
+    migrate_parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing files.')
+
+    # --- 'ids' command setup ---
+    ids_parser = subparsers.add_parser('ids', help='Generate or check FTB object IDs that are unique across the book.')
+    ids_subparsers = ids_parser.add_subparsers(dest='action', required=True)
+    ids_new_parser = ids_subparsers.add_parser('new', help='Print new, unused IDs.')
+    ids_new_parser.add_argument('--count', type=int, default=1, help='Number of IDs to generate.')
+    ids_check_parser = ids_subparsers.add_parser('check', help='Report whether IDs are valid and unused (exit status 1 if not).')
+    ids_check_parser.add_argument('ids', nargs='+', metavar='ID', help='IDs to check.')
+
+    # --- 'save' command setup ---
+    subparsers.add_parser('save', help="Write the edited chapters back to their SNBT files (inside a 'run' script).")
+
+    # --- 'run' command setup ---
+    run_parser = subparsers.add_parser('run', help='Run a script of view/edit/save commands against one loaded book.')
+    run_parser.add_argument('script', type=str, help="Script file with one command per line, or '-' for stdin.")
+
+    # --- 'batch' command setup ---
+    batch_parser = subparsers.add_parser('batch', help='Analyse many modpack instances and aggregate one report.')
+    batch_parser.add_argument('roots', nargs='+', metavar='ROOT', help='Modpack roots or chapters directories (glob patterns allowed).')
+    batch_parser.add_argument('--workers', type=int, default=None, help='Worker processes (1 = inline).')
+    batch_parser.add_argument('--format', choices=['text', 'json'], default='text', help='Report format.')
+    batch_parser.add_argument('--top', type=int, default=10, help='Most used items to list.')
+
+    return parser
+
+
 def main():
     """
     The package's primary entry point. 
-    Switches between interactive mode (no arguments) and argparse mode (with arguments).
+    Switches between interactive mode (no command) and argparse mode (with a command).
     """
-    # 1. Load data first
-    parsed_chapters = load_data_for_cli()
+    # 1. Parse arguments first so global options (e.g. --db) can steer loading
+    parser = build_arg_parser()
+    args = parser.parse_args()
+    if args.no_color:
+        set_color(False)
+
+    if args.command in STANDALONE_COMMANDS:
+        argparse_cli_main(args, {})
+        return
+
+    # 2. Load data
+    parsed_chapters = load_data_for_cli(db_path=args.db, locale=args.locale, root=args.root)
     if not parsed_chapters:
         sys.exit(1)
 
-    # 2. Determine mode
-    if len(sys.argv) == 1:
-        # No arguments: Run Interactive CLI
+    # 3. Determine mode
+    if args.command is None:
+        # No command: Run Interactive CLI
         interactive_cli_main(parsed_chapters)
     else:
-        # Arguments present: Setup and run Argparse CLI
-
-        parser = argparse.ArgumentParser(description="FTB Quest Viewer Command-Line Interface. Run without arguments for interactive mode.")
-        subparsers = parser.add_subparsers(dest='command', required=True)
-
-        # --- 'view' command setup ---
-        view_parser = subparsers.add_parser('view', help='View quest data (e.g., view chapters or view quest <ID>).')
-        view_subparsers = view_parser.add_subparsers(dest='entity', required=True)
-        view_subparsers.add_parser('chapters', help='View all chapter titles.')
-        quest_parser = view_subparsers.add_parser('quest', help='View details for a specific quest ID (partial IDs allowed).')
-        quest_parser.add_argument('id', type=str, help='The full or partial ID of the quest to view.')
-
-        # --- 'edit' command setup (simplified) ---
-        edit_parser = subparsers.add_parser('edit', help='Edit quest data (edits are NOT saved by this example code).')
-        edit_subparsers = edit_parser.add_subparsers(dest='entity', required=True)
-
-        # Edit Chapter: title
-        chapter_edit_parser = edit_subparsers.add_parser('chapter', help='Edit a chapter property.')
-        chapter_edit_parser.add_argument('id', type=str, help='The key of the chapter to edit (e.g., "chapter_1").')
-        chapter_edit_parser.add_argument('field', choices=['title'], help='The field to edit.')
-        chapter_edit_parser.add_argument('value', type=str, help='The new value for the field.')
-        
-        # Edit Quest: position
-        quest_edit_parser = edit_subparsers.add_parser('quest', help='Edit a quest property.')
-        quest_edit_parser.add_argument('id', type=str, help='The full or partial ID of the quest to edit.')
-        quest_edit_parser.add_argument('field', choices=['position'], help='The field to edit.')
-        quest_edit_parser.add_argument('x', type=float, help='The new X coordinate.')
-        quest_edit_parser.add_argument('y', type=float, help='The new Y coordinate.')
-
-        # 3. Run Argparse CLI
-        args = parser.parse_args()
+        # Command present: Run Argparse CLI
         argparse_cli_main(args, parsed_chapters)
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
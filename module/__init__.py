@@ -6,17 +6,66 @@ quest data from SNBT files.
 """
 
 # Data navigation and viewing functions
-from .view.display_chapters import display_chapters
-from .view.display_quests import display_quests, display_quest_details
+from .view.display_chapters import display_chapters, render_chapters
+from .view.display_quests import display_quests, display_quest_details, render_quests, render_quest_details
+from .view.render import Screen, write_screen, set_color, color_enabled, strip_ansi
+from .view.quest_pager import QuestPager
+from .view.display_diff import display_diff_report
+from .view.display_lint import display_lint_report
+from .view.display_lang_coverage import display_lang_coverage
+from .view.display_batch import display_batch_report
+from .view.display_economy import display_economy_report
+from .view.display_progression import display_progression_report
+from .view.display_chapter_graph import display_chapter_graph
+from .view.display_stats import display_stats
+from .view.json_output import JSON_FORMATS, chapter_records, quest_record, write_record, write_records
 from .view.display_task_reward import (
     display_task_reward_details as display_task_details,
-    display_task_reward_details as display_reward_details
+    display_task_reward_details as display_reward_details,
+    render_task_reward_details
 )
 from .controller.ftb_loader import (
                         find_chapters_directory, 
                         load_chapter_data, 
                         parse_chapters,
-                        load_language_data
+                        load_language_data,
+                        resolve_chapters_directory,
+                        load_book_from_directory
+                        )
+
+# Launcher instance discovery
+from .controller.instance_scanner import (
+                        launcher_instance_roots,
+                        scan_for_chapters,
+                        scan_instances,
+                        load_remembered_chapters_dir,
+                        remember_chapters_dir
+                        )
+
+# Tab completion indexes
+from .controller.completion import (
+                        PrefixIndex,
+                        QuestIndex,
+                        Completer,
+                        quest_detail_completions,
+                        CHAPTER_COMMANDS
+                        )
+
+# Saving functions
+from .controller.ftb_saver import (
+                        to_snbt_tag,
+                        chapter_to_snbt,
+                        save_chapter,
+                        changed_chapter_keys,
+                        save_changed_chapters
+                        )
+
+# Async loading functions
+from .controller.async_loader import (
+                        load_language_data_async,
+                        iter_chapters_async,
+                        iter_book_async,
+                        load_book_async
                         )
 
 # Data editing functions
@@ -50,6 +99,61 @@ from .controller.quest_edit import (
                          create_chapter
                          )
 
+# Bulk transform functions
+from .controller.quest_transform import transform_quest_positions, select_quests
+
+# Layout functions
+from .controller.quest_layout import assign_layers, compute_layout, autolayout_chapter
+
+# Localization
+from .controller.lang_store import LangStore, lang_key, DEFAULT_LOCALE
+from .controller.lang_coverage import required_lang_keys, lang_coverage
+
+# Analysis functions
+from .controller.quest_economy import component_amount, xp_amount, economy_report
+from .controller.quest_progression import compute_progression, critical_path, depth_histograms, progression_report
+from .controller.chapter_graph import ChapterGraph
+from .controller.quest_stats import HIDE_FLAGS, book_stats
+
+# Item migration
+from .controller.item_migrate import load_item_mapping, item_index, migrate_items
+
+# ID allocation
+from .controller.id_allocator import IdAllocator, book_ids, is_valid_id
+
+# Hashing functions
+from .controller.quest_hash import content_hash, component_hash, quest_hash, chapter_hash, fingerprint
+
+# Diff functions
+from .controller.quest_diff import diff_books
+
+# Lint functions
+from .controller.quest_lint import Diagnostic, lint_chapter, lint_book
+
+# Incremental validation functions
+from .controller.quest_validate import IncrementalValidator, validate_quest_subtree
+
+# Batch analysis functions
+from .controller.quest_batch import expand_roots, item_usage, analyze_book, analyze_instance, batch_analyze
+
+# SQLite backend functions
+from .controller.quest_sqlite import (
+                         export_to_sqlite,
+                         load_chapters_from_sqlite,
+                         load_language_from_sqlite,
+                         SqliteChapterMapping
+                         )
+
+# JSON Lines streaming functions
+from .controller.quest_jsonl import (
+                         iter_quest_records,
+                         write_jsonl,
+                         export_jsonl,
+                         iter_jsonl,
+                         iter_validated_quests,
+                         import_jsonl
+                         )
+
 # Model classes
 from .model.quest_models import Chapter, Quest, Task, Reward, Item
 
@@ -62,12 +166,66 @@ __all__ = [
     "display_task_reward_details",
     "display_task_details",
     "display_reward_details",
+    "display_diff_report",
+    "display_lint_report",
+    "display_lang_coverage",
+    "display_batch_report",
+    "display_economy_report",
+    "display_progression_report",
+    "display_chapter_graph",
+    "display_stats",
+    "JSON_FORMATS",
+    "chapter_records",
+    "quest_record",
+    "write_record",
+    "write_records",
+
+    # Rendering functions
+    "render_chapters",
+    "render_quests",
+    "render_quest_details",
+    "render_task_reward_details",
+    "Screen",
+    "write_screen",
+    "set_color",
+    "color_enabled",
+    "strip_ansi",
+    "QuestPager",
 
     # Loading functions
     "find_chapters_directory",
     "load_chapter_data",
     "parse_chapters",
     "load_language_data",
+    "resolve_chapters_directory",
+    "load_book_from_directory",
+
+    # Launcher instance discovery
+    "launcher_instance_roots",
+    "scan_for_chapters",
+    "scan_instances",
+    "load_remembered_chapters_dir",
+    "remember_chapters_dir",
+
+    # Tab completion indexes
+    "PrefixIndex",
+    "QuestIndex",
+    "Completer",
+    "quest_detail_completions",
+    "CHAPTER_COMMANDS",
+
+    # Saving functions
+    "to_snbt_tag",
+    "chapter_to_snbt",
+    "save_chapter",
+    "changed_chapter_keys",
+    "save_changed_chapters",
+
+    # Async loading functions
+    "load_language_data_async",
+    "iter_chapters_async",
+    "iter_book_async",
+    "load_book_async",
 
     # Model classes
     "Chapter",
@@ -100,4 +258,82 @@ __all__ = [
     "create_reward",
     "create_quest",
     "create_chapter",
+
+    # Bulk transform functions
+    "transform_quest_positions",
+    "select_quests",
+
+    # Layout functions
+    "assign_layers",
+    "compute_layout",
+    "autolayout_chapter",
+
+    # Localization
+    "LangStore",
+    "lang_key",
+    "DEFAULT_LOCALE",
+    "required_lang_keys",
+    "lang_coverage",
+
+    # Analysis functions
+    "component_amount",
+    "xp_amount",
+    "economy_report",
+    "compute_progression",
+    "critical_path",
+    "depth_histograms",
+    "progression_report",
+    "ChapterGraph",
+    "HIDE_FLAGS",
+    "book_stats",
+
+    # Item migration
+    "load_item_mapping",
+    "item_index",
+    "migrate_items",
+
+    # ID allocation
+    "IdAllocator",
+    "book_ids",
+    "is_valid_id",
+
+    # Hashing functions
+    "content_hash",
+    "component_hash",
+    "quest_hash",
+    "chapter_hash",
+    "fingerprint",
+
+    # Diff functions
+    "diff_books",
+
+    # Lint functions
+    "Diagnostic",
+    "lint_chapter",
+    "lint_book",
+
+    # Incremental validation functions
+    "IncrementalValidator",
+    "validate_quest_subtree",
+
+    # Batch analysis functions
+    "expand_roots",
+    "item_usage",
+    "analyze_book",
+    "analyze_instance",
+    "batch_analyze",
+
+    # SQLite backend functions
+    "export_to_sqlite",
+    "load_chapters_from_sqlite",
+    "load_language_from_sqlite",
+    "SqliteChapterMapping",
+
+    # JSON Lines streaming functions
+    "iter_quest_records",
+    "write_jsonl",
+    "export_jsonl",
+    "iter_jsonl",
+    "iter_validated_quests",
+    "import_jsonl",
 ]
@@ -0,0 +1,121 @@
+import asyncio
+import inspect
+import os
+import sys
+from contextlib import aclosing
+from concurrent.futures import Executor
+from typing import AsyncIterator, Awaitable, Dict, List, Optional, Tuple, Union
+
+import ftb_snbt_lib as fslib
+
+from ..model.quest_models import Chapter
+from .ftb_loader import SNBT_PARSE_LOCK, parse_chapter, load_language_data, resolve_chapters_directory
+
+# Upper bound on chapter files being read at the same time
+DEFAULT_MAX_OPEN_FILES = 16
+
+LangSource = Union[Dict[str, str], Awaitable[Dict[str, str]], None]
+
+
+def _list_chapter_files(chapters_dir_path: str) -> List[str]:
+    try:
+        return sorted(f for f in os.listdir(chapters_dir_path) if f.endswith(".snbt"))
+    except OSError as e:
+        print(f"Could not list chapters directory {chapters_dir_path}: {e}", file=sys.stderr)
+        return []
+
+
+def _read_text(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _parse_chapter_text(chapter_key: str, text: str, lang_data: Optional[Dict[str, str]]) -> Optional[Chapter]:
+    """
+    Executor job: SNBT parsing plus pydantic validation of one chapter file. Parses are
+    serialized within a process (see SNBT_PARSE_LOCK); validation runs unlocked.
+    """
+    try:
+        with SNBT_PARSE_LOCK:
+            chapter_dict = fslib.loads(text)
+    except Exception as e:
+        print(f"Failed to read chapter {chapter_key}: {e}", file=sys.stderr)
+        return None
+    return parse_chapter(chapter_key, chapter_dict, lang_data)
+
+
+async def load_language_data_async(chapters_dir_path: str) -> Dict[str, str]:
+    """Async counterpart of load_language_data (the file is read in a worker thread)."""
+    return await asyncio.to_thread(load_language_data, chapters_dir_path)
+
+
+async def iter_chapters_async(
+    chapters_dir_path: str,
+    lang_data: LangSource = None,
+    executor: Optional[Executor] = None,
+    max_open_files: int = DEFAULT_MAX_OPEN_FILES,
+) -> AsyncIterator[Tuple[str, Chapter]]:
+    """
+    Yield (chapter_key, Chapter) pairs in completion order, as each chapter is ready.
+
+    Files are read concurrently in worker threads; SNBT parsing and validation run in
+    `executor` (the loop's default thread pool if None). ftb_snbt_lib is not thread-safe,
+    so within one process chapters are parsed one at a time; pass a ProcessPoolExecutor
+    to parse on several cores. `lang_data` may be a dict or an awaitable resolving to one, so
+    the lang file can load while chapter files are being read.
+
+    Closing the iterator or cancelling the consuming task cancels all pending reads
+    and parses. Chapters that fail to load are reported and skipped.
+    """
+    loop = asyncio.get_running_loop()
+    filenames = await asyncio.to_thread(_list_chapter_files, chapters_dir_path)
+    semaphore = asyncio.Semaphore(max_open_files)
+    lang_future = asyncio.ensure_future(lang_data) if inspect.isawaitable(lang_data) else None
+
+    async def load_one(filename: str) -> Tuple[str, Optional[Chapter]]:
+        chapter_key = filename[:-len(".snbt")]
+        try:
+            async with semaphore:
+                text = await asyncio.to_thread(_read_text, os.path.join(chapters_dir_path, filename))
+        except OSError as e:
+            print(f"Failed to read chapter {chapter_key}: {e}", file=sys.stderr)
+            return chapter_key, None
+        lang = await lang_future if lang_future is not None else lang_data
+        return chapter_key, await loop.run_in_executor(executor, _parse_chapter_text, chapter_key, text, lang)
+
+    tasks = [asyncio.ensure_future(load_one(filename)) for filename in filenames]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            chapter_key, chapter = await next_done
+            if chapter is not None:
+                yield chapter_key, chapter
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        if lang_future is not None and not lang_future.done():
+            pending.append(lang_future)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def iter_book_async(path: str, executor: Optional[Executor] = None) -> AsyncIterator[Tuple[str, Chapter]]:
+    """
+    Stream the chapters under a chapters directory or modpack root, with quest titles
+    resolved from the lang file (which loads concurrently with the chapter files).
+    """
+    chapters_path = await asyncio.to_thread(resolve_chapters_directory, path)
+    if chapters_path is None:
+        print(f"No FTB Quests chapters found under: {path}", file=sys.stderr)
+        return
+    async with aclosing(iter_chapters_async(chapters_path, load_language_data_async(chapters_path), executor)) as stream:
+        async for item in stream:
+            yield item
+
+
+async def load_book_async(path: str, executor: Optional[Executor] = None) -> Dict[str, Chapter]:
+    """Async counterpart of load_book_from_directory. Chapters are returned sorted by key."""
+    chapters: Dict[str, Chapter] = {}
+    async with aclosing(iter_book_async(path, executor)) as stream:
+        async for chapter_key, chapter in stream:
+            chapters[chapter_key] = chapter
+    return dict(sorted(chapters.items()))
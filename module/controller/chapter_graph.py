@@ -0,0 +1,161 @@
+import heapq
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..model.quest_models import Chapter, Quest
+
+
+class ChapterGraph:
+    """
+    Chapter-level dependency graph: an edge A -> B means quests in chapter B depend on
+    quests in chapter A, weighted by the number of such quest dependencies.
+
+    Like IncrementalValidator, it keeps a book-wide index (quest -> chapter and
+    dependency -> dependent chapters), and apply() finds changed quests by object
+    identity. Recomputing after an edit therefore only touches the edges into and out of
+    the quests that were replaced. Every chapter defining a quest ID is counted, so a quest
+    moved from one chapter to another (applied in either order) keeps its dependents
+    linked; if an ID is defined twice, the chapter that defined it first keeps it.
+    """
+
+    def __init__(self, chapters: Dict[str, Chapter]):
+        self.chapters: Dict[str, Chapter] = {}
+        self.edges: Counter = Counter()
+        self._quest_chapter: Dict[str, str] = {}
+        self._owners: Dict[str, Counter] = {}
+        self._dependents: Dict[str, Counter] = {}
+        for chapter_key, chapter in chapters.items():
+            self.apply(chapter_key, chapter)
+
+    # --- Index maintenance ---
+
+    def _link(self, source: Optional[str], target: str, weight: int) -> None:
+        if source is not None and source != target:
+            self.edges[(source, target)] += weight
+            if self.edges[(source, target)] <= 0:
+                del self.edges[(source, target)]
+
+    def _set_owner(self, quest_id: str, chapter_key: Optional[str]) -> None:
+        """Move a quest ID to another chapter (None: no chapter), re-linking its dependents."""
+        previous = self._quest_chapter.get(quest_id)
+        if previous == chapter_key:
+            return
+        for dependent_key, count in self._dependents.get(quest_id, {}).items():
+            self._link(previous, dependent_key, -count)
+            self._link(chapter_key, dependent_key, count)
+        if chapter_key is None:
+            del self._quest_chapter[quest_id]
+        else:
+            self._quest_chapter[quest_id] = chapter_key
+
+    def _index(self, chapter_key: str, quest: Quest) -> None:
+        self._owners.setdefault(quest.id, Counter())[chapter_key] += 1
+        if quest.id not in self._quest_chapter:
+            self._set_owner(quest.id, chapter_key)
+        for dep in set(quest.dependencies) - {quest.id}:
+            self._dependents.setdefault(dep, Counter())[chapter_key] += 1
+            self._link(self._quest_chapter.get(dep), chapter_key, 1)
+
+    def _unindex(self, chapter_key: str, quest: Quest) -> None:
+        for dep in set(quest.dependencies) - {quest.id}:
+            dependents = self._dependents[dep]
+            dependents[chapter_key] -= 1
+            if dependents[chapter_key] <= 0:
+                del dependents[chapter_key]
+                if not dependents:
+                    del self._dependents[dep]
+            self._link(self._quest_chapter.get(dep), chapter_key, -1)
+        owners = self._owners[quest.id]
+        owners[chapter_key] -= 1
+        if owners[chapter_key] <= 0:
+            del owners[chapter_key]
+        if self._quest_chapter.get(quest.id) == chapter_key and chapter_key not in owners:
+            # The ID may still be defined elsewhere, e.g. while a quest moves between chapters
+            self._set_owner(quest.id, next(iter(owners), None))
+        if not owners:
+            del self._owners[quest.id]
+
+    def apply(self, chapter_key: str, new_chapter: Optional[Chapter]) -> None:
+        """Record an edited chapter (None removes it), updating only the edges of changed quests."""
+        old_chapter = self.chapters.pop(chapter_key, None)
+        old_quests = old_chapter.quests if old_chapter else []
+        new_quests = new_chapter.quests if new_chapter else []
+
+        old_ids = {id(q) for q in old_quests}
+        new_ids = {id(q) for q in new_quests}
+        for quest in old_quests:
+            if id(quest) not in new_ids:
+                self._unindex(chapter_key, quest)
+        for quest in new_quests:
+            if id(quest) not in old_ids:
+                self._index(chapter_key, quest)
+        if new_chapter is not None:
+            self.chapters[chapter_key] = new_chapter
+
+    # --- Analysis ---
+
+    def topological_order(self) -> Tuple[List[str], List[str]]:
+        """
+        Chapters ordered so that every chapter comes after the chapters it depends on,
+        breaking ties by the current (order_index, key) order.
+
+        Returns (order, cyclic): chapters caught in a cycle are appended to the order in
+        their current order and also listed in `cyclic`.
+        """
+        def _rank(key: str) -> Tuple[int, str]:
+            return (self.chapters[key].order_index, key)
+
+        indegree = dict.fromkeys(self.chapters, 0)
+        targets: Dict[str, List[str]] = {key: [] for key in self.chapters}
+        for (source, target) in self.edges:
+            if source in targets and target in indegree:
+                targets[source].append(target)
+                indegree[target] += 1
+
+        heap = [_rank(key) for key, count in indegree.items() if count == 0]
+        heapq.heapify(heap)
+        order: List[str] = []
+        while heap:
+            _, key = heapq.heappop(heap)
+            order.append(key)
+            for target in targets[key]:
+                indegree[target] -= 1
+                if indegree[target] == 0:
+                    heapq.heappush(heap, _rank(target))
+
+        placed = set(order)
+        cyclic = sorted((key for key in self.chapters if key not in placed), key=_rank)
+        return order + cyclic, cyclic
+
+    def report(self) -> Dict[str, Any]:
+        """
+        The graph plus a comparison with the chapters' current order.
+
+        'out_of_order' lists edges inside one group whose prerequisite chapter has a
+        higher order_index than the chapter that depends on it. Edges between groups are
+        listed in 'cross_group', since group order is not stored in the chapter files.
+        """
+        order, cyclic = self.topological_order()
+        edges = [
+            {'from': source, 'to': target, 'links': links}
+            for (source, target), links in sorted(self.edges.items(), key=lambda item: (-item[1], item[0]))
+        ]
+        out_of_order, cross_group = [], []
+        for edge in edges:
+            source, target = self.chapters.get(edge['from']), self.chapters.get(edge['to'])
+            if source is None or target is None:
+                continue
+            if source.group != target.group:
+                cross_group.append(edge)
+            elif source.order_index > target.order_index:
+                out_of_order.append(edge)
+        return {
+            'order': [
+                {'key': key, 'group': self.chapters[key].group, 'order_index': self.chapters[key].order_index}
+                for key in order
+            ],
+            'cyclic': cyclic,
+            'edges': edges,
+            'out_of_order': out_of_order,
+            'cross_group': cross_group,
+        }
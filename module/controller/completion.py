@@ -0,0 +1,83 @@
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional
+
+from ..model.quest_models import Chapter, Quest
+from .lang_store import LangStore
+
+# Commands offered at each interactive level
+CHAPTER_COMMANDS = ['exit']
+QUEST_LIST_COMMANDS = ['back', 'edit', 'exit', 'next', 'prev', 'page ', 'filter ']
+QUEST_DETAIL_COMMANDS = ['back', 'edit', 'exit']
+
+
+class PrefixIndex:
+    """
+    Case-insensitive prefix lookups over a fixed set of strings.
+
+    The strings are sorted once; each lookup is two binary searches plus the size of the
+    result, so completion stays instant with tens of thousands of entries.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        pairs = sorted({(word.lower(), word) for word in words if word})
+        self._keys = [key for key, _ in pairs]
+        self._words = [word for _, word in pairs]
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def complete(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Every string starting with `prefix` (ignoring case), in sorted order."""
+        prefix = prefix.lower()
+        lo = bisect_left(self._keys, prefix)
+        hi = bisect_left(self._keys, prefix + "\U0010ffff", lo)
+        if limit is not None:
+            hi = min(hi, lo + limit)
+        return self._words[lo:hi]
+
+
+class QuestIndex:
+    """Completion and lookup index for the quests of one chapter (IDs and titles)."""
+
+    def __init__(self, chapter: Chapter, lang: Optional[LangStore] = None):
+        self.chapter = chapter
+        titles = [lang.title_for(quest) if lang else quest.title for quest in chapter.quests]
+        self._by_name: Dict[str, int] = {}
+        for i, title in enumerate(titles):
+            if title:
+                self._by_name.setdefault(title.lower(), i)
+        # IDs win over titles that happen to look the same
+        self._by_name.update({quest.id.lower(): i for i, quest in enumerate(chapter.quests)})
+        self.completions = PrefixIndex([*(quest.id for quest in chapter.quests), *filter(None, titles), *QUEST_LIST_COMMANDS])
+
+    def find(self, text: str) -> Optional[int]:
+        """Index of the quest whose ID or title is `text` (ignoring case), if any."""
+        return self._by_name.get(text.strip().lower())
+
+
+def quest_detail_completions(quest: Quest) -> PrefixIndex:
+    """Completions inside a quest: 'task N', 'reward N' and the detail commands."""
+    return PrefixIndex([
+        *(f"task {i}" for i in range(len(quest.tasks))),
+        *(f"reward {i}" for i in range(len(quest.rewards))),
+        *QUEST_DETAIL_COMMANDS,
+    ])
+
+
+class Completer:
+    """
+    readline completer for whole input lines. The interactive loop switches the active
+    PrefixIndex as the user moves between levels.
+    """
+
+    def __init__(self):
+        self.index: Optional[PrefixIndex] = None
+        self._matches: List[str] = []
+
+    def set_index(self, index: Optional[PrefixIndex]) -> None:
+        self.index = index
+
+    def complete(self, text: str, state: int) -> Optional[str]:
+        if state == 0:
+            self._matches = self.index.complete(text) if self.index is not None else []
+        return self._matches[state] if state < len(self._matches) else None
@@ -1,25 +1,30 @@
 import os
 import sys
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, List, Optional
 from pydantic import ValidationError
 
 # Assuming your package structure means quest_models is available via relative import
 # NOTE: This line must be updated if Chapter is not in the same package root.
 from ..model.quest_models import Chapter 
+from .quest_hash import chapter_hash
 
 # Assuming ftb_snbt_lib is installed or available in the environment
 # If fslib is a global module, this import is correct.
 import ftb_snbt_lib as fslib 
 
+# ftb_snbt_lib keeps one module-level lexer, so two parses running at the same time in
+# one process corrupt each other. Every SNBT parse in this package holds this lock
+# (worker processes each have their own lexer and lock, so they still run in parallel).
+SNBT_PARSE_LOCK = threading.Lock()
+
 # Import lang file
-from .quest_config import LANG_DIR
+from .quest_config import LANG_DIR, FTB_QUESTS_REL_PATH
+from .instance_scanner import scan_for_chapters, scan_instances, load_remembered_chapters_dir, remember_chapters_dir
 
 
 # --- Path Discovery Logic (Integrated from previous steps) ---
 
-# The standard relative path from the modpack root to the chapters directory
-FTB_QUESTS_REL_PATH = os.path.join("config", "ftbquests", "quests", "chapters")
-
 def is_valid_chapters_dir(path: str) -> bool:
     """Checks if the given path is a readable directory containing SNBT files."""
     if not os.path.isdir(path):
@@ -33,53 +38,107 @@ def is_valid_chapters_dir(path: str) -> bool:
         return False
     return False
 
-def find_chapters_directory() -> str:
+def find_chapters_directory(root: Optional[str] = None) -> str:
     """
     Attempts to find the FTB Quests chapters directory using the desired multi-stage approach.
+
+    With `root` (a modpack root, chapters directory or launcher instances folder), only that
+    root is searched and the search never prompts. Otherwise CWD and the script location are
+    checked, then the directory remembered from an earlier run, then the instance folders of
+    common launchers. Results found by scanning or typed in by hand are remembered for later
+    runs; an explicit `root` is not.
+
+    Raises:
+        FileNotFoundError: `root` contains no book.
+        ValueError: `root` contains several books (they are listed on stderr).
     """
-    print("\n--- Starting Directory Discovery ---")
-
-    # Attempt 1: Check relative to the current working directory (CWD)
-    # This assumes the script is run from inside the modpack directory.
-    cwd_path = os.path.join(os.getcwd(), FTB_QUESTS_REL_PATH)
-    if is_valid_chapters_dir(cwd_path):
-        print(f"Found Quests: Using CWD path: {cwd_path}")
-        return cwd_path
-
-    # Attempt 2: Check relative to the script's location 
-    # This helps if the script is run via a symlink or launcher shortcut.
-    script_dir = os.path.abspath(os.path.dirname(sys.argv[0]))
-    script_relative_path = os.path.join(script_dir, FTB_QUESTS_REL_PATH)
-    if is_valid_chapters_dir(script_relative_path):
-        print(f"Found Quests: Using script-relative path: {script_relative_path}")
-        return script_relative_path
-        
-    print("Could not automatically detect FTB Quests config.")
+    print("\n--- Starting Directory Discovery ---", file=sys.stderr)
+    candidates = []
+
+    if root is not None:
+        root_path = resolve_chapters_directory(root)
+        candidates = [root_path] if root_path else scan_for_chapters(root)
+        if len(candidates) == 1:
+            print(f"Found Quests: Using --root path: {candidates[0]}", file=sys.stderr)
+            return candidates[0]
+        if not candidates:
+            raise FileNotFoundError(f"No FTB Quests chapters found under --root: {root}")
+        print("Several modpack instances were found:", file=sys.stderr)
+        for candidate in candidates:
+            print(f"  {candidate}", file=sys.stderr)
+        raise ValueError(f"--root {root} matches {len(candidates)} books; pass one of them instead.")
+    else:
+        # Attempt 1: Check relative to the current working directory (CWD)
+        # This assumes the script is run from inside the modpack directory.
+        cwd_path = os.path.join(os.getcwd(), FTB_QUESTS_REL_PATH)
+        if is_valid_chapters_dir(cwd_path):
+            print(f"Found Quests: Using CWD path: {cwd_path}", file=sys.stderr)
+            return cwd_path
+
+        # Attempt 2: Check relative to the script's location 
+        # This helps if the script is run via a symlink or launcher shortcut.
+        script_dir = os.path.abspath(os.path.dirname(sys.argv[0]))
+        script_relative_path = os.path.join(script_dir, FTB_QUESTS_REL_PATH)
+        if is_valid_chapters_dir(script_relative_path):
+            print(f"Found Quests: Using script-relative path: {script_relative_path}", file=sys.stderr)
+            return script_relative_path
+
+        # Attempt 3: The directory found by an earlier run
+        remembered_path = load_remembered_chapters_dir()
+        if remembered_path:
+            print(f"Found Quests: Using remembered path: {remembered_path}", file=sys.stderr)
+            return remembered_path
+
+        # Attempt 4: Scan the instance folders of common launchers
+        candidates = scan_instances()
+        if len(candidates) == 1:
+            print(f"Found Quests: Using launcher instance: {candidates[0]}", file=sys.stderr)
+            remember_chapters_dir(candidates[0])
+            return candidates[0]
+
+        print("Could not automatically detect FTB Quests config.", file=sys.stderr)
     
     # Fallback: User Input Loop
     while True:
-        print("\n--- Manual Directory Input ---")
-        print("Please provide the absolute path to your modpack's 'chapters' directory.")
-        print(f"Example target path: .../modpack_dir/{os.path.join('config', 'ftbquests', 'quests', 'chapters')}")
-        print("Type 'EXIT' to quit.")
+        print("\n--- Manual Directory Input ---", file=sys.stderr)
+        if candidates:
+            print("Several modpack instances were found:", file=sys.stderr)
+            for index, candidate in enumerate(candidates):
+                print(f"  [{index}] {candidate}", file=sys.stderr)
+            print("Enter a number to pick one, or an absolute path.", file=sys.stderr)
+        print("Please provide the absolute path to your modpack's 'chapters' directory.", file=sys.stderr)
+        print(f"Example target path: .../modpack_dir/{os.path.join('config', 'ftbquests', 'quests', 'chapters')}", file=sys.stderr)
+        print("Type 'EXIT' to quit.", file=sys.stderr)
         
         user_path = input("Enter Absolute Path: ").strip()
         
         if user_path.lower() == 'exit':
             sys.exit("Quitting program as requested.")
+
+        if user_path.isdigit() and int(user_path) < len(candidates):
+            user_path = candidates[int(user_path)]
         
         if is_valid_chapters_dir(user_path):
-            print(f"Success! Loading from: {user_path}")
+            print(f"Success! Loading from: {user_path}", file=sys.stderr)
+            remember_chapters_dir(user_path)
             return user_path
         else:
-            print(f"Directory invalid or not found. Path checked: {user_path}")
-            print("Ensure the path leads directly to the folder containing .snbt files.")
+            print(f"Directory invalid or not found. Path checked: {user_path}", file=sys.stderr)
+            print("Ensure the path leads directly to the folder containing .snbt files.", file=sys.stderr)
 
 # --- Load and Map Language File ---
-def load_language_data(chapters_dir_path: str) -> Dict[str, str]:
+def _report(message: str, problems: Optional[List[str]]) -> None:
+    """Collect a loader message into `problems` if given, otherwise print it to stderr."""
+    if problems is not None:
+        problems.append(message)
+    else:
+        print(message, file=sys.stderr)
+
+def load_language_data(chapters_dir_path: str, problems: Optional[List[str]] = None) -> Dict[str, str]:
     """
     Load and parse the language file (en_us.snbt) to get localized quest/task names.
     Returns a dictionary mapping localization keys (e.g., 'quest.ID.title') to strings.
+    Problems are appended to `problems` if given, otherwise printed to stderr.
     """
     # The chapters directory is: .../config/ftbquests/quests/chapters
     # The lang file is at:      .../config/ftbquests/quests/lang/en_us.snbt
@@ -89,15 +148,15 @@ def load_language_data(chapters_dir_path: str) -> Dict[str, str]:
     lang_file_path = os.path.normpath(lang_file_path)
 
     if not os.path.exists(lang_file_path):
-        print(f"Warning: Language file not found at expected path: {lang_file_path}. Quest titles may be missing.")
+        _report(f"Warning: Language file not found at expected path: {lang_file_path}. Quest titles may be missing.", problems)
         return {}
     
     raw_lang_data = {}
     try:
-        with open(lang_file_path, "r", encoding="utf-8") as f:
+        with open(lang_file_path, "r", encoding="utf-8") as f, SNBT_PARSE_LOCK:
             raw_lang_data = fslib.load(f)
     except Exception as e:
-        print(f"Error loading language file: {e}")
+        _report(f"Error loading language file: {e}", problems)
         return {}
 
     return raw_lang_data
@@ -105,64 +164,128 @@ def load_language_data(chapters_dir_path: str) -> Dict[str, str]:
 
 # --- Modified Loading and Parsing Logic ---
 
-def load_chapter_data(chapters_dir_path: str) -> Dict[str, Any]:
+def _with_lang_title(quest: Dict[str, Any], lang_data: Dict[str, str]) -> Dict[str, Any]:
+    """Return the quest dict with its localized title, copying only when there is one."""
+    # Localization key format: quest.<ID>.title
+    lang_key = f"quest.{quest.get('id')}.title"
+    if lang_key in lang_data:
+        return {**quest, 'title': lang_data[lang_key]}
+    return quest
+
+def load_chapter_data(chapters_dir_path: str, problems: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Load and parse FTB quest chapter data from SNBT files using the discovered path.
+    A file that cannot be read is skipped; problems are appended to `problems` if given,
+    otherwise printed to stderr.
     """
     raw_chapter_data = {}
     
     try:
         # List files in the discovered directory path
-        for chapter_file in os.listdir(chapters_dir_path):
-            if chapter_file.endswith(".snbt"):
-                # Construct the full path using os.path.join for safety
-                full_path = os.path.join(chapters_dir_path, chapter_file)
-                
-                # Open the file and pass the handle to fslib.load
-                with open(full_path, "r", encoding="utf-8") as f:
-                    raw_chapter_data[chapter_file] = fslib.load(f)
-
+        chapter_files = [f for f in os.listdir(chapters_dir_path) if f.endswith(".snbt")]
     except PermissionError:
-        print(f"Permission denied accessing directory: {chapters_dir_path}")
+        _report(f"Permission denied accessing directory: {chapters_dir_path}", problems)
+        return raw_chapter_data
     except FileNotFoundError:
-        print(f"Directory not found: {chapters_dir_path}")
+        _report(f"Directory not found: {chapters_dir_path}", problems)
+        return raw_chapter_data
     except Exception as e:
-        print(f"Unexpected error during file loading: {e}")
+        _report(f"Unexpected error during file loading: {e}", problems)
+        return raw_chapter_data
+
+    for chapter_file in chapter_files:
+        # Construct the full path using os.path.join for safety
+        full_path = os.path.join(chapters_dir_path, chapter_file)
+        try:
+            # Open the file and pass the handle to fslib.load
+            with open(full_path, "r", encoding="utf-8") as f, SNBT_PARSE_LOCK:
+                raw_chapter_data[chapter_file] = fslib.load(f)
+        except Exception as e:
+            _report(f"Failed to read chapter {chapter_file.replace('.snbt', '')}: {e}", problems)
 
     return raw_chapter_data
 
-def parse_chapters(raw_chapter_data: Dict[str, Any], lang_data: Dict[str, str]) -> Dict[str, Chapter]:
-    """Parse raw chapter data into Chapter objects (Pydantic mounting)."""
+def parse_chapter(
+    chapter_key: str,
+    chapter_dict: Dict[str, Any],
+    lang_data: Optional[Dict[str, str]] = None,
+    problems: Optional[List[str]] = None,
+) -> Optional[Chapter]:
+    """
+    Parse and fingerprint one raw chapter dict. Returns None if the chapter does not
+    validate; the error is appended to `problems` if given, otherwise printed to stderr.
+    """
+    # Quest Titles Injection from Language File (on shallow copies)
+    if lang_data and 'quests' in chapter_dict:
+        chapter_dict = {**chapter_dict, 'quests': [_with_lang_title(quest, lang_data) for quest in chapter_dict['quests']]}
+
+    try:
+        chapter_object = Chapter.model_validate(chapter_dict)
+        # Compute the content fingerprints once, while the data is hot
+        chapter_hash(chapter_object)
+        return chapter_object
+    except ValidationError as e:
+        # Catch specific Pydantic errors for better debugging
+        if problems is not None:
+            problems.append(f"Failed to mount chapter {chapter_key} due to Validation Error.\n{e}")
+        else:
+            print(f"Failed to mount chapter {chapter_key} due to Validation Error.", file=sys.stderr)
+            print(e, file=sys.stderr)
+    except Exception as e:
+        _report(f"Failed to mount chapter {chapter_key}: {e}", problems)
+    return None
+
+def parse_chapters(
+    raw_chapter_data: Dict[str, Any],
+    lang_data: Optional[Dict[str, str]] = None,
+    problems: Optional[List[str]] = None,
+) -> Dict[str, Chapter]:
+    """
+    Parse raw chapter data into Chapter objects (Pydantic mounting).
+
+    If lang_data is given, quest titles are resolved into the models; the raw dicts are
+    never modified. Without it, titles are left as stored in the SNBT files and can be
+    resolved at display time through a LangStore. Chapters that fail to validate are
+    skipped and reported as in parse_chapter.
+    """
     parsed_chapters = {}
 
     for chapter_filename, chapter_dict in raw_chapter_data.items():
         # Use the filename (minus extension) as the clean key
         chapter_key = chapter_filename.replace(".snbt", "")
-
-        # Quest Titles Injection from Language File
-        if 'quests' in chapter_dict:
-            for quest in chapter_dict['quests']:
-                quest_id = quest.get('id')
-                if quest_id:
-                    # Localization key format: quest.<ID>.title
-                    lang_key = f"quest.{quest_id}.title"
-                    if lang_key in lang_data:
-                        # Inject the title into the raw dictionary for Pydantic to pick up
-                        quest['title'] = lang_data[lang_key]
-
-        try:
-            chapter_object = Chapter.model_validate(chapter_dict)
+        chapter_object = parse_chapter(chapter_key, chapter_dict, lang_data, problems)
+        if chapter_object is not None:
             parsed_chapters[chapter_key] = chapter_object
-            # print(f"Successfully mounted chapter: {chapter_key}") # Commented for cleaner output
-        except ValidationError as e:
-            # Catch specific Pydantic errors for better debugging
-            print(f"Failed to mount chapter {chapter_key} due to Validation Error.")
-            print(e)
-        except Exception as e:
-            print(f"Failed to mount chapter {chapter_key}: {e}")
 
     return parsed_chapters
 
+def resolve_chapters_directory(path: str) -> Optional[str]:
+    """
+    Accept either a chapters directory or a modpack root and return the chapters directory,
+    or None if neither layout is found. Never prompts.
+    """
+    if is_valid_chapters_dir(path):
+        return path
+    nested_path = os.path.join(path, FTB_QUESTS_REL_PATH)
+    if is_valid_chapters_dir(nested_path):
+        return nested_path
+    return None
+
+def load_book_from_directory(path: str) -> Dict[str, Chapter]:
+    """
+    Load, localize and parse every chapter under a chapters directory or modpack root.
+    Loader warnings go to stderr.
+
+    Raises:
+        FileNotFoundError: No chapters directory is found under `path`.
+    """
+    chapters_path = resolve_chapters_directory(path)
+    if chapters_path is None:
+        raise FileNotFoundError(f"No FTB Quests chapters found under: {path}")
+    raw_data = load_chapter_data(chapters_path)
+    lang_data = load_language_data(chapters_path)
+    return parse_chapters(raw_data, lang_data)
+
 def load_and_parse_all() -> Dict[str, Chapter]:
     """Orchestrates the path finding, loading, and parsing process."""
     
@@ -176,7 +299,7 @@ def load_and_parse_all() -> Dict[str, Chapter]:
     lang_data = load_language_data()
     
     if not raw_data:
-        print("No quest files were loaded. Exiting.")
+        print("No quest files were loaded. Exiting.", file=sys.stderr)
         return {}
         
     # Step 4: Parse and mount the data into Pydantic objects
@@ -0,0 +1,109 @@
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+import ftb_snbt_lib as fslib
+
+from ..model.quest_models import Chapter
+from .quest_hash import chapter_hash
+
+
+# Compound keys ftb_snbt_lib reads unquoted; it lexes a leading 'true'/'false' as a boolean
+_BARE_KEY = re.compile(r'[a-zA-Z0-9._+-]+')
+
+
+# Keys whose model value is the complete SNBT value (free-form dicts such as item
+# components), so they replace the raw value instead of being merged into it
+EXACT_KEYS = {'components'}
+
+
+def _snbt_key(key: str) -> str:
+    """Keep bare-name keys as they are; wrap anything else in a String tag so it is written quoted."""
+    if isinstance(key, fslib.String) or (_BARE_KEY.fullmatch(key) and not key.startswith(('true', 'false'))):
+        return key
+    return fslib.String(key)
+
+
+def _scalar_tag(value: Any, like: Any = None) -> fslib.Base:
+    """Convert a Python scalar, keeping the tag type of the original value where it fits."""
+    if isinstance(value, bool):
+        return fslib.Bool(value)
+    if isinstance(value, (int, float)):
+        if isinstance(like, fslib.Numeric):
+            if isinstance(like, fslib.NumericInteger) and isinstance(value, float) and not value.is_integer():
+                return fslib.Double(value)
+            return type(like)(value)
+        return fslib.Integer(value) if isinstance(value, int) else fslib.Double(value)
+    return fslib.String(str(value))
+
+
+def to_snbt_tag(value: Any, like: Any = None, exact: bool = False) -> fslib.Base:
+    """
+    Convert dumped model data into ftb_snbt_lib tags, merged onto `like` (the raw SNBT
+    value it came from). Keys the models do not know about are kept, and numbers keep
+    their original tag type (e.g. Long counts, Float sizes).
+
+    With `exact` (used for EXACT_KEYS), compounds contain only the keys in `value`;
+    `like` then only supplies tag types.
+    """
+    if isinstance(value, dict):
+        base = like if isinstance(like, dict) else {}
+        merged = fslib.Compound() if exact else fslib.Compound(base)
+        for key, item in value.items():
+            if item is None:
+                merged.pop(key, None)
+            else:
+                merged[_snbt_key(key)] = to_snbt_tag(item, base.get(key), exact or key in EXACT_KEYS)
+        return merged
+    if isinstance(value, list):
+        like_list = like if isinstance(like, list) else []
+        by_id = {entry.get('id'): entry for entry in like_list if isinstance(entry, dict) and 'id' in entry}
+        items = []
+        for i, item in enumerate(value):
+            if isinstance(item, dict) and 'id' in item:
+                item_like = by_id.get(item['id'])
+            else:
+                item_like = like_list[i] if i < len(like_list) else (like_list[0] if like_list else None)
+            items.append(to_snbt_tag(item, item_like, exact))
+        return fslib.List(items)
+    return _scalar_tag(value, like)
+
+
+def chapter_to_snbt(chapter: Chapter, raw_chapter: Optional[Dict[str, Any]] = None) -> str:
+    """Serialize a chapter to SNBT text, merged onto its raw SNBT data when given."""
+    return fslib.dumps(to_snbt_tag(chapter.model_dump(exclude_unset=True), raw_chapter)).rstrip("\n") + "\n"
+
+
+def save_chapter(chapter_key: str, chapter: Chapter, chapters_dir_path: str, raw_chapter: Optional[Dict[str, Any]] = None) -> str:
+    """Write one chapter to '<chapters_dir>/<chapter_key>.snbt' (atomically) and return the path."""
+    path = os.path.join(chapters_dir_path, f"{chapter_key}.snbt")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(chapter_to_snbt(chapter, raw_chapter))
+    os.replace(tmp_path, path)
+    return path
+
+
+def changed_chapter_keys(chapters: Dict[str, Chapter], original: Dict[str, Chapter]) -> List[str]:
+    """Keys of chapters that are new or whose content differs from `original` (by content hash)."""
+    return sorted(
+        key for key, chapter in chapters.items()
+        if key not in original or (chapter is not original[key] and chapter_hash(chapter) != chapter_hash(original[key]))
+    )
+
+
+def save_changed_chapters(
+    chapters: Dict[str, Chapter],
+    original: Dict[str, Chapter],
+    chapters_dir_path: str,
+    raw_chapter_data: Optional[Dict[str, Any]] = None,
+) -> List[str]:
+    """
+    Save only the chapters that changed since `original`, each merged onto its raw SNBT
+    data (keyed by filename, as returned by load_chapter_data). Returns the written paths.
+    """
+    raw_chapter_data = raw_chapter_data or {}
+    return [
+        save_chapter(key, chapters[key], chapters_dir_path, raw_chapter_data.get(f"{key}.snbt"))
+        for key in changed_chapter_keys(chapters, original)
+    ]
@@ -0,0 +1,91 @@
+import random
+import re
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from ..model.quest_models import Chapter
+
+# FTB Quests object IDs: 64-bit numbers written as 16 hex digits (0 means "no object")
+ID_PATTERN = re.compile(r'^[0-9A-Fa-f]{16}$')
+ID_BITS = 64
+
+
+def book_ids(chapters: Dict[str, Chapter]) -> Iterator[str]:
+    """Yield the ID of every chapter, quest, task and reward in the book."""
+    for chapter in chapters.values():
+        yield chapter.id
+        for quest in chapter.quests:
+            yield quest.id
+            for task in quest.tasks:
+                yield task.id
+            for reward in quest.rewards:
+                yield reward.id
+
+
+def is_valid_id(object_id: str) -> bool:
+    """True for a well-formed, non-zero 16-hex-digit FTB ID."""
+    return bool(ID_PATTERN.match(object_id)) and int(object_id, 16) != 0
+
+
+class IdAllocator:
+    """
+    Hands out FTB object IDs that are unique across the whole book.
+
+    All existing chapter, quest, task and reward IDs are kept in one set (compared
+    case-insensitively, as FTB parses them as hex), so checking or generating an ID is
+    O(1) and allocating n IDs is O(n). Register objects created elsewhere with add() or
+    add_chapter(); IDs handed out by allocate() are registered automatically.
+    """
+
+    def __init__(self, ids: Iterable[str] = (), rng: Optional[random.Random] = None):
+        self._used = {object_id.upper() for object_id in ids}
+        self._rng = rng or random.SystemRandom()
+
+    @classmethod
+    def from_chapters(cls, chapters: Dict[str, Chapter], rng: Optional[random.Random] = None) -> "IdAllocator":
+        return cls(book_ids(chapters), rng)
+
+    def __len__(self) -> int:
+        return len(self._used)
+
+    def __contains__(self, object_id: str) -> bool:
+        return object_id.upper() in self._used
+
+    # --- Registration ---
+
+    def add(self, object_id: str) -> None:
+        """Mark an ID as taken."""
+        self._used.add(object_id.upper())
+
+    def add_chapter(self, chapter: Chapter) -> None:
+        """Mark every ID in a chapter (and its quests, tasks and rewards) as taken."""
+        self._used.update(object_id.upper() for object_id in book_ids({chapter.id: chapter}))
+
+    def release(self, object_id: str) -> None:
+        """Make an ID available again (e.g. after deleting its object)."""
+        self._used.discard(object_id.upper())
+
+    # --- Allocation ---
+
+    def is_available(self, object_id: str) -> bool:
+        """True if `object_id` is a valid FTB ID that nothing in the book uses yet."""
+        return is_valid_id(object_id) and object_id.upper() not in self._used
+
+    def reserve(self, object_id: str) -> bool:
+        """Take a caller-chosen ID if it is available. Returns False if it is invalid or taken."""
+        if not self.is_available(object_id):
+            return False
+        self._used.add(object_id.upper())
+        return True
+
+    def allocate(self) -> str:
+        """Return a new random ID and mark it as taken."""
+        while True:
+            value = self._rng.getrandbits(ID_BITS)
+            object_id = f"{value:016X}"
+            if value and object_id not in self._used:
+                self._used.add(object_id)
+                return object_id
+
+    def allocate_many(self, count: int) -> List[str]:
+        """Return `count` new, distinct IDs (e.g. for generated chapters), all marked as taken."""
+        return [self.allocate() for _ in range(count)]
@@ -0,0 +1,138 @@
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional
+
+from .quest_config import FTB_QUESTS_REL_PATH, CONFIG_DIR_NAME, CONFIG_FILE_NAME, SCAN_MAX_DEPTH
+
+# Folders inside an instance that never contain another instance
+SKIP_DIRS = {
+    'mods', 'saves', 'resourcepacks', 'shaderpacks', 'logs', 'crash-reports', 'screenshots',
+    'libraries', 'assets', 'versions', 'backups', 'kubejs', 'defaultconfigs', 'local',
+}
+# Hidden folders that do hold the game directory (Prism/MultiMC use '<instance>/.minecraft')
+GAME_DIRS = {'.minecraft', 'minecraft'}
+
+
+def _has_snbt(path: str) -> bool:
+    try:
+        with os.scandir(path) as entries:
+            return any(entry.name.endswith(".snbt") for entry in entries)
+    except OSError:
+        return False
+
+
+# --- Launcher Locations ---
+
+def launcher_instance_roots() -> List[str]:
+    """The instances folders of Prism Launcher, MultiMC, CurseForge, ATLauncher and the FTB App that exist here."""
+    home = os.path.expanduser("~")
+    appdata = os.environ.get("APPDATA", os.path.join(home, "AppData", "Roaming"))
+    localappdata = os.environ.get("LOCALAPPDATA", os.path.join(home, "AppData", "Local"))
+    data_home = os.environ.get("XDG_DATA_HOME", os.path.join(home, ".local", "share"))
+    mac_support = os.path.join(home, "Library", "Application Support")
+
+    candidates = [
+        # Prism Launcher / PolyMC
+        os.path.join(data_home, "PrismLauncher", "instances"),
+        os.path.join(appdata, "PrismLauncher", "instances"),
+        os.path.join(mac_support, "PrismLauncher", "instances"),
+        os.path.join(data_home, "PolyMC", "instances"),
+        # MultiMC (portable installs usually live in the home directory)
+        os.path.join(home, "MultiMC", "instances"),
+        os.path.join(data_home, "multimc", "instances"),
+        # CurseForge
+        os.path.join(home, "curseforge", "minecraft", "Instances"),
+        os.path.join(home, "Documents", "curseforge", "minecraft", "Instances"),
+        # ATLauncher
+        os.path.join(home, "ATLauncher", "instances"),
+        os.path.join(data_home, "atlauncher", "instances"),
+        os.path.join(appdata, "ATLauncher", "instances"),
+        os.path.join(mac_support, "ATLauncher", "instances"),
+        # FTB App
+        os.path.join(home, ".ftba", "instances"),
+        os.path.join(localappdata, ".ftba", "instances"),
+        os.path.join(mac_support, ".ftba", "instances"),
+    ]
+    seen, roots = set(), []
+    for path in candidates:
+        path = os.path.normpath(path)
+        if path not in seen and os.path.isdir(path):
+            seen.add(path)
+            roots.append(path)
+    return roots
+
+
+# --- Scanning ---
+
+def scan_for_chapters(root: str, max_depth: int = SCAN_MAX_DEPTH) -> List[str]:
+    """
+    Breadth-first search below `root` (at most `max_depth` levels) for directories that
+    contain config/ftbquests/quests/chapters. Matched instances are not searched further.
+    """
+    found = []
+    level = [root]
+    for depth in range(max_depth + 1):
+        next_level = []
+        for directory in level:
+            chapters_dir = os.path.join(directory, FTB_QUESTS_REL_PATH)
+            if _has_snbt(chapters_dir):
+                found.append(os.path.normpath(chapters_dir))
+                continue
+            if depth == max_depth:
+                continue
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name in SKIP_DIRS or (name.startswith('.') and name not in GAME_DIRS):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            next_level.append(entry.path)
+            except OSError:
+                continue
+        level = next_level
+    return sorted(found)
+
+
+def scan_instances(roots: Optional[Iterable[str]] = None, max_depth: int = SCAN_MAX_DEPTH) -> List[str]:
+    """Scan several roots (all known launcher folders by default) in parallel threads."""
+    roots = list(roots) if roots is not None else launcher_instance_roots()
+    if not roots:
+        return []
+    with ThreadPoolExecutor(max_workers=min(len(roots), 8)) as pool:
+        results = pool.map(lambda root: scan_for_chapters(root, max_depth), roots)
+    return sorted({path for paths in results for path in paths})
+
+
+# --- Remembered Result ---
+
+def user_config_path() -> str:
+    """Path of the small JSON file that remembers the last discovered chapters directory."""
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA", os.path.expanduser("~"))
+    else:
+        base = os.environ.get("XDG_CONFIG_HOME", os.path.join(os.path.expanduser("~"), ".config"))
+    return os.path.join(base, CONFIG_DIR_NAME, CONFIG_FILE_NAME)
+
+
+def load_remembered_chapters_dir() -> Optional[str]:
+    """The remembered chapters directory, or None if nothing usable is stored."""
+    try:
+        with open(user_config_path(), "r", encoding="utf-8") as f:
+            path = json.load(f).get("chapters_dir")
+    except (OSError, ValueError, AttributeError):
+        return None
+    return path if isinstance(path, str) and _has_snbt(path) else None
+
+
+def remember_chapters_dir(path: str) -> None:
+    """Store the chapters directory so later runs skip discovery. Failures are reported, not raised."""
+    config_path = user_config_path()
+    try:
+        os.makedirs(os.path.dirname(config_path), exist_ok=True)
+        with open(config_path, "w", encoding="utf-8") as f:
+            json.dump({"chapters_dir": os.path.abspath(path)}, f, indent=2)
+    except OSError as e:
+        print(f"Warning: Could not remember chapters directory in {config_path}: {e}", file=sys.stderr)
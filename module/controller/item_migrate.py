@@ -0,0 +1,113 @@
+import json
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..model.quest_models import Chapter, Item
+
+# Where an item occurs: (chapter_key, quest position, 'task' | 'reward', component position).
+# Chapter icons are recorded as (chapter_key, -1, 'icon', -1).
+Occurrence = Tuple[str, int, str, int]
+
+
+def load_item_mapping(path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Read an item migration mapping from a JSON object file. Each value is either the new
+    item ID, or an object with 'id' and optionally 'components' (which replaces the
+    item's components; null removes them).
+
+    Raises:
+        OSError: The file cannot be read.
+        ValueError: The file is not valid JSON or not in the format above.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    if not isinstance(raw, dict):
+        raise ValueError("The mapping must be a JSON object of old item ID -> new item.")
+
+    mapping: Dict[str, Dict[str, Any]] = {}
+    for old_id, target in raw.items():
+        if isinstance(target, str):
+            target = {'id': target}
+        if not isinstance(target, dict) or not isinstance(target.get('id'), str):
+            raise ValueError(f"Invalid target for '{old_id}': expected an item ID or an object with an 'id'.")
+        if 'components' in target and not isinstance(target['components'], (dict, type(None))):
+            raise ValueError(f"Invalid components for '{old_id}': expected an object or null.")
+        mapping[old_id] = target
+    return mapping
+
+
+def item_index(chapters: Dict[str, Chapter]) -> Dict[str, List[Occurrence]]:
+    """Map every item ID to where it occurs: task and reward items and chapter icons."""
+    index: Dict[str, List[Occurrence]] = defaultdict(list)
+    for key, chapter in chapters.items():
+        if chapter.icon is not None:
+            index[chapter.icon.id].append((key, -1, 'icon', -1))
+        for quest_pos, quest in enumerate(chapter.quests):
+            for kind, components in (('task', quest.tasks), ('reward', quest.rewards)):
+                for pos, component in enumerate(components):
+                    if component.item is not None:
+                        index[component.item.id].append((key, quest_pos, kind, pos))
+    return dict(index)
+
+
+def _migrated(item: Item, target: Dict[str, Any]) -> Item:
+    update = {'id': target['id']}
+    if 'components' in target:
+        update['components'] = target['components']
+    return item.model_copy(update=update)
+
+
+def migrate_items(
+    chapters: Dict[str, Chapter],
+    mapping: Dict[str, Dict[str, Any]],
+    index: Optional[Dict[str, List[Occurrence]]] = None,
+) -> Tuple[Dict[str, Chapter], Dict[str, int]]:
+    """
+    Rewrite item IDs (and components) throughout the book according to `mapping`.
+
+    Only the occurrences listed in the item index are visited. Each affected quest is
+    copied once with all its replaced tasks/rewards, and each affected chapter once with
+    all its replaced quests, so untouched objects are shared with the input. Items are
+    migrated by their original ID, so chained mappings (a -> b, b -> c) are not applied twice.
+
+    Returns:
+        (updated chapters keyed like `chapters`, containing only the chapters that changed,
+         {old item ID: occurrences migrated} for every ID in the mapping)
+    """
+    index = index if index is not None else item_index(chapters)
+    # chapter -> quest position -> (kind, position) -> target
+    work: Dict[str, Dict[int, Dict[Tuple[str, int], Dict[str, Any]]]] = defaultdict(lambda: defaultdict(dict))
+    counts: Dict[str, int] = {}
+    for old_id, target in mapping.items():
+        occurrences = index.get(old_id, [])
+        counts[old_id] = len(occurrences)
+        for chapter_key, quest_pos, kind, pos in occurrences:
+            work[chapter_key][quest_pos][(kind, pos)] = target
+
+    updated: Dict[str, Chapter] = {}
+    for chapter_key, quest_changes in work.items():
+        chapter = chapters[chapter_key]
+        chapter_update: Dict[str, Any] = {}
+        icon_change = quest_changes.pop(-1, None)
+        if icon_change:
+            chapter_update['icon'] = _migrated(chapter.icon, icon_change[('icon', -1)])
+
+        if quest_changes:
+            quests = list(chapter.quests)
+            for quest_pos, changes in quest_changes.items():
+                quest = quests[quest_pos]
+                tasks, rewards = list(quest.tasks), list(quest.rewards)
+                for (kind, pos), target in changes.items():
+                    components = tasks if kind == 'task' else rewards
+                    component = components[pos]
+                    components[pos] = component.model_copy(update={'item': _migrated(component.item, target)})
+                quest_update = {}
+                if any(kind == 'task' for kind, _ in changes):
+                    quest_update['tasks'] = tasks
+                if any(kind == 'reward' for kind, _ in changes):
+                    quest_update['rewards'] = rewards
+                quests[quest_pos] = quest.model_copy(update=quest_update)
+            chapter_update['quests'] = quests
+
+        updated[chapter_key] = chapter.model_copy(update=chapter_update)
+    return updated, counts
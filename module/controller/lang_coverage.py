@@ -0,0 +1,108 @@
+from typing import Any, Dict, Iterable, Optional, Set
+
+from ..model.quest_models import Chapter
+from .lang_store import LangStore, lang_key
+
+# Lang key prefixes that refer to objects of the quest book
+OBJECT_KINDS = {'chapter', 'chapter_group', 'quest', 'task', 'reward'}
+
+
+def _object_of(key: str) -> Optional[str]:
+    """Return 'kind.id' for keys like 'quest.<ID>.title', or None for other keys."""
+    parts = key.split('.', 2)
+    if len(parts) == 3 and parts[0] in OBJECT_KINDS:
+        return f"{parts[0]}.{parts[1]}"
+    return None
+
+
+def book_objects(chapters: Dict[str, Chapter]) -> Dict[str, str]:
+    """Map every 'kind.id' in the book to the chapter key that owns it."""
+    owners: Dict[str, str] = {}
+    for chapter_key, chapter in chapters.items():
+        owners[f"chapter.{chapter.id}"] = chapter_key
+        if chapter.group:
+            owners.setdefault(f"chapter_group.{chapter.group}", chapter_key)
+        for quest in chapter.quests:
+            owners[f"quest.{quest.id}"] = chapter_key
+            for task in quest.tasks:
+                owners[f"task.{task.id}"] = chapter_key
+            for reward in quest.rewards:
+                owners[f"reward.{reward.id}"] = chapter_key
+    return owners
+
+
+def required_lang_keys(chapters: Dict[str, Chapter], reference_keys: Iterable[str] = ()) -> Dict[str, Set[str]]:
+    """
+    Build the set of lang keys each chapter needs.
+
+    Every chapter and quest needs a title. Any other key the reference locale defines for
+    an object of the book (subtitles, descriptions, task/reward titles) is needed too.
+    """
+    owners = book_objects(chapters)
+    needed: Dict[str, Set[str]] = {chapter_key: set() for chapter_key in chapters}
+    for chapter_key, chapter in chapters.items():
+        needed[chapter_key].add(lang_key('chapter', chapter.id))
+        needed[chapter_key].update(lang_key('quest', quest.id) for quest in chapter.quests)
+    for key in reference_keys:
+        obj = _object_of(key)
+        if obj in owners:
+            needed[owners[obj]].add(key)
+    return needed
+
+
+def _percent(part: int, whole: int) -> float:
+    return round(100.0 * part / whole, 1) if whole else 100.0
+
+
+def lang_coverage(
+    chapters: Dict[str, Chapter],
+    store: LangStore,
+    locales: Optional[Iterable[str]] = None,
+    reference_locale: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Compare every locale against the keys the book needs, using set algebra only.
+
+    For each locale the report lists missing keys, orphaned keys (keys for objects that
+    are not in the book) and keys whose text is identical to the reference locale,
+    plus overall and per-chapter coverage percentages. A locale whose file cannot be
+    read or parsed is reported as {'error': message} instead of as empty; if that is
+    the reference locale, the whole report is {'reference', 'error'}.
+    """
+    reference_locale = reference_locale or store.fallback_locale
+    locales = list(locales) if locales is not None else store.locales
+    store.preload(set(locales) | {reference_locale}, parallel=False)
+
+    reference = store.load_locale(reference_locale)
+    if reference_locale in store.load_errors:
+        return {'reference': reference_locale, 'error': store.load_errors[reference_locale]}
+    needed_by_chapter = required_lang_keys(chapters, reference.keys())
+    needed = set().union(*needed_by_chapter.values()) if needed_by_chapter else set()
+    owners = book_objects(chapters)
+
+    report: Dict[str, Any] = {'reference': reference_locale, 'needed': len(needed), 'locales': {}}
+    for locale in locales:
+        data = store.load_locale(locale)
+        if locale in store.load_errors:
+            report['locales'][locale] = {'error': store.load_errors[locale]}
+            continue
+        keys = set(data)
+        present = needed & keys
+        object_keys = {key for key in keys - needed if _object_of(key) is not None}
+        orphaned = {key for key in object_keys if _object_of(key) not in owners}
+        identical = set()
+        if locale != reference_locale:
+            identical = {key for key in present if key in reference and data[key] == reference[key]}
+
+        report['locales'][locale] = {
+            'present': len(present),
+            'coverage': _percent(len(present), len(needed)),
+            'missing': sorted(needed - keys),
+            'orphaned': sorted(orphaned),
+            'identical': sorted(identical),
+            'chapters': {
+                chapter_key: _percent(len(chapter_needed & keys), len(chapter_needed))
+                for chapter_key, chapter_needed in needed_by_chapter.items()
+            },
+        }
+    return report
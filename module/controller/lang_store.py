@@ -0,0 +1,151 @@
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+import ftb_snbt_lib as fslib
+
+from ..model.quest_models import Chapter, Quest, Task, Reward
+from .ftb_loader import SNBT_PARSE_LOCK
+
+DEFAULT_LOCALE = "en_us"
+
+# Lang key suffixes that differ from the plain field name, keyed by (kind, field)
+LANG_KEY_FIELDS = {
+    ('chapter', 'subtitle'): 'chapter_subtitle',
+    ('quest', 'subtitle'): 'quest_subtitle',
+    ('quest', 'description'): 'quest_desc',
+}
+
+
+def lang_key(kind: str, object_id: str, field: str = 'title') -> str:
+    """Build a lang key such as 'quest.<ID>.title' or 'quest.<ID>.quest_desc'."""
+    return f"{kind}.{object_id}.{LANG_KEY_FIELDS.get((kind, field), field)}"
+
+
+def _kind_of(obj: Any) -> str:
+    if isinstance(obj, Chapter):
+        return 'chapter'
+    if isinstance(obj, Quest):
+        return 'quest'
+    if isinstance(obj, Task):
+        return 'task'
+    if isinstance(obj, Reward):
+        return 'reward'
+    raise TypeError(f"Unsupported lang object: {type(obj).__name__}")
+
+
+class LangStore:
+    """
+    Lazily loaded lang data for every locale in an FTB Quests 'lang' directory.
+
+    Locales are discovered from 'lang/*.snbt', but a locale file is only read and parsed
+    the first time it is used (or when preload() is called). Lookups fall back from the
+    requested locale to the fallback locale.
+    """
+
+    def __init__(
+        self,
+        lang_dir: Optional[str] = None,
+        locale: str = DEFAULT_LOCALE,
+        fallback_locale: str = DEFAULT_LOCALE,
+        preloaded: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        self.lang_dir = lang_dir
+        self.locale = locale
+        self.fallback_locale = fallback_locale
+        self._loaded: Dict[str, Dict[str, Any]] = dict(preloaded or {})
+        self._paths: Optional[Dict[str, str]] = None
+        self._lock = threading.Lock()
+        # Locales whose file exists but could not be read or parsed: {locale: error message}
+        self.load_errors: Dict[str, str] = {}
+
+    @classmethod
+    def for_chapters_dir(cls, chapters_dir_path: str, **kwargs) -> "LangStore":
+        """Create a store for the 'lang' directory next to a 'chapters' directory."""
+        lang_dir = os.path.normpath(os.path.join(chapters_dir_path, os.pardir, "lang"))
+        return cls(lang_dir, **kwargs)
+
+    # --- Discovery and loading ---
+
+    def _locale_paths(self) -> Dict[str, str]:
+        if self._paths is None:
+            paths = {}
+            if self.lang_dir and os.path.isdir(self.lang_dir):
+                with os.scandir(self.lang_dir) as entries:
+                    for entry in entries:
+                        if entry.is_file() and entry.name.endswith(".snbt"):
+                            paths[entry.name[:-len(".snbt")]] = entry.path
+            self._paths = paths
+        return self._paths
+
+    @property
+    def locales(self) -> List[str]:
+        """Every known locale, loaded or not."""
+        return sorted(set(self._locale_paths()) | set(self._loaded))
+
+    def is_loaded(self, locale: str) -> bool:
+        return locale in self._loaded
+
+    def load_locale(self, locale: str) -> Dict[str, Any]:
+        """Return the lang data of one locale, reading its file on first use."""
+        if locale in self._loaded:
+            return self._loaded[locale]
+
+        path = self._locale_paths().get(locale)
+        data: Dict[str, Any] = {}
+        if path is not None:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    text = f.read()
+                with SNBT_PARSE_LOCK:
+                    data = fslib.loads(text)
+            except Exception as e:
+                print(f"Error loading language file {path}: {e}", file=sys.stderr)
+                self.load_errors[locale] = str(e)
+
+        with self._lock:
+            return self._loaded.setdefault(locale, data)
+
+    def preload(self, locales: Optional[Iterable[str]] = None, parallel: bool = False) -> None:
+        """
+        Load several locales (all discovered ones by default). With `parallel`, files are
+        read in a thread pool; parsing is still one locale at a time (SNBT_PARSE_LOCK).
+        """
+        pending = [locale for locale in (locales if locales is not None else self.locales) if locale not in self._loaded]
+        if parallel and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1)) as pool:
+                list(pool.map(self.load_locale, pending))
+        else:
+            for locale in pending:
+                self.load_locale(locale)
+
+    # --- Lookups ---
+
+    def _chain(self, locale: Optional[str]) -> List[str]:
+        first = locale or self.locale
+        return [first] if first == self.fallback_locale else [first, self.fallback_locale]
+
+    def lookup(self, key: str, locale: Optional[str] = None, default: Any = None) -> Any:
+        """Look a raw lang key up, falling back to the fallback locale."""
+        for candidate in self._chain(locale):
+            data = self.load_locale(candidate)
+            if key in data:
+                return data[key]
+        return default
+
+    def text(self, kind: str, object_id: str, field: str = 'title', locale: Optional[str] = None) -> Any:
+        """Look up the title/subtitle/description of a chapter, quest, task or reward by ID."""
+        return self.lookup(lang_key(kind, object_id, field), locale)
+
+    def title_for(self, obj: Any, locale: Optional[str] = None) -> Optional[str]:
+        """Resolve a model's display title: the lang entry if any, else the model's own title."""
+        return self.text(_kind_of(obj), obj.id, 'title', locale) or getattr(obj, 'title', None)
+
+    def merged(self, locale: Optional[str] = None) -> Dict[str, Any]:
+        """One flat dict for a locale with fallback entries filled in (for exporters)."""
+        merged: Dict[str, Any] = {}
+        for candidate in reversed(self._chain(locale)):
+            merged.update(self.load_locale(candidate))
+        return merged
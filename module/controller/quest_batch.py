@@ -0,0 +1,100 @@
+import glob
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..model.quest_models import Chapter
+from .ftb_loader import resolve_chapters_directory, load_chapter_data, load_language_data, parse_chapters
+from .quest_lint import lint_book
+
+
+def expand_roots(patterns: Iterable[str]) -> List[str]:
+    """Expand glob patterns into a sorted, de-duplicated list of paths (plain paths are kept as given)."""
+    roots = set()
+    for pattern in patterns:
+        matches = glob.glob(pattern) if glob.has_magic(pattern) else [pattern]
+        roots.update(os.path.normpath(match) for match in matches)
+    return sorted(roots)
+
+
+def item_usage(chapters: Dict[str, Chapter]) -> Counter:
+    """Count how often each item ID appears in tasks and rewards."""
+    usage: Counter = Counter()
+    for chapter in chapters.values():
+        for quest in chapter.quests:
+            for component in (*quest.tasks, *quest.rewards):
+                if component.item is not None:
+                    usage[component.item.id] += 1
+    return usage
+
+
+def analyze_book(chapters: Dict[str, Chapter], lang_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Quest counts, lint findings and item usage of one loaded book."""
+    diagnostics = lint_book(chapters, lang_data, workers=1)
+    quests = [quest for chapter in chapters.values() for quest in chapter.quests]
+    return {
+        'chapters': len(chapters),
+        'quests': len(quests),
+        'tasks': sum(len(quest.tasks) for quest in quests),
+        'rewards': sum(len(quest.rewards) for quest in quests),
+        'errors': sum(1 for d in diagnostics if d.severity == 'error'),
+        'warnings': sum(1 for d in diagnostics if d.severity == 'warning'),
+        'diagnostics': dict(Counter(d.code for d in diagnostics)),
+        'items': dict(item_usage(chapters)),
+    }
+
+
+def analyze_instance(root: str) -> Dict[str, Any]:
+    """
+    Load and analyse one modpack root (or chapters directory). Never prompts and never
+    prints: chapters or lang files that fail to load are listed under 'load_errors'.
+    """
+    chapters_path = resolve_chapters_directory(root)
+    if chapters_path is None:
+        return {'root': root, 'error': "No FTB Quests chapters found."}
+    load_errors: List[str] = []
+    chapters = parse_chapters(load_chapter_data(chapters_path, load_errors), problems=load_errors)
+    lang_data = load_language_data(chapters_path, load_errors)
+    return {'root': root, 'chapters_dir': chapters_path, **analyze_book(chapters, lang_data), 'load_errors': load_errors}
+
+
+def batch_analyze(roots: Iterable[str], workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Analyse many modpack instances, one per worker process (workers=1 runs them inline),
+    and aggregate the results into a single report.
+
+    Returns:
+        {'instances': [per-instance results], 'totals': {...}, 'diagnostics': {code: count},
+         'items': {item_id: {'uses': n, 'instances': k}}}
+    """
+    roots = list(roots)
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(roots) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(roots))) as pool:
+            instances = list(pool.map(analyze_instance, roots))
+    else:
+        instances = [analyze_instance(root) for root in roots]
+
+    totals = Counter()
+    diagnostics: Counter = Counter()
+    uses: Counter = Counter()
+    instance_counts: Counter = Counter()
+    for result in instances:
+        if 'error' in result:
+            totals['failed'] += 1
+            continue
+        totals['loaded'] += 1
+        for field in ('chapters', 'quests', 'tasks', 'rewards', 'errors', 'warnings'):
+            totals[field] += result[field]
+        diagnostics.update(result['diagnostics'])
+        uses.update(result['items'])
+        instance_counts.update(result['items'].keys())
+
+    return {
+        'instances': instances,
+        'totals': {'instances': len(instances), **{field: totals[field] for field in (
+            'loaded', 'failed', 'chapters', 'quests', 'tasks', 'rewards', 'errors', 'warnings')}},
+        'diagnostics': dict(sorted(diagnostics.items())),
+        'items': {item_id: {'uses': count, 'instances': instance_counts[item_id]} for item_id, count in uses.most_common()},
+    }
@@ -1,5 +1,16 @@
 # Configuration constants for FTB Quest Manager
+import os
 
 # Directories
 FTBQ_DIR = "../config/ftbquests/"
 LANG_DIR = "../config/ftbquests/quests/lang/en_us.snbt"
+
+# The standard relative path from the modpack root to the chapters directory
+FTB_QUESTS_REL_PATH = os.path.join("config", "ftbquests", "quests", "chapters")
+
+# Remembered discovery results live in <user config dir>/<CONFIG_DIR_NAME>/<CONFIG_FILE_NAME>
+CONFIG_DIR_NAME = "ftb_quest_viewer"
+CONFIG_FILE_NAME = "config.json"
+
+# How many directory levels below a launcher's instances folder are searched
+SCAN_MAX_DEPTH = 3
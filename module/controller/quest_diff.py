@@ -0,0 +1,103 @@
+from typing import Any, Dict, List, Sequence, Tuple
+
+from ..model.quest_models import Chapter, Quest, QuestComponent
+from .quest_hash import chapter_hash, component_hash, content_hash, quest_hash
+
+
+def _field_changes(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """Return {field: [old, new]} for every field whose value differs."""
+    return {
+        key: [old.get(key), new.get(key)]
+        for key in sorted(set(old) | set(new))
+        if old.get(key) != new.get(key)
+    }
+
+
+def _diff_components(old: Sequence[QuestComponent], new: Sequence[QuestComponent]) -> Dict[str, Any]:
+    """Match tasks or rewards by ID and deep-compare only those whose hashes differ."""
+    old_by_id = {c.id: c for c in old}
+    new_by_id = {c.id: c for c in new}
+    modified = {}
+    for component_id in old_by_id.keys() & new_by_id.keys():
+        before, after = old_by_id[component_id], new_by_id[component_id]
+        if component_hash(before) != component_hash(after):
+            modified[component_id] = _field_changes(before.model_dump(mode='json'), after.model_dump(mode='json'))
+    return {
+        'added': sorted(new_by_id.keys() - old_by_id.keys()),
+        'removed': sorted(old_by_id.keys() - new_by_id.keys()),
+        'modified': dict(sorted(modified.items())),
+    }
+
+
+def _diff_quest(old: Quest, new: Quest) -> Dict[str, Any]:
+    exclude = {'tasks', 'rewards'}
+    changes: Dict[str, Any] = {
+        'fields': _field_changes(old.model_dump(mode='json', exclude=exclude), new.model_dump(mode='json', exclude=exclude)),
+    }
+    for name in ('tasks', 'rewards'):
+        component_changes = _diff_components(getattr(old, name), getattr(new, name))
+        if any(component_changes.values()):
+            changes[name] = component_changes
+    return changes
+
+
+def _quest_summary(quest: Quest, chapter_key: str) -> Dict[str, Any]:
+    return {'id': quest.id, 'chapter': chapter_key, 'title': quest.title}
+
+
+def diff_books(old_chapters: Dict[str, Chapter], new_chapters: Dict[str, Chapter]) -> Dict[str, Any]:
+    """
+    Build a structured changelog between two quest books.
+
+    Chapters are matched by key and quests by ID across the whole book (so a quest
+    moved between chapters shows up as a modification). Only chapters whose hashes
+    differ are descended into, and within them only quests, tasks and rewards whose
+    hashes differ are deep-compared.
+    """
+    old_hashes = {key: chapter_hash(c) for key, c in old_chapters.items()}
+    new_hashes = {key: chapter_hash(c) for key, c in new_chapters.items()}
+    changed_old = [key for key in old_chapters if old_hashes[key] != new_hashes.get(key)]
+    changed_new = [key for key in new_chapters if new_hashes[key] != old_hashes.get(key)]
+
+    chapter_changes = {}
+    for key in set(changed_old) & set(changed_new):
+        before = old_chapters[key].model_dump(mode='json', exclude={'quests'})
+        after = new_chapters[key].model_dump(mode='json', exclude={'quests'})
+        if content_hash(before) != content_hash(after):
+            chapter_changes[key] = _field_changes(before, after)
+
+    # Only quests from changed chapters can differ; unchanged chapters are skipped whole
+    old_quests: Dict[str, Tuple[str, Quest]] = {q.id: (key, q) for key in changed_old for q in old_chapters[key].quests}
+    new_quests: Dict[str, Tuple[str, Quest]] = {q.id: (key, q) for key in changed_new for q in new_chapters[key].quests}
+
+    modified = []
+    for quest_id in sorted(old_quests.keys() & new_quests.keys()):
+        (old_key, old_quest), (new_key, new_quest) = old_quests[quest_id], new_quests[quest_id]
+        if old_key == new_key and quest_hash(old_quest) == quest_hash(new_quest):
+            continue
+        entry = _quest_summary(new_quest, new_key)
+        if old_key != new_key:
+            entry['moved_from'] = old_key
+        entry.update(_diff_quest(old_quest, new_quest))
+        modified.append(entry)
+
+    added = [_quest_summary(new_quests[qid][1], new_quests[qid][0]) for qid in sorted(new_quests.keys() - old_quests.keys())]
+    removed = [_quest_summary(old_quests[qid][1], old_quests[qid][0]) for qid in sorted(old_quests.keys() - new_quests.keys())]
+
+    report = {
+        'chapters': {
+            'added': sorted(new_chapters.keys() - old_chapters.keys()),
+            'removed': sorted(old_chapters.keys() - new_chapters.keys()),
+            'modified': dict(sorted(chapter_changes.items())),
+        },
+        'quests': {'added': added, 'removed': removed, 'modified': modified},
+    }
+    report['summary'] = {
+        'chapters_added': len(report['chapters']['added']),
+        'chapters_removed': len(report['chapters']['removed']),
+        'chapters_modified': len(chapter_changes),
+        'quests_added': len(added),
+        'quests_removed': len(removed),
+        'quests_modified': len(modified),
+    }
+    return report
@@ -0,0 +1,111 @@
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, Optional, Union
+
+from ..model.quest_models import Chapter, QuestComponent, Reward
+
+# Reward types whose amount is experience rather than items
+XP_REWARD_TYPES = ('xp', 'xp_levels')
+
+
+def _as_int(value: Optional[Union[int, str]]) -> Optional[int]:
+    """Read a count that may have come through as a string (e.g. '8L')."""
+    if value is None or isinstance(value, int):
+        return value
+    try:
+        return int(str(value).rstrip('lLbBsS'))
+    except ValueError:
+        return None
+
+
+def component_amount(component: QuestComponent) -> int:
+    """
+    Number of items a task asks for or an item reward gives: the component's own 'count'
+    when set (newer FTB Quests), otherwise the stack size of its item.
+    """
+    count = _as_int(component.count)
+    if count is not None:
+        return count
+    return (component.item.count or 1) if component.item is not None else 0
+
+
+def xp_amount(reward: Reward) -> int:
+    """Experience given by an 'xp' or 'xp_levels' reward (its 'xp'/'xp_levels' field, else 'count')."""
+    own = reward.xp if reward.type == 'xp' else reward.xp_levels
+    return own if own is not None else (_as_int(reward.count) or 0)
+
+
+def economy_report(chapters: Dict[str, Chapter], items: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Aggregate reward inflow and task demand over the whole book in one pass.
+
+    Items are counted by amount (see component_amount) and broken down by chapter and
+    chapter group; XP is totalled per chapter and group. Pass `items` to keep only those
+    item IDs in the per-item section (totals still cover every item).
+
+    Returns:
+        {'items': {item_id: {'given', 'required', 'balance', 'rewards', 'tasks', 'chapters', 'groups'}},
+         'reward_types': {type: count}, 'task_types': {type: count},
+         'xp': {'xp': n, 'xp_levels': n},
+         'chapters': {key: totals}, 'groups': {group: totals}}
+        Item entries are sorted by amount given, then required.
+    """
+    given: Counter = Counter()
+    required: Counter = Counter()
+    reward_entries: Counter = Counter()
+    task_entries: Counter = Counter()
+    given_by_chapter: Dict[str, Counter] = defaultdict(Counter)
+    given_by_group: Dict[str, Counter] = defaultdict(Counter)
+    reward_types: Counter = Counter()
+    task_types: Counter = Counter()
+    chapter_totals: Dict[str, Counter] = {}
+    group_totals: Dict[str, Counter] = defaultdict(Counter)
+
+    for key, chapter in chapters.items():
+        totals = chapter_totals[key] = Counter()
+        for quest in chapter.quests:
+            for task in quest.tasks:
+                task_types[task.type] += 1
+                if task.item is not None:
+                    amount = component_amount(task)
+                    required[task.item.id] += amount
+                    task_entries[task.item.id] += 1
+                    totals['items_required'] += amount
+            for reward in quest.rewards:
+                reward_types[reward.type] += 1
+                totals['rewards'] += 1
+                if reward.type in XP_REWARD_TYPES:
+                    totals[reward.type] += xp_amount(reward)
+                elif reward.item is not None:
+                    item_id = reward.item.id
+                    amount = component_amount(reward)
+                    given[item_id] += amount
+                    reward_entries[item_id] += 1
+                    given_by_chapter[item_id][key] += amount
+                    given_by_group[item_id][chapter.group] += amount
+                    totals['items_given'] += amount
+        group_totals[chapter.group].update(totals)
+
+    wanted = set(items) if items is not None else None
+    item_ids = sorted(
+        (item_id for item_id in given.keys() | required.keys() if wanted is None or item_id in wanted),
+        key=lambda item_id: (-given[item_id], -required[item_id], item_id),
+    )
+    return {
+        'items': {
+            item_id: {
+                'given': given[item_id],
+                'required': required[item_id],
+                'balance': given[item_id] - required[item_id],
+                'rewards': reward_entries[item_id],
+                'tasks': task_entries[item_id],
+                'chapters': dict(given_by_chapter[item_id].most_common()),
+                'groups': dict(given_by_group[item_id].most_common()),
+            }
+            for item_id in item_ids
+        },
+        'reward_types': dict(reward_types.most_common()),
+        'task_types': dict(task_types.most_common()),
+        'xp': {xp_type: sum(totals[xp_type] for totals in chapter_totals.values()) for xp_type in XP_REWARD_TYPES},
+        'chapters': {key: dict(totals) for key, totals in chapter_totals.items()},
+        'groups': {group: dict(totals) for group, totals in sorted(group_totals.items())},
+    }
@@ -0,0 +1,84 @@
+import hashlib
+import json
+from typing import Any, Iterable, Optional
+
+from pydantic import BaseModel
+
+from ..model.quest_models import Chapter, FingerprintedModel, Quest, QuestComponent, TrackedModel
+
+
+def canonical_json(data: Any) -> str:
+    """Serialize data to a stable JSON string (sorted keys, no whitespace)."""
+    if isinstance(data, BaseModel):
+        data = data.model_dump(mode='json')
+    return json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+
+def content_hash(data: Any) -> str:
+    """Return a short, stable hex digest of a model or plain data structure."""
+    return hashlib.blake2b(canonical_json(data).encode('utf-8'), digest_size=16).hexdigest()
+
+
+# --- Merkle-style model hashes ---
+# A quest hash covers its own fields plus the hashes of its tasks and rewards, and a
+# chapter hash covers its own fields plus its quest hashes, so equal hashes mean equal
+# subtrees and a differing hash pinpoints which subtree to descend into.
+# Each hash is cached on the model (FingerprintedModel), so after an edit only the copied
+# objects on the path to the change are re-hashed; untouched children answer in O(1).
+# Hashing a model registers it as a parent of its child models and items, so assigning a
+# field deeper down (chapter.quests[0].x = 5, task.item.id = ...) clears the caches above
+# it. Lists and dicts are not watched; in-place changes to them are not supported.
+
+def _cached(model: FingerprintedModel) -> Optional[str]:
+    return getattr(model, '_fingerprint', None)
+
+
+def _store(model: FingerprintedModel, fingerprint: str) -> str:
+    object.__setattr__(model, '_fingerprint', fingerprint)
+    return fingerprint
+
+
+def _adopt(parent: TrackedModel, children: Iterable[Optional[TrackedModel]]) -> None:
+    for child in children:
+        if child is not None:
+            child._add_parent(parent)
+
+
+def component_hash(component: QuestComponent) -> str:
+    """Hash a Task or Reward."""
+    cached = _cached(component)
+    if cached:
+        return cached
+    _adopt(component, [component.item])
+    return _store(component, content_hash(component))
+
+
+def quest_hash(quest: Quest) -> str:
+    """Hash a Quest from its own fields and its task/reward hashes."""
+    cached = _cached(quest)
+    if cached:
+        return cached
+    _adopt(quest, quest.tasks)
+    _adopt(quest, quest.rewards)
+    own = quest.model_dump(mode='json', exclude={'tasks', 'rewards'})
+    return _store(quest, content_hash([own, [component_hash(t) for t in quest.tasks], [component_hash(r) for r in quest.rewards]]))
+
+
+def chapter_hash(chapter: Chapter) -> str:
+    """Hash a Chapter from its own fields and its quest hashes."""
+    cached = _cached(chapter)
+    if cached:
+        return cached
+    _adopt(chapter, chapter.quests)
+    _adopt(chapter, [chapter.icon])
+    own = chapter.model_dump(mode='json', exclude={'quests'})
+    return _store(chapter, content_hash([own, [quest_hash(q) for q in chapter.quests]]))
+
+
+def fingerprint(model: FingerprintedModel) -> str:
+    """Return the cached content hash of a Chapter, Quest, Task or Reward."""
+    if isinstance(model, Chapter):
+        return chapter_hash(model)
+    if isinstance(model, Quest):
+        return quest_hash(model)
+    return component_hash(model)
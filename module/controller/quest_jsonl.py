@@ -0,0 +1,152 @@
+import json
+import sys
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+
+from ..model.quest_models import Chapter, Quest
+
+# Validates a whole batch of quest dicts in one call
+_QUEST_BATCH = TypeAdapter(List[Quest])
+
+
+# --- Export ---
+
+def iter_quest_records(chapters: Dict[str, Chapter], lang_data: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one JSON-ready record per chapter header and per quest, chapter by chapter.
+
+    Chapter records carry the chapter settings (without quests) so a book can be rebuilt;
+    quest records carry the chapter key, tasks and rewards. Chapter and quest titles are
+    resolved through `lang_data` when it has them.
+    """
+    lang_data = lang_data or {}
+    for chapter_key, chapter in chapters.items():
+        header = chapter.model_dump(mode='json', exclude={'quests'})
+        header['title'] = lang_data.get(f"chapter.{chapter.id}.title", chapter.title)
+        yield {'record': 'chapter', 'chapter': chapter_key, **header}
+        for quest in chapter.quests:
+            record = quest.model_dump(mode='json')
+            record['title'] = lang_data.get(f"quest.{quest.id}.title", quest.title)
+            yield {'record': 'quest', 'chapter': chapter_key, **record}
+
+
+def write_jsonl(records: Iterable[Dict[str, Any]], fp: IO[str]) -> int:
+    """Write records to a text stream, one compact JSON object per line. Returns the count."""
+    count = 0
+    for record in records:
+        fp.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+        fp.write("\n")
+        count += 1
+    return count
+
+
+def export_jsonl(chapters: Dict[str, Chapter], path: str, lang_data: Optional[Dict[str, Any]] = None) -> int:
+    """Stream the book to a JSON Lines file ('-' for stdout). Returns the number of records."""
+    records = iter_quest_records(chapters, lang_data)
+    if path == "-":
+        return write_jsonl(records, sys.stdout)
+    with open(path, "w", encoding="utf-8") as f:
+        return write_jsonl(records, f)
+
+
+# --- Import ---
+
+def iter_jsonl(fp: IO[str], source: str = "<stream>") -> Iterator[Dict[str, Any]]:
+    """
+    Yield the JSON object on each non-blank line of a text stream.
+
+    Raises:
+        ValueError: A line is not a JSON object (the message names `source` and the line).
+    """
+    for line_number, line in enumerate(fp, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{source}:{line_number}: invalid JSON ({e.msg}).") from None
+        if not isinstance(record, dict):
+            raise ValueError(f"{source}:{line_number}: expected a JSON object.")
+        yield record
+
+
+def _validate_batch(batch: List[Tuple[str, Dict[str, Any]]]) -> Iterator[Tuple[str, Quest]]:
+    """Validate a batch in one call, falling back to per-record checks to isolate bad rows."""
+    try:
+        quests = _QUEST_BATCH.validate_python([record for _, record in batch])
+        yield from zip((key for key, _ in batch), quests)
+        return
+    except ValidationError:
+        pass
+
+    for chapter_key, record in batch:
+        try:
+            yield chapter_key, Quest.model_validate(record)
+        except ValidationError as e:
+            print(f"Skipping invalid quest {record.get('id')!r} in chapter {chapter_key}.")
+            print(e)
+
+
+def iter_validated_quests(
+    records: Iterable[Dict[str, Any]],
+    chapter_headers: Dict[str, Dict[str, Any]],
+    batch_size: int = 1000,
+) -> Iterator[Tuple[str, Quest]]:
+    """
+    Validate quest records in batches, yielding (chapter_key, Quest) pairs.
+    Chapter header records are collected into `chapter_headers` as they stream past.
+
+    Raises:
+        ValueError: A record has no 'chapter' key.
+    """
+    batch: List[Tuple[str, Dict[str, Any]]] = []
+    for record in records:
+        kind = record.pop('record', 'quest')
+        chapter_key = record.pop('chapter', None)
+        if not isinstance(chapter_key, str) or not chapter_key:
+            raise ValueError(f"{kind.capitalize()} record {record.get('id')!r} has no 'chapter' key.")
+        if kind == 'chapter':
+            chapter_headers[chapter_key] = record
+            continue
+        batch.append((chapter_key, record))
+        if len(batch) >= batch_size:
+            yield from _validate_batch(batch)
+            batch = []
+    if batch:
+        yield from _validate_batch(batch)
+
+
+def import_jsonl(path: str, batch_size: int = 1000) -> Dict[str, Chapter]:
+    """
+    Rebuild chapters from a JSON Lines file ('-' for stdin) written by export_jsonl.
+
+    Quests are validated in batches as the file streams in. Quests whose chapter has no
+    header record are grouped into a minimal chapter named after the chapter key.
+
+    Raises:
+        OSError: The file cannot be read.
+        ValueError: A line is not valid JSON, or a record has no chapter key.
+    """
+    headers: Dict[str, Dict[str, Any]] = {}
+    quests: Dict[str, List[Quest]] = {}
+
+    fp = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    try:
+        source = "<stdin>" if path == "-" else path
+        for chapter_key, quest in iter_validated_quests(iter_jsonl(fp, source), headers, batch_size):
+            quests.setdefault(chapter_key, []).append(quest)
+    finally:
+        if fp is not sys.stdin:
+            fp.close()
+
+    parsed_chapters = {}
+    for chapter_key in list(headers) + [key for key in quests if key not in headers]:
+        header = headers.get(chapter_key) or {'id': chapter_key, 'filename': chapter_key, 'group': '', 'order_index': 0}
+        try:
+            parsed_chapters[chapter_key] = Chapter.model_validate({**header, 'quests': quests.get(chapter_key, [])})
+        except ValidationError as e:
+            print(f"Failed to mount chapter {chapter_key} due to Validation Error.")
+            print(e)
+    return parsed_chapters
@@ -0,0 +1,146 @@
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..model.quest_models import Chapter
+from .quest_edit import edit_quest_position
+
+
+def assign_layers(chapter: Chapter) -> Dict[str, int]:
+    """
+    Assign every quest a layer equal to the length of its longest dependency chain
+    inside the chapter (longest-path layering over a topological order).
+
+    Dependencies on quests outside the chapter are ignored. Quests caught in a
+    dependency cycle are layered after their already-layered dependencies.
+    """
+    quest_ids = [q.id for q in chapter.quests]
+    known = set(quest_ids)
+    deps = {q.id: [d for d in q.dependencies if d in known and d != q.id] for q in chapter.quests}
+
+    dependents: Dict[str, List[str]] = {qid: [] for qid in quest_ids}
+    indegree = {qid: 0 for qid in quest_ids}
+    for qid, qdeps in deps.items():
+        for dep in qdeps:
+            dependents[dep].append(qid)
+            indegree[qid] += 1
+
+    layers: Dict[str, int] = {}
+    queue = deque(qid for qid in quest_ids if indegree[qid] == 0)
+    while queue:
+        qid = queue.popleft()
+        layers[qid] = max((layers[d] + 1 for d in deps[qid]), default=0)
+        for child in dependents[qid]:
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                queue.append(child)
+
+    # Cycle fallback: place the remaining quests in chapter order
+    for qid in quest_ids:
+        if qid not in layers:
+            layers[qid] = max((layers[d] + 1 for d in deps[qid] if d in layers), default=0)
+
+    return layers
+
+
+def _order_layers(
+    layers: Dict[str, int],
+    neighbours_up: Dict[str, List[str]],
+    neighbours_down: Dict[str, List[str]],
+    sweeps: int,
+) -> List[List[str]]:
+    """Reduce edge crossings with alternating barycenter sweeps."""
+    rows: List[List[str]] = [[] for _ in range(max(layers.values(), default=-1) + 1)]
+    for qid, layer in layers.items():
+        rows[layer].append(qid)
+
+    position: Dict[str, float] = {}
+
+    def _index(row: List[str]) -> None:
+        span = max(len(row) - 1, 1)
+        for i, qid in enumerate(row):
+            position[qid] = i / span
+
+    for row in rows:
+        _index(row)
+
+    for sweep in range(sweeps):
+        downward = sweep % 2 == 0
+        order = range(1, len(rows)) if downward else range(len(rows) - 2, -1, -1)
+        neighbours = neighbours_up if downward else neighbours_down
+        for layer in order:
+            row = rows[layer]
+            keys = {}
+            for qid in row:
+                linked = neighbours[qid]
+                keys[qid] = sum(position[n] for n in linked) / len(linked) if linked else position[qid]
+            row.sort(key=keys.__getitem__)
+            _index(row)
+
+    return rows
+
+
+def compute_layout(
+    chapter: Chapter,
+    pinned: Optional[Iterable[str]] = None,
+    spacing: Tuple[float, float] = (1.5, 1.5),
+    sweeps: int = 4,
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Compute a layered (Sugiyama-style) layout for a chapter.
+
+    Quests are layered top-down by dependency depth, ordered within each layer by a
+    barycenter crossing-reduction heuristic and spaced on a grid centred on x = 0.
+    Pinned quests keep their current position, and free quests skip any grid slot a
+    pinned quest already occupies. Runs in O((V + E) * sweeps + V log V).
+
+    Returns:
+        A mapping of quest ID to its new (x, y) position.
+    """
+    pinned_ids = set(pinned or ())
+    layers = assign_layers(chapter)
+    known = set(layers)
+
+    neighbours_up = {q.id: [d for d in q.dependencies if d in known and layers[d] < layers[q.id]] for q in chapter.quests}
+    neighbours_down: Dict[str, List[str]] = {qid: [] for qid in known}
+    for qid, ups in neighbours_up.items():
+        for dep in ups:
+            neighbours_down[dep].append(qid)
+
+    rows = _order_layers(layers, neighbours_up, neighbours_down, sweeps)
+
+    current = {q.id: (q.x, q.y) for q in chapter.quests}
+    occupied = {current[qid] for qid in pinned_ids if qid in current}
+    step_x, step_y = spacing
+
+    positions: Dict[str, Tuple[float, float]] = {}
+    for layer, row in enumerate(rows):
+        y = layer * step_y
+        x_start = -(len(row) - 1) * step_x / 2
+        slot = 0
+        for qid in row:
+            if qid in pinned_ids:
+                positions[qid] = current[qid]
+                continue
+            while (x_start + slot * step_x, y) in occupied:
+                slot += 1
+            positions[qid] = (x_start + slot * step_x, y)
+            slot += 1
+
+    return positions
+
+
+def autolayout_chapter(
+    chapter: Chapter,
+    pinned: Optional[Iterable[str]] = None,
+    spacing: Tuple[float, float] = (1.5, 1.5),
+    sweeps: int = 4,
+) -> Chapter:
+    """Lay out a chapter from its dependency graph and return one updated Chapter."""
+    positions = compute_layout(chapter, pinned, spacing, sweeps)
+    updated_quests = []
+    for quest in chapter.quests:
+        new_x, new_y = positions.get(quest.id, (quest.x, quest.y))
+        if (new_x, new_y) != (quest.x, quest.y):
+            quest = edit_quest_position(quest, new_x, new_y)
+        updated_quests.append(quest)
+    return chapter.model_copy(update={'quests': updated_quests})
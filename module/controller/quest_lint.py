@@ -0,0 +1,137 @@
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from ..model.quest_models import Chapter
+
+# Lang keys that name a quest title, e.g. quest.0123456789ABCDEF.title
+QUEST_TITLE_KEY = re.compile(r"^quest\.([^.]+)\.title$")
+
+SEVERITY_ORDER = {'error': 0, 'warning': 1}
+
+
+class Diagnostic(BaseModel):
+    """A single machine-readable lint finding."""
+    code: str
+    severity: str
+    message: str
+    chapter: Optional[str] = None
+    object_id: Optional[str] = None
+
+
+class ChapterIds(BaseModel):
+    """The IDs a chapter defines and references, used for cross-chapter checks."""
+    chapter: str
+    defined: List[Tuple[str, str]] = Field(default_factory=list)  # (kind, id)
+    dependencies: List[Tuple[str, str]] = Field(default_factory=list)  # (quest_id, dependency_id)
+    untitled: List[str] = Field(default_factory=list)  # quests without a title in the SNBT data
+    autofocus_quest_id: Optional[str] = None
+
+
+def lint_chapter(chapter_key: str, chapter: Chapter) -> Tuple[List[Diagnostic], ChapterIds]:
+    """Run the checks that only need one chapter and collect its ID sets."""
+    diagnostics = []
+    ids = ChapterIds(chapter=chapter_key, autofocus_quest_id=chapter.autofocus_quest_id)
+    ids.defined.append(('chapter', chapter.id))
+
+    for quest in chapter.quests:
+        ids.defined.append(('quest', quest.id))
+        ids.defined.extend(('task', task.id) for task in quest.tasks)
+        ids.defined.extend(('reward', reward.id) for reward in quest.rewards)
+        ids.dependencies.extend((quest.id, dep) for dep in quest.dependencies)
+
+        if not quest.tasks:
+            diagnostics.append(Diagnostic(
+                code='no-tasks', severity='warning', chapter=chapter_key, object_id=quest.id,
+                message=f"Quest {quest.id} has no tasks.",
+            ))
+        if not quest.title:
+            ids.untitled.append(quest.id)
+
+    return diagnostics, ids
+
+
+def _lint_chapter_item(item: Tuple[str, Chapter]) -> Tuple[List[Diagnostic], ChapterIds]:
+    return lint_chapter(*item)
+
+
+def lint_book(
+    chapters: Dict[str, Chapter],
+    lang_data: Optional[Dict[str, Any]] = None,
+    workers: int = 1,
+) -> List[Diagnostic]:
+    """
+    Lint a whole quest book.
+
+    Per-chapter checks run inline by default. They are cheap next to sending each chapter
+    to another process, so a pool (workers > 1, or 0 for one per CPU) only pays off for
+    unusually expensive books.
+
+    Cross-chapter checks then run once over shared ID sets: duplicate quest/task/reward/
+    chapter IDs, dependencies on missing quests, unknown autofocus_quest_id values, quests
+    titled neither in SNBT nor in lang_data, and quest title lang keys without a quest.
+    Everything is linear in the size of the book.
+
+    Returns:
+        Diagnostics sorted by severity, chapter and object ID.
+    """
+    items = list(chapters.items())
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if workers > 1 and len(items) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(items))) as pool:
+            results = list(pool.map(_lint_chapter_item, items, chunksize=max(1, len(items) // (workers * 4))))
+    else:
+        results = [lint_chapter(key, chapter) for key, chapter in items]
+
+    diagnostics: List[Diagnostic] = [d for chapter_diagnostics, _ in results for d in chapter_diagnostics]
+    chapter_ids = [ids for _, ids in results]
+
+    # Shared ID index: id -> every (kind, chapter) that defines it
+    owners: Dict[str, List[Tuple[str, str]]] = {}
+    for ids in chapter_ids:
+        for kind, object_id in ids.defined:
+            owners.setdefault(object_id, []).append((kind, ids.chapter))
+    quest_ids = {object_id for object_id, defs in owners.items() if any(kind == 'quest' for kind, _ in defs)}
+    lang_keys = set(lang_data or ())
+
+    for object_id, defs in owners.items():
+        if len(defs) > 1:
+            where = ", ".join(f"{kind} in {chapter}" for kind, chapter in defs)
+            diagnostics.append(Diagnostic(
+                code='duplicate-id', severity='error', chapter=defs[0][1], object_id=object_id,
+                message=f"ID {object_id} is defined {len(defs)} times ({where}).",
+            ))
+
+    for ids in chapter_ids:
+        for quest_id, dep in ids.dependencies:
+            if dep not in quest_ids:
+                diagnostics.append(Diagnostic(
+                    code='missing-dependency', severity='error', chapter=ids.chapter, object_id=quest_id,
+                    message=f"Quest {quest_id} depends on missing quest {dep}.",
+                ))
+        if ids.autofocus_quest_id and ids.autofocus_quest_id not in quest_ids:
+            diagnostics.append(Diagnostic(
+                code='missing-autofocus', severity='error', chapter=ids.chapter, object_id=ids.autofocus_quest_id,
+                message=f"autofocus_quest_id {ids.autofocus_quest_id} does not exist.",
+            ))
+        for quest_id in ids.untitled:
+            if f"quest.{quest_id}.title" not in lang_keys:
+                diagnostics.append(Diagnostic(
+                    code='missing-title', severity='warning', chapter=ids.chapter, object_id=quest_id,
+                    message=f"Quest {quest_id} has no title.",
+                ))
+
+    for key in lang_keys:
+        match = QUEST_TITLE_KEY.match(key)
+        if match and match.group(1) not in quest_ids:
+            diagnostics.append(Diagnostic(
+                code='orphan-lang-key', severity='warning', object_id=match.group(1),
+                message=f"Lang key {key} has no matching quest.",
+            ))
+
+    diagnostics.sort(key=lambda d: (SEVERITY_ORDER.get(d.severity, 9), d.chapter or "", d.object_id or "", d.code))
+    return diagnostics
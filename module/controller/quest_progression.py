@@ -0,0 +1,190 @@
+from collections import Counter, deque
+from typing import Any, Dict, List, Optional
+
+from ..model.quest_models import Chapter
+from .lang_store import LangStore
+
+
+def _components(nodes: List[str], edges: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    Strongly connected components of the subgraph on `nodes` (iterative Tarjan), sources
+    first, each listed in `nodes` order. Linear in nodes plus edges.
+    """
+    members = set(nodes)
+    position = {node: i for i, node in enumerate(nodes)}
+    index: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack = set()
+    work: List[Any] = []  # (node, iterator over its remaining edges)
+    components: List[List[str]] = []
+
+    def _visit(node: str) -> None:
+        index[node] = low[node] = len(index)
+        stack.append(node)
+        on_stack.add(node)
+        work.append((node, iter(edges[node])))
+
+    for root in nodes:
+        if root in index:
+            continue
+        _visit(root)
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in members:
+                    continue
+                if child not in index:
+                    _visit(child)
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    caller = work[-1][0]
+                    low[caller] = min(low[caller], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component, key=position.__getitem__))
+    # Tarjan finishes a component after everything reachable from it
+    return components[::-1]
+
+
+def compute_progression(chapters: Dict[str, Chapter]) -> Dict[str, Any]:
+    """
+    Depth of every quest in the book: the length of its longest prerequisite chain,
+    following dependencies across chapters.
+
+    One dynamic-programming pass over a topological order (Kahn's algorithm) sets
+    depth[q] = 1 + max(depth[d] for d in dependencies) and remembers the dependency that
+    gave the maximum, so critical paths can be read back without another search. Linear
+    in quests plus dependencies. Dependencies on unknown IDs are ignored.
+
+    Quests Kahn's algorithm cannot place are split into strongly connected components:
+    members of a cycle are listed in 'cyclic', and quests that only depend (directly or
+    not) on a cycle are listed in 'blocked'. They are placed component by component after
+    their already-placed dependencies, so blocked quests still get a meaningful depth.
+    A quest that depends on itself is a cycle of one: it is listed in 'cyclic' and its
+    self-dependency is otherwise ignored.
+
+    Returns:
+        {'depth': {quest_id: n}, 'parent': {quest_id: dep_id or None},
+         'chapter': {quest_id: chapter_key}, 'order': [quest ids, dependencies first],
+         'cyclic': [quest ids], 'blocked': [quest ids]}
+    """
+    chapter_of: Dict[str, str] = {}
+    deps: Dict[str, List[str]] = {}
+    for key, chapter in chapters.items():
+        for quest in chapter.quests:
+            if quest.id not in chapter_of:
+                chapter_of[quest.id] = key
+                deps[quest.id] = quest.dependencies
+
+    dependents: Dict[str, List[str]] = {qid: [] for qid in deps}
+    indegree = dict.fromkeys(deps, 0)
+    self_dependent = {qid for qid, qdeps in deps.items() if qid in qdeps}
+    for qid, qdeps in deps.items():
+        qdeps = deps[qid] = [d for d in dict.fromkeys(qdeps) if d in dependents and d != qid]
+        for dep in qdeps:
+            dependents[dep].append(qid)
+            indegree[qid] += 1
+
+    depth: Dict[str, int] = {}
+    parent: Dict[str, Optional[str]] = {}
+    order: List[str] = []
+
+    def _place(qid: str) -> None:
+        best = max((d for d in deps[qid] if d in depth), key=depth.__getitem__, default=None)
+        depth[qid] = depth[best] + 1 if best is not None else 0
+        parent[qid] = best
+        order.append(qid)
+
+    queue = deque(qid for qid, count in indegree.items() if count == 0)
+    while queue:
+        qid = queue.popleft()
+        _place(qid)
+        for child in dependents[qid]:
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                queue.append(child)
+
+    # Cycle fallback: place the remaining quests one strongly connected component at a time
+    leftover = [qid for qid in deps if qid not in depth]
+    in_cycle = set(self_dependent)
+    for component in _components(leftover, dependents):
+        if len(component) > 1:  # Self-dependencies were dropped above and are already in in_cycle
+            in_cycle.update(component)
+        for qid in component:
+            _place(qid)
+    cyclic = [qid for qid in deps if qid in in_cycle]
+    blocked = [qid for qid in leftover if qid not in in_cycle]
+
+    return {'depth': depth, 'parent': parent, 'chapter': chapter_of, 'order': order, 'cyclic': cyclic, 'blocked': blocked}
+
+
+def critical_path(progression: Dict[str, Any], quest_id: str) -> List[str]:
+    """The longest prerequisite chain ending at `quest_id`, from its first quest to it."""
+    if quest_id not in progression['depth']:
+        return []
+    path = []
+    current: Optional[str] = quest_id
+    while current is not None and len(path) <= len(progression['depth']):
+        path.append(current)
+        current = progression['parent'][current]
+    return path[::-1]
+
+
+def depth_histograms(progression: Dict[str, Any]) -> Dict[str, Dict[int, int]]:
+    """Number of quests at each depth, per chapter key."""
+    histograms: Dict[str, Counter] = {}
+    for qid, depth in progression['depth'].items():
+        histograms.setdefault(progression['chapter'][qid], Counter())[depth] += 1
+    return {key: dict(sorted(counts.items())) for key, counts in histograms.items()}
+
+
+def progression_report(
+    chapters: Dict[str, Chapter],
+    target: Optional[str] = None,
+    lang: Optional[LangStore] = None,
+) -> Dict[str, Any]:
+    """
+    Pacing summary: overall and per-chapter depth statistics and histograms, plus the
+    critical path to `target` (a quest ID, or the first ID starting with it) when given.
+    """
+    progression = compute_progression(chapters)
+    depth = progression['depth']
+    max_depth = max(depth.values(), default=0)
+    quests = {}
+    for chapter in chapters.values():
+        for quest in chapter.quests:
+            quests.setdefault(quest.id, quest)
+
+    def _title(qid: str) -> Optional[str]:
+        return lang.title_for(quests[qid]) if lang else quests[qid].title
+
+    report: Dict[str, Any] = {
+        'quests': len(depth),
+        'max_depth': max_depth,
+        'deepest': [qid for qid in progression['order'] if depth[qid] == max_depth] if depth else [],
+        'cyclic': progression['cyclic'],
+        'blocked': progression['blocked'],
+        'chapters': {
+            key: {'max_depth': max(histogram), 'histogram': histogram}
+            for key, histogram in depth_histograms(progression).items()
+        },
+    }
+    if target is not None:
+        target_id = target if target in depth else next((qid for qid in depth if qid.startswith(target)), None)
+        report['target'] = target_id
+        report['critical_path'] = [
+            {'id': qid, 'chapter': progression['chapter'][qid], 'depth': depth[qid], 'title': _title(qid)}
+            for qid in (critical_path(progression, target_id) if target_id else [])
+        ]
+    return report
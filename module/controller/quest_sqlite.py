@@ -0,0 +1,424 @@
+import json
+import os
+import sqlite3
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..model.quest_models import Chapter, QuestComponent
+from .lang_store import lang_key
+from .quest_hash import chapter_hash, content_hash
+
+# --- Schema ---
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS chapters (
+    key TEXT PRIMARY KEY,
+    id TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    title TEXT,
+    subtitle TEXT,
+    "group" TEXT,
+    order_index INTEGER,
+    icon_item_id TEXT,
+    tags TEXT,
+    settings TEXT,
+    content_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS quests (
+    id TEXT NOT NULL,
+    chapter_key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    title TEXT,
+    x REAL,
+    y REAL,
+    settings TEXT
+);
+CREATE TABLE IF NOT EXISTS dependencies (
+    quest_id TEXT NOT NULL,
+    dependency_id TEXT NOT NULL,
+    chapter_key TEXT NOT NULL,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT NOT NULL,
+    quest_id TEXT NOT NULL,
+    chapter_key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    item_id TEXT,
+    item_count INTEGER,
+    item_components TEXT,
+    count,
+    advancement TEXT,
+    optional_task INTEGER,
+    settings TEXT
+);
+CREATE TABLE IF NOT EXISTS rewards (
+    id TEXT NOT NULL,
+    quest_id TEXT NOT NULL,
+    chapter_key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    item_id TEXT,
+    item_count INTEGER,
+    item_components TEXT,
+    count,
+    advancement TEXT,
+    optional_task INTEGER,
+    settings TEXT
+);
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS lang (
+    locale TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    is_list INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (locale, key)
+);
+CREATE INDEX IF NOT EXISTS idx_quests_id ON quests (id);
+CREATE INDEX IF NOT EXISTS idx_quests_chapter ON quests (chapter_key);
+CREATE INDEX IF NOT EXISTS idx_dependencies_quest ON dependencies (quest_id);
+CREATE INDEX IF NOT EXISTS idx_dependencies_dependency ON dependencies (dependency_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_quest ON tasks (quest_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_item ON tasks (item_id);
+CREATE INDEX IF NOT EXISTS idx_rewards_quest ON rewards (quest_id);
+CREATE INDEX IF NOT EXISTS idx_rewards_item ON rewards (item_id);
+CREATE INDEX IF NOT EXISTS idx_dependencies_chapter ON dependencies (chapter_key);
+CREATE INDEX IF NOT EXISTS idx_tasks_chapter ON tasks (chapter_key);
+CREATE INDEX IF NOT EXISTS idx_rewards_chapter ON rewards (chapter_key);
+"""
+
+# Tables holding per-chapter rows, cleared before a changed chapter is re-exported
+CHAPTER_TABLES = ("chapters", "quests", "dependencies", "tasks", "rewards")
+
+# Fields stored in dedicated columns; everything else goes to the JSON 'settings' column.
+# The title/subtitle columns hold the display text (the lang entry when there is one), so
+# the models' own values of those fields are kept in 'settings' too, for a lossless load.
+TEXT_FIELDS = {'title', 'subtitle'}
+CHAPTER_COLUMNS = {'quests', 'id', 'filename', 'title', 'subtitle', 'group', 'order_index', 'tags'}
+QUEST_COLUMNS = {'id', 'title', 'x', 'y', 'dependencies', 'tasks', 'rewards'}
+COMPONENT_COLUMNS = {'id', 'type', 'item', 'count', 'advancement', 'optional_task'}
+COMPONENT_TABLES = ("tasks", "rewards")
+
+
+def _component_row(component: QuestComponent, quest_id: str, chapter_key: str, position: int) -> tuple:
+    item = component.item
+    # Type-specific fields such as a reward's 'xp' amount
+    settings = component.model_dump(mode='json', exclude=COMPONENT_COLUMNS, exclude_none=True)
+    return (
+        component.id, quest_id, chapter_key, position, component.type,
+        item.id if item else None,
+        item.count if item else None,
+        json.dumps(item.components) if item and item.components is not None else None,
+        component.count, component.advancement,
+        int(component.optional_task) if component.optional_task is not None else None,
+        json.dumps(settings) if settings else None,
+    )
+
+
+# (chapter title, chapter subtitle, [quest titles]) as shown to players
+DisplayTexts = Tuple[Optional[str], Optional[str], List[Optional[str]]]
+
+
+def _display_texts(chapter: Chapter, lang_data: Dict[str, Any]) -> DisplayTexts:
+    """Resolve the chapter's and its quests' titles through the lang entries, falling back to the SNBT values."""
+    def text(kind: str, obj: Any, field: str) -> Optional[str]:
+        value = lang_data.get(lang_key(kind, obj.id, field))
+        if isinstance(value, list):
+            value = "\n".join(map(str, value))
+        return value or getattr(obj, field)
+
+    return (
+        text('chapter', chapter, 'title'),
+        text('chapter', chapter, 'subtitle'),
+        [text('quest', quest, 'title') for quest in chapter.quests],
+    )
+
+
+def _chapter_rows(chapter_key: str, chapter: Chapter, texts: DisplayTexts, fingerprint: str) -> Dict[str, List[tuple]]:
+    """Flatten one chapter into rows for every per-chapter table."""
+    rows: Dict[str, List[tuple]] = {table: [] for table in CHAPTER_TABLES}
+    chapter_title, chapter_subtitle, quest_titles = texts
+    settings = chapter.model_dump(mode='json', exclude=CHAPTER_COLUMNS - TEXT_FIELDS)
+    rows["chapters"].append((
+        chapter_key, chapter.id, chapter.filename, chapter_title, chapter_subtitle, chapter.group,
+        chapter.order_index, chapter.icon.id if chapter.icon else None,
+        json.dumps(chapter.tags), json.dumps(settings), fingerprint,
+    ))
+
+    for q_pos, (quest, quest_title) in enumerate(zip(chapter.quests, quest_titles)):
+        quest_settings = quest.model_dump(mode='json', exclude=QUEST_COLUMNS - TEXT_FIELDS)
+        rows["quests"].append((quest.id, chapter_key, q_pos, quest_title, quest.x, quest.y, json.dumps(quest_settings)))
+        rows["dependencies"].extend(
+            (quest.id, dep, chapter_key, d_pos) for d_pos, dep in enumerate(quest.dependencies)
+        )
+        rows["tasks"].extend(
+            _component_row(task, quest.id, chapter_key, t_pos) for t_pos, task in enumerate(quest.tasks)
+        )
+        rows["rewards"].extend(
+            _component_row(reward, quest.id, chapter_key, r_pos) for r_pos, reward in enumerate(quest.rewards)
+        )
+    return rows
+
+
+INSERT_SQL = {
+    "chapters": 'INSERT INTO chapters VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+    "quests": 'INSERT INTO quests VALUES (?, ?, ?, ?, ?, ?, ?)',
+    "dependencies": 'INSERT INTO dependencies VALUES (?, ?, ?, ?)',
+    "tasks": 'INSERT INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+    "rewards": 'INSERT INTO rewards VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+}
+
+
+def _has_column(conn: sqlite3.Connection, table: str, column: str) -> bool:
+    return any(row[1] == column for row in conn.execute(f"PRAGMA table_info({table})"))
+
+
+def _upgrade_schema(conn: sqlite3.Connection) -> bool:
+    """Add the task/reward 'settings' column to databases written before it existed. Returns True if added."""
+    upgraded = False
+    for table in COMPONENT_TABLES:
+        if not _has_column(conn, table, "settings"):
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN settings TEXT")
+            upgraded = True
+    return upgraded
+
+
+def export_to_sqlite(
+    chapters: Dict[str, Chapter],
+    db_path: str,
+    lang_data: Optional[Dict[str, Any]] = None,
+    locale: str = "en_us",
+) -> Dict[str, int]:
+    """
+    Export a quest book into normalized, indexed SQLite tables.
+
+    All writes happen in one transaction using batched executemany calls. Chapters whose
+    content hash matches the one already stored are skipped, and chapters no longer in
+    the book are removed.
+
+    Returns:
+        Counts of chapters 'written', 'skipped' and 'removed'.
+    """
+    stats = {'written': 0, 'skipped': 0, 'removed': 0}
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executescript(SCHEMA)
+        stored = dict(conn.execute("SELECT key, content_hash FROM chapters"))
+        if _upgrade_schema(conn):
+            # Rows written without the column lack the component settings: rewrite every chapter
+            stored = dict.fromkeys(stored)
+
+        pending: Dict[str, List[tuple]] = {table: [] for table in CHAPTER_TABLES}
+        changed_keys = []
+        for chapter_key, chapter in chapters.items():
+            # The stored hash covers the display texts too, so a lang change rewrites the chapter
+            texts = _display_texts(chapter, lang_data or {})
+            fingerprint = content_hash([chapter_hash(chapter), texts])
+            if stored.get(chapter_key) == fingerprint:
+                stats['skipped'] += 1
+                continue
+            changed_keys.append(chapter_key)
+            for table, rows in _chapter_rows(chapter_key, chapter, texts, fingerprint).items():
+                pending[table].extend(rows)
+
+        removed_keys = [key for key in stored if key not in chapters]
+        stats['written'] = len(changed_keys)
+        stats['removed'] = len(removed_keys)
+
+        with conn:
+            stale = [(key,) for key in changed_keys + removed_keys]
+            for table in CHAPTER_TABLES:
+                key_column = "key" if table == "chapters" else "chapter_key"
+                conn.executemany(f"DELETE FROM {table} WHERE {key_column} = ?", stale)
+                conn.executemany(INSERT_SQL[table], pending[table])
+
+            conn.execute("DELETE FROM items")
+            conn.execute(
+                "INSERT OR IGNORE INTO items (id) "
+                "SELECT item_id FROM tasks WHERE item_id IS NOT NULL "
+                "UNION SELECT item_id FROM rewards WHERE item_id IS NOT NULL "
+                "UNION SELECT icon_item_id FROM chapters WHERE icon_item_id IS NOT NULL"
+            )
+
+            if lang_data is not None:
+                conn.execute("DELETE FROM lang WHERE locale = ?", (locale,))
+                conn.executemany(
+                    "INSERT INTO lang (locale, key, value, is_list) VALUES (?, ?, ?, ?)",
+                    (
+                        (locale, key, json.dumps(list(value)) if isinstance(value, list) else str(value), int(isinstance(value, list)))
+                        for key, value in lang_data.items()
+                    ),
+                )
+    finally:
+        conn.close()
+
+    return stats
+
+
+# --- Loading ---
+
+def _connect_readonly(db_path: str) -> sqlite3.Connection:
+    """
+    Open an exported database without write access, so a mistyped path is reported
+    instead of creating an empty database.
+
+    Raises:
+        FileNotFoundError: No file exists at `db_path`.
+        ValueError: The file is not a database written by export_to_sqlite.
+    """
+    if not os.path.isfile(db_path):
+        raise FileNotFoundError(f"SQLite database '{db_path}' does not exist.")
+    conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    except sqlite3.DatabaseError as e:
+        conn.close()
+        raise ValueError(f"'{db_path}' is not a SQLite database: {e}") from e
+    if not {"chapters", "lang"} <= tables:
+        conn.close()
+        raise ValueError(f"'{db_path}' is not a quest book database (written by 'export sqlite').")
+    return conn
+
+
+class SqliteChapterMapping(Mapping):
+    """
+    A read-only Dict[str, Chapter] view over an exported SQLite database.
+
+    Opening it only reads the chapter key list; each chapter's quests, tasks and rewards
+    are queried the first time the chapter is accessed and cached afterwards. The database
+    is opened read-only (see _connect_readonly for the errors raised).
+    """
+
+    def __init__(self, db_path: str):
+        self._conn = _connect_readonly(db_path)
+        self._keys = [row[0] for row in self._conn.execute("SELECT key FROM chapters ORDER BY order_index, key")]
+        self._key_set = set(self._keys)
+        self._cache: Dict[str, Chapter] = {}
+
+    def __getitem__(self, key: str) -> Chapter:
+        if key not in self._cache:
+            chapter = _query_chapter(self._conn, key)
+            if chapter is None:
+                raise KeyError(key)
+            self._cache[key] = chapter
+        return self._cache[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._key_set
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+def _component_dict(row: tuple) -> Dict[str, Any]:
+    """Rebuild a Task/Reward dict from an (id, type, item_id, item_count, ...) row."""
+    component_id, component_type, item_id, item_count, item_components, count, advancement, optional_task, settings = row
+    data: Dict[str, Any] = json.loads(settings) if settings else {}
+    data.update({'id': component_id, 'type': component_type, 'count': count, 'advancement': advancement})
+    if optional_task is not None:
+        data['optional_task'] = bool(optional_task)
+    if item_id is not None:
+        data['item'] = {
+            'id': item_id,
+            'count': item_count,
+            'components': json.loads(item_components) if item_components is not None else None,
+        }
+    return data
+
+
+def _query_components(conn: sqlite3.Connection, table: str, chapter_key: str) -> Dict[str, List[Dict[str, Any]]]:
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    # Databases written before the 'settings' column existed have no component settings
+    settings = "settings" if _has_column(conn, table, "settings") else "NULL"
+    rows = conn.execute(
+        f"SELECT quest_id, id, type, item_id, item_count, item_components, count, advancement, optional_task, {settings} "
+        f"FROM {table} WHERE chapter_key = ? ORDER BY quest_id, position",
+        (chapter_key,),
+    )
+    for quest_id, *component in rows:
+        grouped.setdefault(quest_id, []).append(_component_dict(tuple(component)))
+    return grouped
+
+
+def _query_chapter(conn: sqlite3.Connection, chapter_key: str) -> Optional[Chapter]:
+    """Build one Chapter from its rows, or return None if the key is unknown."""
+    row = conn.execute(
+        'SELECT id, filename, title, subtitle, "group", order_index, tags, settings FROM chapters WHERE key = ?',
+        (chapter_key,),
+    ).fetchone()
+    if row is None:
+        return None
+    chapter_id, filename, title, subtitle, group, order_index, tags, settings = row
+
+    dependencies: Dict[str, List[str]] = {}
+    for quest_id, dependency_id in conn.execute(
+        "SELECT quest_id, dependency_id FROM dependencies WHERE chapter_key = ? ORDER BY quest_id, position",
+        (chapter_key,),
+    ):
+        dependencies.setdefault(quest_id, []).append(dependency_id)
+    tasks = _query_components(conn, "tasks", chapter_key)
+    rewards = _query_components(conn, "rewards", chapter_key)
+
+    quests = []
+    for quest_id, quest_title, x, y, quest_settings in conn.execute(
+        "SELECT id, title, x, y, settings FROM quests WHERE chapter_key = ? ORDER BY position",
+        (chapter_key,),
+    ):
+        quest = json.loads(quest_settings) if quest_settings else {}
+        # The SNBT title is in the settings; older databases only have the title column
+        quest.setdefault('title', quest_title)
+        quest.update({
+            'id': quest_id, 'x': x, 'y': y,
+            'dependencies': dependencies.get(quest_id, []),
+            'tasks': tasks.get(quest_id, []),
+            'rewards': rewards.get(quest_id, []),
+        })
+        quests.append(quest)
+
+    chapter = json.loads(settings) if settings else {}
+    chapter.setdefault('title', title)
+    chapter.setdefault('subtitle', subtitle)
+    chapter.update({
+        'id': chapter_id, 'filename': filename, 'group': group,
+        'order_index': order_index, 'tags': json.loads(tags) if tags else [], 'quests': quests,
+    })
+    return Chapter.model_validate(chapter)
+
+
+def load_chapters_from_sqlite(db_path: str, lazy: bool = True) -> Mapping:
+    """
+    Load a quest book from a database written by export_to_sqlite.
+
+    With lazy=True (default) a SqliteChapterMapping is returned and chapters are fetched
+    on first access; otherwise every chapter is read up front into a plain dict.
+    """
+    chapters = SqliteChapterMapping(db_path)
+    if lazy:
+        return chapters
+    try:
+        return {key: chapters[key] for key in chapters}
+    finally:
+        chapters.close()
+
+
+def load_language_from_sqlite(db_path: str, locale: str = "en_us") -> Dict[str, Any]:
+    """Load the lang strings stored for one locale (read-only; see _connect_readonly for the errors raised)."""
+    conn = _connect_readonly(db_path)
+    try:
+        return {
+            key: json.loads(value) if is_list else value
+            for key, value, is_list in conn.execute("SELECT key, value, is_list FROM lang WHERE locale = ?", (locale,))
+        }
+    finally:
+        conn.close()
@@ -0,0 +1,92 @@
+from collections import Counter
+from typing import Any, Dict, List
+
+from ..model.quest_models import Chapter, Quest
+
+# Quest visibility flags counted by book_stats (every 'hide_*' field of the Quest model)
+HIDE_FLAGS: List[str] = [name for name in Quest.model_fields if name.startswith('hide_')]
+
+
+def _new_totals() -> Dict[str, Any]:
+    return {
+        'quests': 0,
+        'tasks': Counter(),
+        'rewards': Counter(),
+        'optional_tasks': 0,
+        'hidden': Counter(),
+        'fan_out': Counter(),
+        'fan_in': Counter(),
+    }
+
+
+def _finish(totals: Dict[str, Any]) -> Dict[str, Any]:
+    finished = {
+        'quests': totals['quests'],
+        'tasks': dict(totals['tasks'].most_common()),
+        'task_count': sum(totals['tasks'].values()),
+        'optional_tasks': totals['optional_tasks'],
+        'rewards': dict(totals['rewards'].most_common()),
+        'reward_count': sum(totals['rewards'].values()),
+        'hidden': {flag: totals['hidden'][flag] for flag in HIDE_FLAGS},
+        'fan_out': dict(sorted(totals['fan_out'].items())),
+        'fan_in': dict(sorted(totals['fan_in'].items())),
+    }
+    if 'extent' in totals:
+        extent = totals['extent']
+        finished['extent'] = dict(zip(('min_x', 'min_y', 'max_x', 'max_y'), extent)) if extent else None
+    return finished
+
+
+def book_stats(chapters: Dict[str, Chapter]) -> Dict[str, Any]:
+    """
+    Per-chapter and overall statistics, gathered in one pass over the quests.
+
+    Counts tasks and rewards by type, optional tasks and quests with each 'hide_*' flag.
+    It also gives dependency fan-out (dependencies per quest) and fan-in (dependents per
+    quest) distributions, as {links: quests}. Fan-in counts dependents from any chapter
+    and is attributed to the chapter of the quest depended on. Coordinate extents are
+    per chapter only, since every chapter has its own coordinate space.
+
+    Returns:
+        {'overall': totals, 'chapters': {key: totals}}
+    """
+    per_chapter: Dict[str, Dict[str, Any]] = {}
+    dependents: Counter = Counter()
+    quest_chapter: Dict[str, str] = {}
+
+    for key, chapter in chapters.items():
+        totals = per_chapter[key] = _new_totals()
+        tasks, rewards, hidden, fan_out = totals['tasks'], totals['rewards'], totals['hidden'], totals['fan_out']
+        min_x = min_y = float('inf')
+        max_x = max_y = float('-inf')
+        for quest in chapter.quests:
+            quest_chapter.setdefault(quest.id, key)
+            for task in quest.tasks:
+                tasks[task.type] += 1
+                if task.optional_task:
+                    totals['optional_tasks'] += 1
+            for reward in quest.rewards:
+                rewards[reward.type] += 1
+            for flag in HIDE_FLAGS:
+                if getattr(quest, flag):
+                    hidden[flag] += 1
+            deps = set(quest.dependencies)
+            fan_out[len(deps)] += 1
+            dependents.update(deps)
+            min_x, max_x = min(min_x, quest.x), max(max_x, quest.x)
+            min_y, max_y = min(min_y, quest.y), max(max_y, quest.y)
+        totals['quests'] = len(chapter.quests)
+        totals['extent'] = [min_x, min_y, max_x, max_y] if chapter.quests else None
+
+    # Fan-in is only known once every dependency has been seen
+    for quest_id, key in quest_chapter.items():
+        per_chapter[key]['fan_in'][dependents[quest_id]] += 1
+
+    overall = _new_totals()
+    for totals in per_chapter.values():
+        overall['quests'] += totals['quests']
+        overall['optional_tasks'] += totals['optional_tasks']
+        for field in ('tasks', 'rewards', 'hidden', 'fan_out', 'fan_in'):
+            overall[field].update(totals[field])
+
+    return {'overall': _finish(overall), 'chapters': {key: _finish(totals) for key, totals in per_chapter.items()}}
@@ -0,0 +1,121 @@
+import math
+from typing import Iterable, Optional, Tuple
+
+from ..model.quest_models import Chapter
+from .quest_edit import edit_quest_position
+
+# An affine matrix stored row-major as (a, b, c, d, e, f):
+#   x' = a*x + b*y + c
+#   y' = d*x + e*y + f
+Affine = Tuple[float, float, float, float, float, float]
+
+IDENTITY: Affine = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+
+
+def _compose(outer: Affine, inner: Affine) -> Affine:
+    """Return the matrix that applies `inner` first and then `outer`."""
+    a1, b1, c1, d1, e1, f1 = outer
+    a2, b2, c2, d2, e2, f2 = inner
+    return (
+        a1 * a2 + b1 * d2, a1 * b2 + b1 * e2, a1 * c2 + b1 * f2 + c1,
+        d1 * a2 + e1 * d2, d1 * b2 + e1 * e2, d1 * c2 + e1 * f2 + f1,
+    )
+
+
+def build_affine(
+    translate: Tuple[float, float] = (0.0, 0.0),
+    scale: Tuple[float, float] = (1.0, 1.0),
+    rotate: float = 0.0,
+    origin: Tuple[float, float] = (0.0, 0.0),
+) -> Affine:
+    """
+    Compose scale, rotation (degrees, counter-clockwise) and translation into one matrix.
+    Scale and rotation are applied around `origin`; translation is applied last.
+    """
+    ox, oy = origin
+    theta = math.radians(rotate)
+    cos_t, sin_t = math.cos(theta), math.sin(theta)
+
+    matrix = (1.0, 0.0, -ox, 0.0, 1.0, -oy)
+    matrix = _compose((scale[0], 0.0, 0.0, 0.0, scale[1], 0.0), matrix)
+    matrix = _compose((cos_t, -sin_t, 0.0, sin_t, cos_t, 0.0), matrix)
+    matrix = _compose((1.0, 0.0, ox + translate[0], 0.0, 1.0, oy + translate[1]), matrix)
+    return matrix
+
+
+def select_quests(
+    chapter: Chapter,
+    quest_ids: Optional[Iterable[str]] = None,
+    bbox: Optional[Tuple[float, float, float, float]] = None,
+) -> set:
+    """
+    Return the set of quest IDs matched by the selection.
+    With no `quest_ids` and no `bbox` the whole chapter is selected; otherwise a quest must
+    satisfy every filter given. `bbox` is (min_x, min_y, max_x, max_y), inclusive.
+    """
+    wanted = set(quest_ids) if quest_ids is not None else None
+    if bbox is not None:
+        min_x, min_y, max_x, max_y = bbox
+    selected = set()
+    for quest in chapter.quests:
+        if wanted is not None and quest.id not in wanted:
+            continue
+        if bbox is not None and not (min_x <= quest.x <= max_x and min_y <= quest.y <= max_y):
+            continue
+        selected.add(quest.id)
+    return selected
+
+
+def _snap(value: float, grid: float) -> float:
+    return round(value / grid) * grid
+
+
+def transform_quest_positions(
+    chapter: Chapter,
+    quest_ids: Optional[Iterable[str]] = None,
+    bbox: Optional[Tuple[float, float, float, float]] = None,
+    translate: Tuple[float, float] = (0.0, 0.0),
+    scale: Tuple[float, float] = (1.0, 1.0),
+    rotate: float = 0.0,
+    snap: Optional[float] = None,
+    origin: Optional[Tuple[float, float]] = None,
+) -> Chapter:
+    """
+    Apply translate/scale/rotate and optional grid snapping to a selection of quests.
+
+    The operations are folded into a single affine matrix and applied to every selected
+    quest in one pass, producing exactly one new Chapter. Scale and rotation pivot on
+    `origin`, which defaults to the centre of the selection's bounding box.
+
+    Args:
+        chapter: The chapter to transform (left unmodified).
+        quest_ids: Restrict the selection to these quest IDs.
+        bbox: Restrict the selection to quests inside (min_x, min_y, max_x, max_y).
+        translate: Offset (dx, dy) applied after scale and rotation.
+        scale: Scale factors (sx, sy).
+        rotate: Rotation in degrees, counter-clockwise.
+        snap: Grid size to round the resulting coordinates to (None or 0 disables).
+        origin: Pivot for scale and rotation.
+    """
+    selected = select_quests(chapter, quest_ids, bbox)
+    if not selected:
+        return chapter
+
+    if origin is None:
+        xs = [q.x for q in chapter.quests if q.id in selected]
+        ys = [q.y for q in chapter.quests if q.id in selected]
+        origin = ((min(xs) + max(xs)) / 2, (min(ys) + max(ys)) / 2)
+
+    a, b, c, d, e, f = build_affine(translate, scale, rotate, origin)
+
+    updated_quests = []
+    for quest in chapter.quests:
+        if quest.id in selected:
+            new_x = a * quest.x + b * quest.y + c
+            new_y = d * quest.x + e * quest.y + f
+            if snap:
+                new_x, new_y = _snap(new_x, snap), _snap(new_y, snap)
+            quest = edit_quest_position(quest, new_x, new_y)
+        updated_quests.append(quest)
+
+    return chapter.model_copy(update={'quests': updated_quests})
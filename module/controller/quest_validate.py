@@ -0,0 +1,152 @@
+from collections import Counter
+from typing import Dict, List, Optional, Set
+
+from pydantic import ValidationError
+
+from ..model.quest_models import Chapter, Quest, Task, Reward
+from .quest_lint import Diagnostic
+
+
+def _invalid(code: str, chapter_key: Optional[str], object_id: str, error: ValidationError) -> Diagnostic:
+    return Diagnostic(
+        code=code, severity='error', chapter=chapter_key, object_id=object_id,
+        message=f"{object_id} failed validation: {error.error_count()} error(s): "
+                + "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in error.errors()),
+    )
+
+
+def validate_quest_subtree(quest: Quest, previous: Optional[Quest] = None, chapter_key: Optional[str] = None) -> List[Diagnostic]:
+    """
+    Re-validate one quest. With `previous` given, tasks and rewards that are the very
+    same objects as before are skipped, so only the edited parts are checked.
+    """
+    diagnostics = []
+    try:
+        Quest.model_validate(quest.model_dump(exclude={'tasks', 'rewards'}, warnings=False))
+    except ValidationError as e:
+        diagnostics.append(_invalid('invalid-quest', chapter_key, quest.id, e))
+
+    for name, model, code in (('tasks', Task, 'invalid-task'), ('rewards', Reward, 'invalid-reward')):
+        unchanged = {id(c) for c in getattr(previous, name)} if previous is not None else set()
+        for component in getattr(quest, name):
+            if id(component) in unchanged:
+                continue
+            try:
+                model.model_validate(component.model_dump(warnings=False))
+            except ValidationError as e:
+                diagnostics.append(_invalid(code, chapter_key, component.id, e))
+    return diagnostics
+
+
+def _component_ids(quest: Quest) -> List[str]:
+    return [quest.id] + [c.id for c in quest.tasks] + [c.id for c in quest.rewards]
+
+
+class IncrementalValidator:
+    """
+    Keeps a book-wide index of IDs and dependency edges so an edit can be validated at
+    O(edit size) instead of re-validating whole chapters.
+
+    Build it once over the book, then call apply() with each edited chapter. Changed
+    quests are found by object identity (the quest_edit functions reuse every untouched
+    Quest/Task/Reward object), so only copied subtrees are re-validated and only the
+    dependencies into and out of the changed quests are re-checked.
+    """
+
+    def __init__(self, chapters: Dict[str, Chapter]):
+        self.chapters: Dict[str, Chapter] = {}
+        self._quest_chapter: Dict[str, str] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        self._id_counts: Counter = Counter()
+        for chapter_key, chapter in chapters.items():
+            self.chapters[chapter_key] = chapter
+            for quest in chapter.quests:
+                self._index(chapter_key, quest)
+
+    # --- Index maintenance ---
+
+    def _index(self, chapter_key: str, quest: Quest) -> None:
+        self._quest_chapter[quest.id] = chapter_key
+        self._id_counts.update(_component_ids(quest))
+        for dep in quest.dependencies:
+            self._dependents.setdefault(dep, set()).add(quest.id)
+
+    def _unindex(self, quest: Quest) -> None:
+        self._id_counts.subtract(_component_ids(quest))
+        for object_id in _component_ids(quest):
+            if self._id_counts[object_id] <= 0:
+                del self._id_counts[object_id]
+        if self._id_counts.get(quest.id, 0) == 0:
+            self._quest_chapter.pop(quest.id, None)
+        for dep in quest.dependencies:
+            dependents = self._dependents.get(dep)
+            if dependents is not None:
+                dependents.discard(quest.id)
+                if not dependents:
+                    del self._dependents[dep]
+
+    # --- Validation ---
+
+    def apply(self, chapter_key: str, new_chapter: Optional[Chapter]) -> List[Diagnostic]:
+        """
+        Record an edited chapter (None removes it) and return diagnostics for the edit.
+        """
+        old_chapter = self.chapters.get(chapter_key)
+        old_quests = old_chapter.quests if old_chapter else []
+        new_quests = new_chapter.quests if new_chapter else []
+
+        old_ids = {id(q) for q in old_quests}
+        new_ids = {id(q) for q in new_quests}
+        removed = [q for q in old_quests if id(q) not in new_ids]
+        changed = [q for q in new_quests if id(q) not in old_ids]
+        previous = {q.id: q for q in removed}
+
+        diagnostics: List[Diagnostic] = []
+        if new_chapter is not None and (old_chapter is None or old_chapter.model_dump(exclude={'quests'}, warnings=False)
+                                        != new_chapter.model_dump(exclude={'quests'}, warnings=False)):
+            try:
+                Chapter.model_validate({**new_chapter.model_dump(exclude={'quests'}, warnings=False), 'quests': []})
+            except ValidationError as e:
+                diagnostics.append(_invalid('invalid-chapter', chapter_key, new_chapter.id, e))
+
+        for quest in changed:
+            diagnostics.extend(validate_quest_subtree(quest, previous.get(quest.id), chapter_key))
+
+        for quest in removed:
+            self._unindex(quest)
+        for quest in changed:
+            self._index(chapter_key, quest)
+
+        if new_chapter is None:
+            self.chapters.pop(chapter_key, None)
+        else:
+            self.chapters[chapter_key] = new_chapter
+
+        # Dependencies out of the changed quests
+        for quest in changed:
+            for dep in quest.dependencies:
+                if dep not in self._quest_chapter:
+                    diagnostics.append(Diagnostic(
+                        code='missing-dependency', severity='error', chapter=chapter_key, object_id=quest.id,
+                        message=f"Quest {quest.id} depends on missing quest {dep}.",
+                    ))
+
+        # Dependencies into quests that no longer exist
+        gone = {q.id for q in removed} - set(self._quest_chapter)
+        for quest_id in sorted(gone):
+            for dependent in sorted(self._dependents.get(quest_id, ())):
+                diagnostics.append(Diagnostic(
+                    code='missing-dependency', severity='error', chapter=self._quest_chapter.get(dependent),
+                    object_id=dependent, message=f"Quest {dependent} depends on missing quest {quest_id}.",
+                ))
+
+        # IDs introduced by the edit must stay unique across the book
+        for quest in changed:
+            for object_id in _component_ids(quest):
+                if self._id_counts[object_id] > 1:
+                    diagnostics.append(Diagnostic(
+                        code='duplicate-id', severity='error', chapter=chapter_key, object_id=object_id,
+                        message=f"ID {object_id} is defined {self._id_counts[object_id]} times.",
+                    ))
+
+        return diagnostics
@@ -1,13 +1,61 @@
+import weakref
 from pydantic import BaseModel, Field, ValidationError
 from typing import List, Optional, Dict, Any, Union
 
+class TrackedModel(BaseModel):
+    """
+    Base for models that report attribute assignment to the models containing them.
+    Containers register themselves (weakly, in a plain slot) when they hash their
+    children, so assigning a field anywhere clears every cached hash above it.
+    """
+    __slots__ = ('_parents',)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self._changed()
+
+    def _changed(self) -> None:
+        parents = getattr(self, '_parents', None)
+        for ref in list(parents.values()) if parents else ():
+            parent = ref()
+            if parent is not None:
+                parent._changed()
+
+    def _add_parent(self, parent: "TrackedModel") -> None:
+        # Models are unhashable (they define __eq__), so weak references are keyed by id()
+        try:
+            # Read the slot directly: a missing attribute would go through pydantic's slow __getattr__
+            parents = _PARENTS_SLOT.__get__(self)
+        except AttributeError:
+            parents = {}
+            _PARENTS_SLOT.__set__(self, parents)
+        ref = parents.get(id(parent))
+        if ref is None or ref() is not parent:  # ids of dead parents can be reused
+            parents[id(parent)] = weakref.ref(parent)
+
+_PARENTS_SLOT = TrackedModel.__dict__['_parents']
+
+class FingerprintedModel(TrackedModel):
+    """
+    Base for models that carry a cached canonical content hash (see controller/quest_hash.py).
+    The cache lives in a plain slot, so it is ignored by equality and dropped by every
+    model_copy, deepcopy or pickle round trip. It is cleared when a field of the model, or
+    of any model inside it, is assigned. Lists and dicts are not watched: change them by
+    assigning a new value (or with the quest_edit functions), not in place.
+    """
+    __slots__ = ('_fingerprint',)
+
+    def _changed(self) -> None:
+        object.__setattr__(self, '_fingerprint', None)
+        super()._changed()
+
 # For rewards, tasks, etc
-class Item(BaseModel):
+class Item(TrackedModel):
     id: str
     count: Optional[int] = 1
     components: Optional[Dict[str, Any]] = None
 
-class QuestComponent(BaseModel):
+class QuestComponent(FingerprintedModel):
     id: str
     type: str
     # 'item' will hold the Item model if type is 'item'
@@ -21,9 +69,11 @@ class Task(QuestComponent):
     pass
 
 class Reward(QuestComponent):
-    pass
+    # Amounts of 'xp' and 'xp_levels' rewards
+    xp: Optional[int] = None
+    xp_levels: Optional[int] = None
 
-class Quest(BaseModel):
+class Quest(FingerprintedModel):
     id: str
     title: Optional[str] = None
     x: float
@@ -40,7 +90,7 @@ class Quest(BaseModel):
     hide_until_deps_complete: Optional[bool] = False
     hide_until_deps_visible: Optional[bool] = False
 
-class Chapter(BaseModel):
+class Chapter(FingerprintedModel):
     title: Optional[str] = None
     subtitle: Optional[str] = None
 
@@ -0,0 +1,43 @@
+from colorama import Fore, Style
+from typing import Any, Dict
+from .render import Screen, write_screen
+
+# Styling Constants
+HEADER_STYLE = Fore.YELLOW + Style.BRIGHT
+ERROR_STYLE = Fore.RED
+WARNING_STYLE = Fore.YELLOW
+
+
+def display_batch_report(report: Dict[str, Any], top_items: int = 10) -> None:
+    """Display the aggregated report produced by batch_analyze."""
+    screen = Screen()
+    screen.add("\n" + Fore.CYAN + "="*50)
+    screen.add(HEADER_STYLE + "BATCH REPORT")
+    screen.add(Fore.CYAN + "="*50)
+
+    for result in report['instances']:
+        if 'error' in result:
+            screen.add(f"{ERROR_STYLE}FAILED{Style.RESET_ALL} {result['root']}: {result['error']}")
+            continue
+        screen.add(
+            f"{Fore.GREEN}{result['root']}{Style.RESET_ALL}: {result['chapters']} chapter(s), "
+            f"{result['quests']} quest(s), {ERROR_STYLE}{result['errors']} error(s){Style.RESET_ALL}, "
+            f"{WARNING_STYLE}{result['warnings']} warning(s)"
+        )
+        for message in result['load_errors']:
+            screen.add(f"  {WARNING_STYLE}{message.splitlines()[0]}")
+
+    totals = report['totals']
+    screen.add("\n" + HEADER_STYLE + "Totals")
+    screen.add(f"  Instances: {totals['loaded']} loaded, {totals['failed']} failed")
+    screen.add(f"  Chapters: {totals['chapters']}  Quests: {totals['quests']}  Tasks: {totals['tasks']}  Rewards: {totals['rewards']}")
+    screen.add(f"  Lint: {totals['errors']} error(s), {totals['warnings']} warning(s)")
+    for code, count in report['diagnostics'].items():
+        screen.add(f"    {Fore.LIGHTBLACK_EX}{code}{Style.RESET_ALL}: {count}")
+
+    if report['items']:
+        screen.add("\n" + HEADER_STYLE + f"Top {min(top_items, len(report['items']))} Items")
+        for item_id, usage in list(report['items'].items())[:top_items]:
+            screen.add(f"  {Fore.CYAN}{item_id}{Style.RESET_ALL}: {usage['uses']} use(s) in {usage['instances']} instance(s)")
+
+    write_screen(screen)
@@ -0,0 +1,38 @@
+from colorama import Fore, Style
+from typing import Any, Dict
+from .render import Screen, write_screen
+
+# Styling Constants
+HEADER_STYLE = Fore.YELLOW + Style.BRIGHT
+KEY_STYLE = Fore.CYAN
+WARNING_STYLE = Fore.YELLOW
+DETAIL_STYLE = Fore.LIGHTBLACK_EX
+
+
+def display_chapter_graph(report: Dict[str, Any]) -> None:
+    """Display the chapter dependency graph produced by ChapterGraph.report."""
+    screen = Screen()
+    screen.add("\n" + Fore.CYAN + "="*50)
+    screen.add(HEADER_STYLE + "CHAPTER DEPENDENCIES")
+    screen.add(Fore.CYAN + "="*50)
+
+    for edge in report['edges']:
+        screen.add(f"{KEY_STYLE}{edge['from']}{Style.RESET_ALL} -> {KEY_STYLE}{edge['to']}{Style.RESET_ALL} ({edge['links']} link(s))")
+    if not report['edges']:
+        screen.add("No cross-chapter dependencies.")
+
+    screen.add("\n" + HEADER_STYLE + "Dependency Order")
+    for i, entry in enumerate(report['order']):
+        group = entry['group'] or "[no group]"
+        screen.add(f"[{DETAIL_STYLE}{i}{Style.RESET_ALL}] {KEY_STYLE}{entry['key']}{Style.RESET_ALL} {DETAIL_STYLE}{group}, order_index {entry['order_index']}")
+    if report['cyclic']:
+        screen.add(WARNING_STYLE + "Chapters in dependency cycles: " + ", ".join(report['cyclic']))
+
+    if report['out_of_order']:
+        screen.add("\n" + WARNING_STYLE + "Listed before their prerequisites (same group, lower order_index):")
+        for edge in report['out_of_order']:
+            screen.add(f"  {edge['to']} depends on {edge['from']} ({edge['links']} link(s))")
+    if report['cross_group']:
+        screen.add("\n" + DETAIL_STYLE + f"{len(report['cross_group'])} edge(s) cross chapter groups.")
+
+    write_screen(screen)
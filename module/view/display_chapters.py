@@ -1,8 +1,7 @@
-from colorama import init, Fore, Style
+from colorama import Fore, Style
 from typing import Dict
 from ..model.quest_models import Chapter
-
-init(autoreset=True)
+from .render import Screen, write_screen
 
 # Styling Constants
 TITLE_STYLE = Fore.YELLOW
@@ -10,15 +9,24 @@ GROUP_STYLE = Fore.LIGHTBLACK_EX
 ID_STYLE = Fore.CYAN
 INDEX_STYLE = Fore.LIGHTBLACK_EX
 
-def display_chapters(data: Dict[str, Chapter]) -> None:
-    """Display the list of chapters."""
-    print("\n" + Fore.CYAN + "="*40)
-    print(Fore.YELLOW + "CHAPTERS")
-    print(Fore.CYAN + "="*40)
+def _chapters_screen(data: Dict[str, Chapter]) -> Screen:
+    screen = Screen()
+    screen.add("\n" + Fore.CYAN + "="*40)
+    screen.add(Fore.YELLOW + "CHAPTERS")
+    screen.add(Fore.CYAN + "="*40)
 
     chapter_keys = sorted(data.keys())
     for i, key in enumerate(chapter_keys):
         group_name = data[key].group if data[key].group else "[no group]"
         quest_count = len(data[key].quests)
         info_text = f"{GROUP_STYLE}{group_name}{Style.RESET_ALL} ({quest_count})"
-        print(f"[{INDEX_STYLE}{i}{Style.RESET_ALL}] {TITLE_STYLE}{key.upper()}{Style.RESET_ALL} {info_text}")
\ No newline at end of file
+        screen.add(f"[{INDEX_STYLE}{i}{Style.RESET_ALL}] {TITLE_STYLE}{key.upper()}{Style.RESET_ALL} {info_text}")
+    return screen
+
+def render_chapters(data: Dict[str, Chapter], color: bool = True) -> str:
+    """Render the list of chapters to a string."""
+    return _chapters_screen(data).render(color)
+
+def display_chapters(data: Dict[str, Chapter]) -> None:
+    """Display the list of chapters."""
+    write_screen(_chapters_screen(data))
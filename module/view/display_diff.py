@@ -0,0 +1,66 @@
+from colorama import Fore, Style
+from typing import Any, Dict
+from .render import Screen, write_screen
+
+# Styling Constants
+ADDED_STYLE = Fore.GREEN
+REMOVED_STYLE = Fore.RED
+MODIFIED_STYLE = Fore.YELLOW
+ID_STYLE = Fore.LIGHTBLACK_EX
+
+
+def _quest_label(entry: Dict[str, Any]) -> str:
+    title = f" {entry['title']}" if entry.get('title') else ""
+    return f"{ID_STYLE}{entry['id']}{Style.RESET_ALL}{title} [{entry['chapter']}]"
+
+
+def display_diff_report(report: Dict[str, Any]) -> None:
+    """Display a changelog produced by diff_books."""
+    screen = Screen()
+    summary = report['summary']
+    screen.add("\n" + Fore.CYAN + "="*50)
+    screen.add(Fore.YELLOW + Style.BRIGHT + "QUEST BOOK DIFF")
+    screen.add(
+        f"Chapters: +{summary['chapters_added']} -{summary['chapters_removed']} ~{summary['chapters_modified']} | "
+        f"Quests: +{summary['quests_added']} -{summary['quests_removed']} ~{summary['quests_modified']}"
+    )
+    screen.add(Fore.CYAN + "="*50)
+
+    chapters = report['chapters']
+    for key in chapters['added']:
+        screen.add(ADDED_STYLE + f"+ chapter {key}")
+    for key in chapters['removed']:
+        screen.add(REMOVED_STYLE + f"- chapter {key}")
+    for key, fields in chapters['modified'].items():
+        screen.add(MODIFIED_STYLE + f"~ chapter {key}")
+        for field, (old, new) in fields.items():
+            screen.add(f"    {field}: {old!r} -> {new!r}")
+
+    quests = report['quests']
+    for entry in quests['added']:
+        screen.add(f"{ADDED_STYLE}+ quest{Style.RESET_ALL} {_quest_label(entry)}")
+    for entry in quests['removed']:
+        screen.add(f"{REMOVED_STYLE}- quest{Style.RESET_ALL} {_quest_label(entry)}")
+    for entry in quests['modified']:
+        moved = f" (moved from {entry['moved_from']})" if entry.get('moved_from') else ""
+        screen.add(f"{MODIFIED_STYLE}~ quest{Style.RESET_ALL} {_quest_label(entry)}{moved}")
+        for field, (old, new) in entry['fields'].items():
+            screen.add(f"    {field}: {old!r} -> {new!r}")
+        for name in ('tasks', 'rewards'):
+            changes = entry.get(name)
+            if not changes:
+                continue
+            label = name[:-1]
+            for component_id in changes['added']:
+                screen.add(ADDED_STYLE + f"    + {label} {component_id}")
+            for component_id in changes['removed']:
+                screen.add(REMOVED_STYLE + f"    - {label} {component_id}")
+            for component_id, fields in changes['modified'].items():
+                screen.add(MODIFIED_STYLE + f"    ~ {label} {component_id}")
+                for field, (old, new) in fields.items():
+                    screen.add(f"        {field}: {old!r} -> {new!r}")
+
+    if not any(summary.values()):
+        screen.add("No differences found.")
+
+    write_screen(screen)
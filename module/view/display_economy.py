@@ -0,0 +1,49 @@
+from colorama import Fore, Style
+from typing import Any, Dict, Optional
+from .render import Screen, write_screen
+
+# Styling Constants
+HEADER_STYLE = Fore.YELLOW + Style.BRIGHT
+ITEM_STYLE = Fore.CYAN
+SURPLUS_STYLE = Fore.GREEN
+DEFICIT_STYLE = Fore.RED
+DETAIL_STYLE = Fore.LIGHTBLACK_EX
+
+
+def display_economy_report(report: Dict[str, Any], top_items: Optional[int] = 20, breakdown: bool = False) -> None:
+    """
+    Display the reward economy produced by economy_report.
+    With `breakdown`, each listed item also shows the chapters and groups that give it out.
+    """
+    screen = Screen()
+    screen.add("\n" + Fore.CYAN + "="*50)
+    screen.add(HEADER_STYLE + "REWARD ECONOMY")
+    screen.add(Fore.CYAN + "="*50)
+
+    xp = report['xp']
+    screen.add(f"XP: {xp['xp']} points, {xp['xp_levels']} levels")
+    screen.add("Reward types: " + ", ".join(f"{kind} ({count})" for kind, count in report['reward_types'].items()))
+
+    items = list(report['items'].items())
+    shown = items if top_items is None else items[:top_items]
+    screen.add("\n" + HEADER_STYLE + f"Items ({len(shown)} of {len(items)}): given / required by tasks")
+    for item_id, stats in shown:
+        style = SURPLUS_STYLE if stats['balance'] >= 0 else DEFICIT_STYLE
+        screen.add(
+            f"  {ITEM_STYLE}{item_id}{Style.RESET_ALL}: {stats['given']} / {stats['required']} "
+            f"({style}{stats['balance']:+d}{Style.RESET_ALL}) in {stats['rewards']} reward(s), {stats['tasks']} task(s)"
+        )
+        if breakdown:
+            for chapter_key, amount in stats['chapters'].items():
+                screen.add(f"    {DETAIL_STYLE}chapter{Style.RESET_ALL} {chapter_key}: {amount}")
+            for group, amount in stats['groups'].items():
+                screen.add(f"    {DETAIL_STYLE}group{Style.RESET_ALL} {group or '[no group]'}: {amount}")
+
+    screen.add("\n" + HEADER_STYLE + "Groups")
+    for group, totals in report['groups'].items():
+        screen.add(
+            f"  {group or '[no group]'}: {totals.get('rewards', 0)} reward(s), {totals.get('items_given', 0)} item(s) given, "
+            f"{totals.get('items_required', 0)} required, {totals.get('xp', 0)} XP, {totals.get('xp_levels', 0)} level(s)"
+        )
+
+    write_screen(screen)
@@ -0,0 +1,42 @@
+from colorama import Fore, Style
+from typing import Any, Dict
+from .render import Screen, write_screen
+
+# Styling Constants
+LOCALE_STYLE = Fore.YELLOW + Style.BRIGHT
+GOOD_STYLE = Fore.GREEN
+BAD_STYLE = Fore.RED
+KEY_STYLE = Fore.LIGHTBLACK_EX
+
+
+def display_lang_coverage(report: Dict[str, Any], show_keys: bool = False) -> None:
+    """Display a translation coverage report produced by lang_coverage."""
+    screen = Screen()
+    screen.add("\n" + Fore.CYAN + "="*50)
+    if 'error' in report:
+        screen.add(Fore.YELLOW + Style.BRIGHT + f"TRANSLATION COVERAGE (reference: {report['reference']})")
+        screen.add(Fore.CYAN + "="*50)
+        screen.add(f"{BAD_STYLE}ERROR{Style.RESET_ALL} reference locale {report['reference']} could not be loaded: {report['error']}")
+        write_screen(screen)
+        return
+    screen.add(Fore.YELLOW + Style.BRIGHT + f"TRANSLATION COVERAGE (reference: {report['reference']}, {report['needed']} keys)")
+    screen.add(Fore.CYAN + "="*50)
+
+    for locale, stats in report['locales'].items():
+        if 'error' in stats:
+            screen.add(f"{LOCALE_STYLE}{locale}{Style.RESET_ALL} {BAD_STYLE}ERROR{Style.RESET_ALL} could not be loaded: {stats['error']}")
+            continue
+        style = GOOD_STYLE if stats['coverage'] >= 100.0 else BAD_STYLE
+        screen.add(
+            f"{LOCALE_STYLE}{locale}{Style.RESET_ALL} {style}{stats['coverage']}%{Style.RESET_ALL} "
+            f"| missing: {len(stats['missing'])} | orphaned: {len(stats['orphaned'])} | identical: {len(stats['identical'])}"
+        )
+        for chapter_key, percent in stats['chapters'].items():
+            if percent < 100.0:
+                screen.add(f"    {chapter_key}: {percent}%")
+        if show_keys:
+            for label in ('missing', 'orphaned', 'identical'):
+                for key in stats[label]:
+                    screen.add(f"    {label}: {KEY_STYLE}{key}")
+
+    write_screen(screen)
@@ -0,0 +1,27 @@
+from colorama import Fore, Style
+from typing import List
+
+from ..controller.quest_lint import Diagnostic
+from .render import Screen, write_screen
+
+# Styling Constants
+SEVERITY_STYLES = {'error': Fore.RED, 'warning': Fore.YELLOW}
+CODE_STYLE = Fore.LIGHTBLACK_EX
+
+
+def display_lint_report(diagnostics: List[Diagnostic]) -> None:
+    """Display lint diagnostics, one per line, followed by a summary."""
+    screen = Screen()
+    screen.add("\n" + Fore.CYAN + "="*50)
+    screen.add(Fore.YELLOW + Style.BRIGHT + "LINT REPORT")
+    screen.add(Fore.CYAN + "="*50)
+
+    for d in diagnostics:
+        style = SEVERITY_STYLES.get(d.severity, "")
+        location = f"[{d.chapter}] " if d.chapter else ""
+        screen.add(f"{style}{d.severity.upper()}{Style.RESET_ALL} {CODE_STYLE}{d.code}{Style.RESET_ALL} {location}{d.message}")
+
+    errors = sum(1 for d in diagnostics if d.severity == 'error')
+    screen.add(f"\n{errors} error(s), {len(diagnostics) - errors} warning(s).")
+
+    write_screen(screen)
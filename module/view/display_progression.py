@@ -0,0 +1,46 @@
+from colorama import Fore, Style
+from typing import Any, Dict
+from .render import Screen, write_screen
+
+# Styling Constants
+HEADER_STYLE = Fore.YELLOW + Style.BRIGHT
+ID_STYLE = Fore.CYAN
+BAR_STYLE = Fore.GREEN
+WARNING_STYLE = Fore.YELLOW
+DETAIL_STYLE = Fore.LIGHTBLACK_EX
+
+# Widest histogram bar, in characters
+BAR_WIDTH = 40
+
+
+def display_progression_report(report: Dict[str, Any]) -> None:
+    """Display the depth statistics and critical path produced by progression_report."""
+    screen = Screen()
+    screen.add("\n" + Fore.CYAN + "="*50)
+    screen.add(HEADER_STYLE + "PROGRESSION")
+    screen.add(Fore.CYAN + "="*50)
+
+    screen.add(f"Quests: {report['quests']}  Max depth: {report['max_depth']}")
+    if report['deepest']:
+        screen.add("Deepest: " + ", ".join(f"{ID_STYLE}{qid}{Style.RESET_ALL}" for qid in report['deepest']))
+    if report['cyclic']:
+        screen.add(WARNING_STYLE + f"{len(report['cyclic'])} quest(s) in dependency cycles: " + ", ".join(report['cyclic']))
+    if report['blocked']:
+        screen.add(WARNING_STYLE + f"{len(report['blocked'])} quest(s) blocked behind a cycle: " + ", ".join(report['blocked']))
+
+    if 'critical_path' in report:
+        screen.add("\n" + HEADER_STYLE + "Critical Path")
+        if not report['target']:
+            screen.add("Target quest not found.")
+        for step in report['critical_path']:
+            title = f" {step['title']}" if step['title'] else ""
+            screen.add(f"  {DETAIL_STYLE}{step['depth']:>3}{Style.RESET_ALL} {ID_STYLE}{step['id']}{Style.RESET_ALL}{title} {DETAIL_STYLE}[{step['chapter']}]")
+
+    peak = max((count for stats in report['chapters'].values() for count in stats['histogram'].values()), default=1)
+    for key, stats in report['chapters'].items():
+        screen.add("\n" + HEADER_STYLE + f"{key}" + Style.RESET_ALL + f" (max depth {stats['max_depth']})")
+        for depth, count in stats['histogram'].items():
+            bar = "#" * max(1, round(count * BAR_WIDTH / peak))
+            screen.add(f"  {depth:>3} {BAR_STYLE}{bar}{Style.RESET_ALL} {count}")
+
+    write_screen(screen)
@@ -1,70 +1,96 @@
-from colorama import init, Fore, Style
+from colorama import Fore, Style
+from typing import List, Optional
 from ..model.quest_models import Chapter, Quest
-
-init(autoreset=True)
+from ..controller.lang_store import LangStore
+from ..controller.quest_economy import XP_REWARD_TYPES, xp_amount
+from .render import Screen, write_screen
 
 # Styling Constants
 TITLE_STYLE = Fore.YELLOW + Style.BRIGHT
 DEPS_STYLE = Fore.MAGENTA
 ID_STYLE = Fore.LIGHTBLACK_EX
 INDEX_STYLE = Fore.LIGHTBLACK_EX
-# Note: Use Fore.RESET to stop color bleed when manually concatenating inside a single print
-# However, Autoreset=True generally handles the end of the line.
+# Note: Use Fore.RESET to stop color bleed when manually concatenating inside a single line
+# However, Screen.add() resets the style at the end of every line.
+
+def format_quest_row(i: int, quest: Quest, lang: Optional[LangStore] = None) -> str:
+    """Format one line of the quest list (the index is the quest's position in the chapter)."""
+    # 1. Prepare Styled Index
+    # Concatenate style constants directly with the string, and use Style.RESET_ALL to stop the index color from flowing.
+    index_text = f"[{INDEX_STYLE}{i}{Style.RESET_ALL}]"
+
+    # 2. Prepare Styled Title (if present)
+    # Apply style directly to the variable content.
+    title = lang.title_for(quest) if lang else quest.title
+    title_text = TITLE_STYLE + f" {title}" if title else ""
+    
+    # 3. Prepare Styled Quest ID
+    # Apply style directly to the variable content.
+    quest_id_text = ID_STYLE + f" {quest.id}"
+    
+    # 4. Prepare Styled Dependencies (if present)
+    # Apply style directly to the variable content.
+    deps_text = DEPS_STYLE + f" ({len(quest.dependencies)} deps)" if quest.dependencies else ""
+    
+    # 5. Concatenate everything. Screen.add() resets the style at the end of the line.
+    return (
+        index_text 
+        + title_text  # Will be styled yellow/bright, or ""
+        + quest_id_text # Will be styled lightblack
+        + deps_text # Will be styled magenta
+    )
 
-def display_quests(chapter: Chapter) -> None:
-    """Display the quests within a chapter."""
-    print("\n" + Fore.CYAN + "="*40)
-    print(Fore.YELLOW + Style.BRIGHT + f"CHAPTER: {chapter.filename.upper()} (Quests: {len(chapter.quests)})")
-    print(Fore.CYAN + "="*40)
+def chapter_header(chapter: Chapter) -> List[str]:
+    """The three header lines of the quest list."""
+    return [
+        "\n" + Fore.CYAN + "="*40,
+        Fore.YELLOW + Style.BRIGHT + f"CHAPTER: {chapter.filename.upper()} (Quests: {len(chapter.quests)})",
+        Fore.CYAN + "="*40,
+    ]
 
+def _quests_screen(chapter: Chapter, lang: Optional[LangStore] = None) -> Screen:
+    screen = Screen()
+    screen.extend(chapter_header(chapter))
     for i, quest in enumerate(chapter.quests):
-        # 1. Prepare Styled Index
-        # Concatenate style constants directly with the string, and use Style.RESET_ALL to stop the index color from flowing.
-        index_text = f"[{INDEX_STYLE}{i}{Style.RESET_ALL}]"
+        screen.add(format_quest_row(i, quest, lang))
+    return screen
 
-        # 2. Prepare Styled Title (if present)
-        # Apply style directly to the variable content.
-        title_text = TITLE_STYLE + f" {quest.title}" if quest.title else ""
-        
-        # 3. Prepare Styled Quest ID
-        # Apply style directly to the variable content.
-        quest_id_text = ID_STYLE + f" {quest.id}"
-        
-        # 4. Prepare Styled Dependencies (if present)
-        # Apply style directly to the variable content.
-        deps_text = DEPS_STYLE + f" ({len(quest.dependencies)} deps)" if quest.dependencies else ""
-        
-        # 5. Concatenate everything. Since Autoreset=True is active, the final output will reset.
-        print(
-            index_text 
-            + title_text  # Will be styled yellow/bright, or ""
-            + quest_id_text # Will be styled lightblack
-            + deps_text # Will be styled magenta
-        )
+def render_quests(chapter: Chapter, lang: Optional[LangStore] = None, color: bool = True) -> str:
+    """Render the quest list of a chapter to a string."""
+    return _quests_screen(chapter, lang).render(color)
+
+def display_quests(chapter: Chapter, lang: Optional[LangStore] = None) -> None:
+    """Display the quests within a chapter (titles resolved through `lang` when given)."""
+    write_screen(_quests_screen(chapter, lang))
+
+def _quest_details_screen(quest: Quest, lang: Optional[LangStore] = None) -> Screen:
+    screen = Screen()
 
-def display_quest_details(quest: Quest) -> None:
-    """Display details of a single quest."""
-    
     # Header Construction
-    title_text = TITLE_STYLE + f" {quest.title}" if quest.title else ""
+    title = lang.title_for(quest) if lang else quest.title
+    title_text = TITLE_STYLE + f" {title}" if title else ""
     header_line = Fore.YELLOW + Style.BRIGHT + "QUEST DETAILS:" + title_text + f" {quest.id}"
     
-    print("\n" + Fore.CYAN + "="*60)
-    print(header_line)
-    print(Fore.CYAN + "="*60)
+    screen.add("\n" + Fore.CYAN + "="*60)
+    screen.add(header_line)
+    screen.add(Fore.CYAN + "="*60)
     
     # Details
-    print(f"Coords: ({quest.x}, {quest.y})")
+    if lang:
+        subtitle = lang.text('quest', quest.id, 'subtitle')
+        if subtitle:
+            screen.add(f"Subtitle: {subtitle}")
+    screen.add(f"Coords: ({quest.x}, {quest.y})")
     
     deps_content = ", ".join(quest.dependencies) if quest.dependencies else 'None'
     deps_info = DEPS_STYLE + deps_content
-    print(f"Dependencies: {deps_info}")
+    screen.add(f"Dependencies: {deps_info}")
     
-    print(f"Hidden Until Startable: {quest.hide_details_until_startable}")
+    screen.add(f"Hidden Until Startable: {quest.hide_details_until_startable}")
 
-    print(Fore.GREEN + "\n--- TASKS ---")
+    screen.add(Fore.GREEN + "\n--- TASKS ---")
     if not quest.tasks:
-        print("No tasks defined.")
+        screen.add("No tasks defined.")
     else:
         for i, task in enumerate(quest.tasks):
             # Apply INDEX_STYLE and reset for the index brackets
@@ -76,30 +102,45 @@ def display_quest_details(quest: Quest) -> None:
             optional = " (OPTIONAL)" if task.optional_task else ""
             
             # Concatenate the styled segments
-            print(
+            screen.add(
                 f"{index_part} Type: {task.type} | Count: {task.count} | {item_info_styled}{optional}"
             )
             
             if task.advancement:
-                print(f"    Advancement: {task.advancement}")
+                screen.add(f"    Advancement: {task.advancement}")
 
-    print(Fore.GREEN + "\n--- REWARDS ---")
+    screen.add(Fore.GREEN + "\n--- REWARDS ---")
     if not quest.rewards:
-        print("No rewards defined.")
+        screen.add("No rewards defined.")
     else:
         for i, reward in enumerate(quest.rewards):
             # Apply INDEX_STYLE and reset for the index brackets
             index_part = f"[{INDEX_STYLE}{i}{Style.RESET_ALL}]"
             
             # Apply INDEX_STYLE to the item info for highlighting
-            item_info_styled = INDEX_STYLE + f"Item: {reward.item.id} x{reward.item.count}" if reward.item else "Unknown"
+            if reward.item:
+                item_info_styled = INDEX_STYLE + f"Item: {reward.item.id} x{reward.item.count}"
+            elif reward.type in XP_REWARD_TYPES:
+                unit = "XP" if reward.type == 'xp' else "XP levels"
+                item_info_styled = INDEX_STYLE + f"{unit}: {xp_amount(reward)}"
+            else:
+                item_info_styled = "Unknown"
             
             # Concatenate the styled segments
-            print(
+            screen.add(
                 f"{index_part} Type: {reward.type} | {item_info_styled}"
             )
             
             if reward.advancement:
-                print(f"    Advancement: {reward.advancement}")
+                screen.add(f"    Advancement: {reward.advancement}")
             if reward.count:
-                print(f"    Count: {reward.count}")
\ No newline at end of file
+                screen.add(f"    Count: {reward.count}")
+    return screen
+
+def render_quest_details(quest: Quest, lang: Optional[LangStore] = None, color: bool = True) -> str:
+    """Render the details of a single quest to a string."""
+    return _quest_details_screen(quest, lang).render(color)
+
+def display_quest_details(quest: Quest, lang: Optional[LangStore] = None) -> None:
+    """Display details of a single quest (titles resolved through `lang` when given)."""
+    write_screen(_quest_details_screen(quest, lang))
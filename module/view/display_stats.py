@@ -0,0 +1,45 @@
+from colorama import Fore, Style
+from typing import Any, Dict
+from .render import Screen, write_screen
+
+# Styling Constants
+HEADER_STYLE = Fore.YELLOW + Style.BRIGHT
+KEY_STYLE = Fore.CYAN
+DETAIL_STYLE = Fore.LIGHTBLACK_EX
+
+
+def _counts(counts: Dict[Any, int]) -> str:
+    return ", ".join(f"{kind} ({count})" for kind, count in counts.items()) or "none"
+
+
+def _extent(extent) -> str:
+    if not extent:
+        return "none"
+    return f"x {extent['min_x']}..{extent['max_x']}, y {extent['min_y']}..{extent['max_y']}"
+
+
+def display_stats(stats: Dict[str, Any]) -> None:
+    """Display the statistics produced by book_stats: the whole book in detail, then one line per chapter."""
+    screen = Screen()
+    screen.add("\n" + Fore.CYAN + "="*50)
+    screen.add(HEADER_STYLE + "QUEST BOOK STATISTICS")
+    screen.add(Fore.CYAN + "="*50)
+
+    overall = stats['overall']
+    screen.add(f"Chapters: {len(stats['chapters'])}  Quests: {overall['quests']}  Tasks: {overall['task_count']} ({overall['optional_tasks']} optional)  Rewards: {overall['reward_count']}")
+    screen.add(f"Task types: {_counts(overall['tasks'])}")
+    screen.add(f"Reward types: {_counts(overall['rewards'])}")
+    screen.add(f"Hidden: {_counts({flag: n for flag, n in overall['hidden'].items() if n})}")
+    screen.add(f"Dependencies per quest (fan-out): {_counts(overall['fan_out'])}")
+    screen.add(f"Dependents per quest (fan-in): {_counts(overall['fan_in'])}")
+
+    screen.add("\n" + HEADER_STYLE + "Chapters")
+    for key, chapter in stats['chapters'].items():
+        screen.add(
+            f"{KEY_STYLE}{key}{Style.RESET_ALL}: {chapter['quests']} quest(s), {chapter['task_count']} task(s) "
+            f"({chapter['optional_tasks']} optional), {chapter['reward_count']} reward(s), "
+            f"max fan-out {max(chapter['fan_out'], default=0)}, max fan-in {max(chapter['fan_in'], default=0)} "
+            f"{DETAIL_STYLE}{_extent(chapter['extent'])}"
+        )
+
+    write_screen(screen)
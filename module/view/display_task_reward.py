@@ -1,10 +1,10 @@
-from colorama import init, Fore, Back, Style
+from colorama import Fore, Back, Style
 
-from typing import Dict, Union
+from typing import Dict, Optional, Union
 
 from ..model.quest_models import Task, Reward
-
-init(autoreset=True)
+from ..controller.lang_store import LangStore
+from .render import Screen, write_screen
 
 # Styling Constants
 TITLE_STYLE = Fore.YELLOW + Style.BRIGHT
@@ -12,54 +12,73 @@ DEPS_STYLE = Fore.MAGENTA
 ID_STYLE = Fore.CYAN
 INDEX_STYLE = Fore.YELLOW
 
-def display_task_reward_details(obj: Union[Task, Reward], quest_id: str = "Unknown Quest", obj_type: str = "AUTO") -> None:
-    """Display comprehensive details of a task or reward.
-
-    Args:
-        obj: The Task or Reward object to display
-        quest_id: The quest ID this belongs to
-        obj_type: Either "TASK", "REWARD", or "AUTO" to auto-detect
-    """
+def _task_reward_screen(obj: Union[Task, Reward], quest_id: str = "Unknown Quest", obj_type: str = "AUTO", lang: Optional[LangStore] = None) -> Screen:
     # Auto-detect type if not specified
     if obj_type == "AUTO":
         obj_type = "TASK" if isinstance(obj, Task) else "REWARD"
 
     obj_type = obj_type.upper()
     is_task = obj_type == "TASK"
+    screen = Screen()
 
-    print("\n" + Fore.CYAN + "="*50)
-    print(Fore.YELLOW + Style.BRIGHT + f"{obj_type} DETAILS: {obj.type.upper()}")
-    print(f"Quest: {quest_id}")
-    print(Fore.CYAN + "="*50)
+    screen.add("\n" + Fore.CYAN + "="*50)
+    screen.add(Fore.YELLOW + Style.BRIGHT + f"{obj_type} DETAILS: {obj.type.upper()}")
+    screen.add(f"Quest: {quest_id}")
+    screen.add(Fore.CYAN + "="*50)
 
     # ID and type with appropriate labels
     id_label = "Task ID" if is_task else "Reward ID"
-    print(f"{id_label}: {obj.id}")
-    print(f"Type: {obj.type}")
+    screen.add(f"{id_label}: {obj.id}")
+    title = lang.title_for(obj) if lang else None
+    if title:
+        screen.add(f"Title: {title}")
+    screen.add(f"Type: {obj.type}")
 
     # Handle count display
     if is_task:
-        print(f"Count: {obj.count if obj.count else 'Not specified'}")
+        screen.add(f"Count: {obj.count if obj.count else 'Not specified'}")
     else:
         if hasattr(obj, 'count') and obj.count:
-            print(f"Count: {obj.count}")
+            screen.add(f"Count: {obj.count}")
 
     # Item information
     if obj.item:
-        print(f"Item: {obj.item.id}")
-        print(f"Item Count: {obj.item.count}")
+        screen.add(f"Item: {obj.item.id}")
+        screen.add(f"Item Count: {obj.item.count}")
         if obj.item.components:
-            print(f"Item Components: {obj.item.components}")
+            screen.add(f"Item Components: {obj.item.components}")
     else:
         if not is_task:  # Only show this message for rewards
-            print("No item associated with this reward")
+            screen.add("No item associated with this reward")
+
+    # Experience amounts of 'xp' and 'xp_levels' rewards
+    if getattr(obj, 'xp', None) is not None:
+        screen.add(f"XP: {obj.xp}")
+    if getattr(obj, 'xp_levels', None) is not None:
+        screen.add(f"XP Levels: {obj.xp_levels}")
 
     # Advancement information
     if hasattr(obj, 'advancement') and obj.advancement:
-        print(f"Advancement: {obj.advancement}")
+        screen.add(f"Advancement: {obj.advancement}")
 
     # Task-specific information
     if is_task:
-        print(f"Optional Task: {'Yes' if obj.optional_task else 'No'}")
+        screen.add(f"Optional Task: {'Yes' if obj.optional_task else 'No'}")
 
-    print(Fore.CYAN + "\n" + "="*50)
+    screen.add(Fore.CYAN + "\n" + "="*50)
+    return screen
+
+def render_task_reward_details(obj: Union[Task, Reward], quest_id: str = "Unknown Quest", obj_type: str = "AUTO", lang: Optional[LangStore] = None, color: bool = True) -> str:
+    """Render the details of a task or reward to a string."""
+    return _task_reward_screen(obj, quest_id, obj_type, lang).render(color)
+
+def display_task_reward_details(obj: Union[Task, Reward], quest_id: str = "Unknown Quest", obj_type: str = "AUTO", lang: Optional[LangStore] = None) -> None:
+    """Display comprehensive details of a task or reward.
+
+    Args:
+        obj: The Task or Reward object to display
+        quest_id: The quest ID this belongs to
+        obj_type: Either "TASK", "REWARD", or "AUTO" to auto-detect
+        lang: Optional LangStore used to show the localized title
+    """
+    write_screen(_task_reward_screen(obj, quest_id, obj_type, lang))
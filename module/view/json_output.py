@@ -0,0 +1,60 @@
+import sys
+from typing import Any, Dict, IO, Iterable, Iterator, Optional
+
+from pydantic_core import to_json
+
+from ..model.quest_models import Chapter, Quest
+from ..controller.lang_store import LangStore
+
+# Output formats understood by write_records
+JSON_FORMATS = ('json', 'ndjson')
+
+
+def chapter_records(chapters: Dict[str, Chapter], lang: Optional[LangStore] = None) -> Iterator[Dict[str, Any]]:
+    """Yield one summary record per chapter, in the same (sorted) order as 'view chapters'."""
+    for key in sorted(chapters):
+        chapter = chapters[key]
+        yield {
+            'key': key,
+            'id': chapter.id,
+            'title': lang.title_for(chapter) if lang else chapter.title,
+            'group': chapter.group,
+            'order_index': chapter.order_index,
+            'quest_count': len(chapter.quests),
+        }
+
+
+def quest_record(chapter_key: str, quest: Quest, lang: Optional[LangStore] = None) -> Dict[str, Any]:
+    """A quest with its tasks and rewards, plus the chapter key and the lang-resolved title."""
+    record = quest.model_dump()
+    record['title'] = lang.title_for(quest) if lang else quest.title
+    return {'chapter': chapter_key, **record}
+
+
+def write_record(record: Any, stream: Optional[IO[str]] = None) -> None:
+    """Write a single JSON value followed by a newline."""
+    stream = stream or sys.stdout
+    stream.write(to_json(record).decode("utf-8"))
+    stream.write("\n")
+
+
+def write_records(records: Iterable[Any], fmt: str = 'json', stream: Optional[IO[str]] = None) -> int:
+    """
+    Stream records as one JSON array ('json') or one object per line ('ndjson').
+    Each record is serialized as soon as it is produced, so nothing is held back. Returns the count.
+    """
+    stream = stream or sys.stdout
+    ndjson = fmt == 'ndjson'
+    count = 0
+    if not ndjson:
+        stream.write("[")
+    for record in records:
+        if count and not ndjson:
+            stream.write(",")
+        stream.write(to_json(record).decode("utf-8"))
+        if ndjson:
+            stream.write("\n")
+        count += 1
+    if not ndjson:
+        stream.write("]\n")
+    return count
@@ -0,0 +1,112 @@
+from colorama import Fore
+from typing import List, Optional
+
+from ..model.quest_models import Chapter
+from ..controller.lang_store import LangStore
+from .display_quests import format_quest_row, chapter_header
+from .render import Screen, write_screen
+
+DEFAULT_PAGE_SIZE = 40
+
+# Styling Constants
+FOOTER_STYLE = Fore.LIGHTBLACK_EX
+
+
+class QuestPager:
+    """
+    Windowed quest list for the interactive CLI.
+
+    The formatted rows of a chapter are built once and cached until a different Chapter
+    object is shown (edits create a new one), so paging and filtering only slice the
+    cache. Rows keep the quest's index in the chapter, so numbers stay valid for selection.
+    """
+
+    def __init__(self, page_size: int = DEFAULT_PAGE_SIZE, lang: Optional[LangStore] = None):
+        self.page_size = max(1, page_size)
+        self.lang = lang
+        self.page = 0
+        self.filter_text: Optional[str] = None
+        self._chapter: Optional[Chapter] = None
+        self._chapter_id: Optional[str] = None
+        self._rows: List[str] = []
+        self._search: List[str] = []
+        self._visible: List[int] = []
+
+    # --- Row cache ---
+
+    def _rows_for(self, chapter: Chapter) -> None:
+        if chapter is self._chapter:
+            return
+        if chapter.id != self._chapter_id:
+            # A different chapter starts on its first page, unfiltered
+            self.page = 0
+            self.filter_text = None
+        self._chapter = chapter
+        self._chapter_id = chapter.id
+        self._rows = [format_quest_row(i, quest, self.lang) for i, quest in enumerate(chapter.quests)]
+        self._search = [
+            f"{quest.id} {(self.lang.title_for(quest) if self.lang else quest.title) or ''}".lower()
+            for quest in chapter.quests
+        ]
+        self._apply_filter()
+
+    def _apply_filter(self) -> None:
+        if self.filter_text:
+            self._visible = [i for i, text in enumerate(self._search) if self.filter_text in text]
+        else:
+            self._visible = list(range(len(self._rows)))
+        self.page = min(self.page, self.page_count - 1)
+
+    # --- Navigation ---
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-len(self._visible) // self.page_size))
+
+    def set_filter(self, text: Optional[str]) -> None:
+        """Only list quests whose ID or title contains `text` (None or '' clears the filter)."""
+        self.filter_text = text.lower() if text else None
+        self.page = 0
+        self._apply_filter()
+
+    def next_page(self) -> bool:
+        if self.page + 1 < self.page_count:
+            self.page += 1
+            return True
+        return False
+
+    def prev_page(self) -> bool:
+        if self.page > 0:
+            self.page -= 1
+            return True
+        return False
+
+    def go_to(self, page_number: int) -> bool:
+        """Jump to a 1-based page number."""
+        if 1 <= page_number <= self.page_count:
+            self.page = page_number - 1
+            return True
+        return False
+
+    # --- Rendering ---
+
+    def screen(self, chapter: Chapter) -> Screen:
+        self._rows_for(chapter)
+        start = self.page * self.page_size
+        window = self._visible[start:start + self.page_size]
+
+        screen = Screen()
+        screen.extend(chapter_header(chapter))
+        screen.extend([self._rows[i] for i in window])
+        if not window:
+            screen.add("No quests match the filter.")
+        shown = f"{start + 1}-{start + len(window)}" if window else "0"
+        filter_note = f" | filter: '{self.filter_text}'" if self.filter_text else ""
+        screen.add(FOOTER_STYLE + f"Page {self.page + 1}/{self.page_count} (quests {shown} of {len(self._visible)}){filter_note}")
+        return screen
+
+    def render(self, chapter: Chapter, color: bool = True) -> str:
+        return self.screen(chapter).render(color)
+
+    def display(self, chapter: Chapter) -> None:
+        write_screen(self.screen(chapter))
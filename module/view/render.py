@@ -0,0 +1,68 @@
+import os
+import re
+import sys
+from typing import List, Optional, TextIO
+
+from colorama import Style, just_fix_windows_console
+
+# Enables ANSI handling on legacy Windows consoles; a no-op everywhere else. Unlike
+# init(autoreset=True) it does not wrap sys.stdout, so screens are written straight through.
+just_fix_windows_console()
+
+ANSI_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
+
+# None = automatic (colour on terminals unless NO_COLOR is set), True/False = forced
+_color_mode: Optional[bool] = None
+
+
+def set_color(enabled: Optional[bool]) -> None:
+    """Force colour on (True) or off (False), or go back to automatic detection (None)."""
+    global _color_mode
+    _color_mode = enabled
+
+
+def color_enabled(stream: Optional[TextIO] = None) -> bool:
+    """Whether output to `stream` (stdout by default) should be coloured."""
+    if _color_mode is not None:
+        return _color_mode
+    if os.environ.get("NO_COLOR"):
+        return False
+    stream = stream if stream is not None else sys.stdout
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def strip_ansi(text: str) -> str:
+    return ANSI_PATTERN.sub("", text)
+
+
+class Screen:
+    """
+    Collects the lines of one screen so it can be written with a single call.
+
+    Every styled line is closed with Style.RESET_ALL, which is what colorama's autoreset
+    used to do after each print.
+    """
+
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def add(self, text: str = "") -> None:
+        self.lines.append(text + Style.RESET_ALL if "\x1b" in text else text)
+
+    def extend(self, lines: List[str]) -> None:
+        for line in lines:
+            self.add(line)
+
+    def render(self, color: bool = True) -> str:
+        text = "\n".join(self.lines)
+        return text if color else strip_ansi(text)
+
+
+def write_screen(screen: Screen, stream: Optional[TextIO] = None) -> None:
+    """Write a whole screen to `stream` (stdout by default) in one call."""
+    stream = stream if stream is not None else sys.stdout
+    stream.write(screen.render(color_enabled(stream)) + "\n")
+    stream.flush()
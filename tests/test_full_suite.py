@@ -10,6 +10,7 @@ Run with: python -m pytest tests/test_full_suite.py > .venv\log\test_report.txt
 import sys
 import os
 import io
+import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -238,10 +239,13 @@ class TestLoader:
         assert data == MOCK_LANG_DICT
         assert mock_fslib.load.call_count == 1
 
+    @patch('module.controller.ftb_loader.remember_chapters_dir')
+    @patch('module.controller.ftb_loader.scan_instances', return_value=[])
+    @patch('module.controller.ftb_loader.load_remembered_chapters_dir', return_value=None)
     @patch('module.controller.ftb_loader.os.path')
     @patch('module.controller.ftb_loader.os.getcwd', return_value='/mock/modpack')
     @patch('module.controller.ftb_loader.is_valid_chapters_dir', return_value=False)
-    def test_find_chapters_directory_fallback(self, mock_valid, mock_cwd, mock_path, monkeypatch):
+    def test_find_chapters_directory_fallback(self, mock_valid, mock_cwd, mock_path, mock_remembered, mock_scan, mock_remember, monkeypatch):
         """
         Test manual fallback when auto-discovery fails. 
         """
@@ -540,8 +544,8 @@ class TestNavigation(TestDataFixtures):
         assert f"QUEST DETAILS: {quest.id}" in out
         assert "Coords: (5.0, 5.0)" in out
         assert "Item: minecraft:gold x10" in out
-        # The reward fixture is 'r_xp_reward' (type='xp', count=500). Item info is 'Unknown'
-        assert "Type: xp | Unknown" in out 
+        # The reward fixture is 'r_xp_reward' (type='xp', count=500): its amount is shown in place of an item
+        assert "Type: xp | XP: 500" in out
         assert "Count: 500" in out
         
     # --- NEW NAVIGATION DETAIL TESTS ---
@@ -727,3 +731,1604 @@ class TestArgparseCLI(TestDataFixtures):
         assert "✅ Quest 'q_alpha' position updated to (50.0, 60.0)" in out
         # Assert original object state was NOT mutated
         assert found_quest.x == original_x
+
+
+# --- Test Component: Bulk Position Transform ---
+
+class TestBulkTransform(TestDataFixtures):
+    """Verifies module/controller/quest_transform.py."""
+
+    @pytest.fixture
+    def grid_chapter(self):
+        quests = [create_quest(f"q{i}", float(i), float(i * 2)) for i in range(5)]
+        return Chapter(id="grid", filename="grid", group="tests", order_index=0, quests=quests)
+
+    def test_translate_whole_chapter(self, grid_chapter):
+        updated = module.transform_quest_positions(grid_chapter, translate=(10.0, -1.0))
+        assert [(q.x, q.y) for q in updated.quests] == [(i + 10.0, i * 2 - 1.0) for i in range(5)]
+        assert grid_chapter.quests[0].x == 0.0 # Check immutability
+
+    def test_scale_and_rotate_around_origin(self, grid_chapter):
+        updated = module.transform_quest_positions(
+            grid_chapter, quest_ids=["q1"], scale=(2.0, 2.0), rotate=90.0, origin=(0.0, 0.0)
+        )
+        # (1, 2) scaled to (2, 4), then rotated 90 degrees to (-4, 2)
+        assert updated.quests[1].x == pytest.approx(-4.0)
+        assert updated.quests[1].y == pytest.approx(2.0)
+        assert updated.quests[0] is grid_chapter.quests[0] # Unselected quests are reused
+
+    def test_bbox_selection_and_snap(self, grid_chapter):
+        updated = module.transform_quest_positions(
+            grid_chapter, bbox=(1.0, 0.0, 2.0, 10.0), translate=(0.3, 0.0), snap=0.5
+        )
+        assert [q.x for q in updated.quests] == [0.0, 1.5, 2.5, 3.0, 4.0]
+
+    def test_empty_selection_returns_same_chapter(self, grid_chapter):
+        assert module.transform_quest_positions(grid_chapter, quest_ids=["missing"]) is grid_chapter
+
+    @patch('cli.load_data_for_cli')
+    def test_transform_command(self, mock_loader, grid_chapter, monkeypatch, capfd):
+        from cli import main
+        mock_loader.return_value = {"grid": grid_chapter}
+        monkeypatch.setattr(sys, 'argv', ['cli.py', 'transform', 'grid', '--ids', 'q1', 'q2', '--translate', '1', '1'])
+        main()
+        out, err = capfd.readouterr()
+        assert "Transformed 2 quest(s) in chapter 'grid' (Unsaved)" in out
+
+    @patch('cli.load_data_for_cli')
+    def test_transform_command_counts_only_moved_quests(self, mock_loader, grid_chapter, monkeypatch, capfd):
+        from cli import main
+        mock_loader.return_value = {"grid": grid_chapter}
+        # Every quest is selected, but they all sit on the 1.0 grid already
+        monkeypatch.setattr(sys, 'argv', ['cli.py', 'transform', 'grid', '--snap', '1'])
+        main()
+        out, err = capfd.readouterr()
+        assert "Transformed 0 quest(s) in chapter 'grid' (Unsaved)" in out
+
+
+# --- Test Component: Automatic Layout ---
+
+class TestAutoLayout(TestDataFixtures):
+    """Verifies module/controller/quest_layout.py."""
+
+    @pytest.fixture
+    def dag_chapter(self):
+        quests = [
+            create_quest("root", 0.0, 0.0),
+            create_quest("a", 0.0, 0.0, dependencies=["root"]),
+            create_quest("b", 0.0, 0.0, dependencies=["root"]),
+            create_quest("c", 0.0, 0.0, dependencies=["a", "b", "other_chapter_quest"]),
+            create_quest("pinned", 7.0, 7.0, dependencies=["c"]),
+        ]
+        return Chapter(id="dag", filename="dag", group="tests", order_index=0, quests=quests)
+
+    def test_assign_layers_longest_path(self, dag_chapter):
+        layers = module.assign_layers(dag_chapter)
+        assert layers == {"root": 0, "a": 1, "b": 1, "c": 2, "pinned": 3}
+
+    def test_assign_layers_survives_cycles(self):
+        quests = [create_quest("x", 0, 0, dependencies=["y"]), create_quest("y", 0, 0, dependencies=["x"])]
+        chapter = Chapter(id="cyc", filename="cyc", group="tests", order_index=0, quests=quests)
+        assert set(module.assign_layers(chapter)) == {"x", "y"}
+
+    def test_autolayout_positions_and_pins(self, dag_chapter):
+        updated = module.autolayout_chapter(dag_chapter, pinned=["pinned"])
+        positions = {q.id: (q.x, q.y) for q in updated.quests}
+        assert positions["root"] == (0.0, 0.0)
+        assert positions["a"][1] == positions["b"][1] == 1.5
+        assert positions["a"] != positions["b"]
+        assert positions["c"] == (0.0, 3.0)
+        assert positions["pinned"] == (7.0, 7.0)
+        assert dag_chapter.quests[1].y == 0.0 # Check immutability
+
+    def test_autolayout_large_chapter_is_fast(self):
+        import time
+        quests = [create_quest(f"q{i}", 0, 0, dependencies=[f"q{i // 2}"] if i else []) for i in range(5000)]
+        chapter = Chapter(id="big", filename="big", group="tests", order_index=0, quests=quests)
+        start = time.perf_counter()
+        updated = module.autolayout_chapter(chapter)
+        assert time.perf_counter() - start < 1.0
+        assert len({(q.x, q.y) for q in updated.quests}) == 5000
+
+    @patch('cli.load_data_for_cli')
+    def test_autolayout_command(self, mock_loader, dag_chapter, monkeypatch, capfd):
+        from cli import main
+        mock_loader.return_value = {"dag": dag_chapter}
+        monkeypatch.setattr(sys, 'argv', ['cli.py', 'autolayout', 'dag', '--pin-placed'])
+        main()
+        out, err = capfd.readouterr()
+        assert "Laid out 3 quest(s) in chapter 'dag' (1 pinned) (Unsaved)" in out
+
+
+# --- Test Component: SQLite Export ---
+
+class TestSqliteExport(TestDataFixtures):
+    """Verifies the exporter in module/controller/quest_sqlite.py."""
+
+    def test_export_writes_normalized_tables(self, parsed_chapters, tmp_path):
+        import sqlite3
+        db_path = str(tmp_path / "book.db")
+        stats = module.export_to_sqlite(parsed_chapters, db_path, {"quest.q_test_edit.title": "Gold"})
+        assert stats == {'written': 1, 'skipped': 0, 'removed': 0}
+
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT id, chapter_key, x FROM quests").fetchall() == [("q_test_edit", "test_chapter_key", 5.0)]
+        assert conn.execute("SELECT dependency_id FROM dependencies").fetchall() == [("dep_quest_id",)]
+        assert conn.execute("SELECT item_id, item_count FROM tasks").fetchall() == [("minecraft:gold", 10)]
+        assert conn.execute("SELECT type, count FROM rewards").fetchall() == [("xp", 500)]
+        assert conn.execute("SELECT id FROM items").fetchall() == [("minecraft:gold",)]
+        assert conn.execute("SELECT value FROM lang WHERE key = 'quest.q_test_edit.title'").fetchone() == ("Gold",)
+        conn.close()
+
+    def test_reexport_skips_unchanged_and_removes_missing(self, parsed_chapters, chapter, tmp_path):
+        db_path = str(tmp_path / "book.db")
+        module.export_to_sqlite(parsed_chapters, db_path)
+        assert module.export_to_sqlite(parsed_chapters, db_path)['skipped'] == 1
+
+        renamed = {"other": edit_chapter_title(chapter, "Changed")}
+        assert module.export_to_sqlite(renamed, db_path) == {'written': 1, 'skipped': 0, 'removed': 1}
+
+    def test_export_sqlite_command_stores_lang_titles(self, tmp_path, monkeypatch, capfd):
+        import sqlite3
+        from cli import main
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config_home"))
+        monkeypatch.setattr(sys, 'platform', 'linux')
+        quests = tmp_path / "pack" / "config" / "ftbquests" / "quests"
+        (quests / "chapters").mkdir(parents=True)
+        (quests / "lang").mkdir()
+        (quests / "chapters" / "mining.snbt").write_text(
+            '{ id: "1111111111111111", filename: "mining", group: "", order_index: 0,'
+            ' quests: [{ id: "2222222222222222", x: 0.0d, y: 0.0d }] }'
+        )
+        lang = quests / "lang" / "en_us.snbt"
+        lang.write_text('{ "chapter.1111111111111111.title": "Mining", "quest.2222222222222222.title": "Dig" }')
+        db_path = str(tmp_path / "book.db")
+        monkeypatch.setattr(sys, 'argv', ['cli.py', '--root', str(tmp_path / "pack"), 'export', 'sqlite', db_path])
+        main()
+
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT title FROM chapters").fetchall() == [("Mining",)]
+        assert conn.execute("SELECT title FROM quests").fetchall() == [("Dig",)]
+        conn.close()
+        # The models keep their own (empty) SNBT titles
+        loaded = module.load_chapters_from_sqlite(db_path, lazy=False)
+        assert loaded["mining"].title is None and loaded["mining"].quests[0].title is None
+
+        # A lang change alone rewrites the chapter
+        lang.write_text('{ "chapter.1111111111111111.title": "Mining", "quest.2222222222222222.title": "Dig deeper" }')
+        main()
+        out, err = capfd.readouterr()
+        assert "1 chapter(s) written" in out.splitlines()[-1]
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT title FROM quests").fetchall() == [("Dig deeper",)]
+        conn.close()
+
+    @patch('cli.load_data_for_cli')
+    def test_export_sqlite_command(self, mock_loader, parsed_chapters, tmp_path, monkeypatch, capfd):
+        from cli import main
+        mock_loader.return_value = parsed_chapters
+        db_path = str(tmp_path / "cli.db")
+        monkeypatch.setattr(sys, 'argv', ['cli.py', 'export', 'sqlite', db_path])
+        main()
+        out, err = capfd.readouterr()
+        assert "1 chapter(s) written" in out
+        assert os.path.exists(db_path)
+
+
+# --- Test Component: SQLite Loader ---
+
+class TestSqliteLoader(TestDataFixtures):
+    """Verifies loading a book back from module/controller/quest_sqlite.py."""
+
+    def test_round_trip_is_lossless(self, parsed_chapters, chapter, tmp_path):
+        db_path = str(tmp_path / "book.db")
+        lang = {"quest.q_test_edit.title": "Gold", "quest.q_test_edit.quest_desc": ["a", "b"]}
+        module.export_to_sqlite(parsed_chapters, db_path, lang)
+
+        loaded = module.load_chapters_from_sqlite(db_path, lazy=False)
+        assert loaded["test_chapter_key"] == chapter
+        assert module.load_language_from_sqlite(db_path) == lang
+
+    def test_lazy_mapping_fetches_on_access(self, parsed_chapters, tmp_path):
+        db_path = str(tmp_path / "book.db")
+        module.export_to_sqlite(parsed_chapters, db_path)
+
+        loaded = module.load_chapters_from_sqlite(db_path)
+        assert isinstance(loaded, module.SqliteChapterMapping)
+        assert list(loaded) == ["test_chapter_key"]
+        assert loaded._cache == {}
+        assert loaded["test_chapter_key"].quests[0].tasks[0].item.id == "minecraft:gold"
+        assert "test_chapter_key" in loaded._cache
+        with pytest.raises(KeyError):
+            loaded["missing"]
+        loaded.close()
+
+    def test_loading_opens_the_database_read_only(self, parsed_chapters, tmp_path):
+        import sqlite3
+        db_path = str(tmp_path / "book.db")
+        module.export_to_sqlite(parsed_chapters, db_path)
+        loaded = module.load_chapters_from_sqlite(db_path)
+        assert "test_chapter_key" in loaded and "missing" not in loaded
+        with pytest.raises(sqlite3.OperationalError):
+            loaded._conn.execute("DELETE FROM chapters")
+        loaded.close()
+
+    def test_missing_or_foreign_database_is_an_error(self, tmp_path):
+        missing = str(tmp_path / "typo.db")
+        with pytest.raises(FileNotFoundError):
+            module.load_chapters_from_sqlite(missing)
+        with pytest.raises(FileNotFoundError):
+            module.load_language_from_sqlite(missing)
+        assert not os.path.exists(missing)
+
+        not_a_db = tmp_path / "notes.txt"
+        not_a_db.write_text("not a database " * 20)
+        with pytest.raises(ValueError):
+            module.load_chapters_from_sqlite(str(not_a_db))
+
+    def test_db_option_with_missing_file(self, tmp_path, monkeypatch, capfd):
+        from cli import main
+        missing = str(tmp_path / "typo.db")
+        monkeypatch.setattr(sys, 'argv', ['cli.py', '--db', missing, 'view', 'quest', 'q_test'])
+        with pytest.raises(SystemExit) as exc:
+            main()
+        out, err = capfd.readouterr()
+        assert exc.value.code == 1
+        assert "does not exist" in err and out == ""
+        assert not os.path.exists(missing)
+
+    def test_round_trip_keeps_xp_rewards(self, chapter, tmp_path):
+        db_path = str(tmp_path / "book.db")
+        quest = chapter.quests[0].model_copy(update={'rewards': [
+            Reward(id="r_xp", type="xp", xp=250),
+            Reward(id="r_levels", type="xp_levels", xp_levels=3),
+        ]})
+        book = {"test_chapter_key": chapter.model_copy(update={'quests': [quest]})}
+        module.export_to_sqlite(book, db_path)
+
+        loaded = module.load_chapters_from_sqlite(db_path, lazy=False)
+        assert loaded == book
+        assert module.economy_report(loaded)['xp'] == {'xp': 250, 'xp_levels': 3}
+
+    def test_export_upgrades_database_without_component_settings(self, parsed_chapters, tmp_path):
+        import sqlite3
+        db_path = str(tmp_path / "book.db")
+        module.export_to_sqlite(parsed_chapters, db_path)
+        conn = sqlite3.connect(db_path)
+        for table in ("tasks", "rewards"):
+            conn.execute(f"ALTER TABLE {table} DROP COLUMN settings")
+        conn.close()
+
+        assert module.load_chapters_from_sqlite(db_path, lazy=False) == parsed_chapters
+        assert module.export_to_sqlite(parsed_chapters, db_path)['written'] == 1
+
+    def test_db_option_loads_from_sqlite(self, parsed_chapters, tmp_path, monkeypatch, capfd):
+        from cli import main
+        db_path = str(tmp_path / "book.db")
+        module.export_to_sqlite(parsed_chapters, db_path)
+        monkeypatch.setattr(sys, 'argv', ['cli.py', '--db', db_path, 'view', 'quest', 'q_test'])
+        main()
+        out, err = capfd.readouterr()
+        assert "QUEST DETAILS: q_test_edit" in out
+
+
+# --- Test Component: JSON Lines Streaming ---
+
+class TestJsonl(TestDataFixtures):
+    """Verifies module/controller/quest_jsonl.py."""
+
+    def test_records_are_streamed_lazily(self, parsed_chapters):
+        lang = {"quest.q_test_edit.title": "Gold Rush", "chapter.chap_test_edit.title": "Mining"}
+        records = module.iter_quest_records(parsed_chapters, lang)
+        assert not isinstance(records, list)
+        header, quest_record = list(records)
+        assert header['record'] == 'chapter' and 'quests' not in header
+        assert header['title'] == "Mining"
+        assert quest_record['chapter'] == "test_chapter_key"
+        assert quest_record['title'] == "Gold Rush"
+        assert quest_record['tasks'][0]['item']['id'] == "minecraft:gold"
+
+    def test_export_import_round_trip(self, parsed_chapters, chapter, tmp_path):
+        path = str(tmp_path / "book.jsonl")
+        assert module.export_jsonl(parsed_chapters, path) == 2
+        imported = module.import_jsonl(path, batch_size=1)
+        assert imported == {"test_chapter_key": chapter}
+
+    def test_import_skips_invalid_quests(self, tmp_path, capfd):
+        path = tmp_path / "loose.jsonl"
+        path.write_text(
+            '{"chapter": "loose", "id": "ok", "x": 1, "y": 2}\n'
+            '\n'
+            '{"chapter": "loose", "id": "bad", "x": "not a number", "y": 0}\n'
+        )
+        imported = module.import_jsonl(str(path))
+        assert [q.id for q in imported["loose"].quests] == ["ok"]
+        assert "Skipping invalid quest 'bad'" in capfd.readouterr().out
+
+    @patch('cli.load_data_for_cli')
+    def test_import_command_does_not_load_book(self, mock_loader, parsed_chapters, tmp_path, monkeypatch, capfd):
+        from cli import main
+        path = str(tmp_path / "book.jsonl")
+        module.export_jsonl(parsed_chapters, path)
+        monkeypatch.setattr(sys, 'argv', ['cli.py', 'import', 'jsonl', path])
+        main()
+        out, err = capfd.readouterr()
+        assert "Imported 1 quest(s) in 1 chapter(s)" in out
+        assert "Validation only" in out
+        mock_loader.assert_not_called()
+
+    def test_import_rejects_malformed_lines_and_missing_chapters(self, tmp_path, monkeypatch, capfd):
+        from cli import main
+        broken = tmp_path / "broken.jsonl"
+        broken.write_text('{"chapter": "c", "id": "ok", "x": 1, "y": 2}\n{"chapter": "c", "id": \n')
+        with pytest.raises(ValueError, match=r"broken\.jsonl:2: invalid JSON"):
+            module.import_jsonl(str(broken))
+
+        orphan = tmp_path / "orphan.jsonl"
+        orphan.write_text('{"id": "lost", "x": 1, "y": 2}\n')
+        with pytest.raises(ValueError, match="'lost' has no 'chapter' key"):
+            module.import_jsonl(str(orphan))
+
+        for path in (broken, orphan):
+            monkeypatch.setattr(sys, 'argv', ['cli.py', 'import', 'jsonl', str(path)])
+            with pytest.raises(SystemExit) as exc:
+                main()
+            out, err = capfd.readouterr()
+            assert exc.value.code == 1
+            assert out.startswith("Error: ") and "Imported" not in out
+
+
+# --- Test Component: Version Diff ---
+
+class TestDiff(TestDataFixtures):
+    """Verifies module/controller/quest_diff.py and the diff command."""
+
+    def test_identical_books_have_no_changes(self, parsed_chapters):
+        report = module.diff_books(parsed_chapters, parsed_chapters)
+        assert not any(report['summary'].values())
+
+    def test_quest_task_and_reward_changes(self, chapter, quest, task):
+        changed_quest = edit_task_in_quest(quest, task.id, task.model_copy(update={'count': 64}))
+        changed_quest = remove_reward_from_quest(edit_quest_position(changed_quest, 1.0, 5.0), "r_xp_reward")
+        new_chapter = add_quest_to_chapter(
+            edit_quest_in_chapter(chapter, quest.id, changed_quest), create_quest("q_brand_new", 0, 0)
+        )
+        report = module.diff_books({"c": chapter}, {"c": new_chapter, "extra": chapter.model_copy(update={'quests': []})})
+
+        assert report['chapters']['added'] == ["extra"]
+        assert [q['id'] for q in report['quests']['added']] == ["q_brand_new"]
+        (modified,) = report['quests']['modified']
+        assert modified['fields'] == {'x': [5.0, 1.0]}
+        assert modified['tasks']['modified'] == {task.id: {'count': [10, 64]}}
+        assert modified['rewards']['removed'] == ["r_xp_reward"]
+
+    def test_quest_moved_between_chapters(self, chapter, quest):
+        old = {"a": chapter, "b": chapter.model_copy(update={'quests': []})}
+        new = {"a": chapter.model_copy(update={'quests': []}), "b": chapter}
+        (modified,) = module.diff_books(old, new)['quests']['modified']
+        assert modified['moved_from'] == "a" and modified['chapter'] == "b"
+
+    @patch('cli.load_data_for_cli')
+    @patch('cli.load_book_from_directory')
+    def test_diff_command_json(self, mock_book, mock_loader, chapter, monkeypatch, capfd):
+        from cli import main
+        mock_book.side_effect = [{"c": chapter}, {"c": edit_chapter_title(chapter, "Renamed")}]
+        monkeypatch.setattr(sys, 'argv', ['cli.py', 'diff', 'old_pack', 'new_pack', '--format', 'json'])
+        main()
+        out, err = capfd.readouterr()
+        import json
+        report = json.loads(out)
+        assert report['chapters']['modified'] == {"c": {"title": ["Edit Test Chapter", "Renamed"]}}
+        mock_loader.assert_not_called()
+
+    def test_diff_command_json_stays_clean_and_fails_on_missing_book(self, tmp_path, monkeypatch, capfd):
+        from cli import main
+        chapters = tmp_path / "pack" / "config" / "ftbquests" / "quests" / "chapters"
+        chapters.mkdir(parents=True)
+        (chapters / "main.snbt").write_text('{ id: "c1", filename: "main", group: "", order_index: 0, quests: [{ id: "q1", x: 0.0d, y: 0.0d }] }')
+        (chapters / "broken.snbt").write_text('{ id: "broken" }')  # No lang file either: both only warn, on stderr
+
+        monkeypatch.setattr(sys, 'argv', ['cli.py', 'diff', str(tmp_path / "pack"), str(tmp_path / "pack"), '--format', 'json'])
+        main()
+        out, err = capfd.readouterr()
+        assert json.loads(out)['chapters'] == {'added': [], 'removed': [], 'modified': {}}
+        assert "Failed to mount chapter broken" in err and "Language file not found" in err
+
+        monkeypatch.setattr(sys, 'argv', ['cli.py', 'diff', str(tmp_path / "pack"), str(tmp_path / "typo")])
+        with pytest.raises(SystemExit) as exc:
+            main()
+        out, err = capfd.readouterr()
+        assert exc.value.code == 1
+        assert out == "" and "No FTB Quests chapters found under" in err
+
+    def test_display_diff_report_text(self, chapter, capfd):
+        report = module.diff_books({}, {"c": chapter})
+        module.display_diff_report(report)
+        out, err = capfd.readouterr()
+        assert "+ chapter c" in out
+        assert "q_test_edit" in out
+
+
+# --- Test Component: Content Fingerprints ---
+
+class TestFingerprints(TestDataFixtures):
+    """Verifies cached Merkle fingerprints in module/controller/quest_hash.py."""
+
+    def test_fingerprint_is_stable_and_cached(self, chapter):
+        first = module.chapter_hash(chapter)
+        assert chapter._fingerprint == first
+        assert module.chapter_hash(chapter.model_copy(deep=True)) == first
+        assert module.fingerprint(chapter) == first
+
+    def test_parse_chapters_primes_fingerprints(self):
+        import copy
+        with patch('builtins.print'):
+            parsed = parse_chapters({"mock.snbt": copy.deepcopy(MOCK_SNBT_CHAPTER_DICT)}, {})
+        chapter = parsed["mock"]
+        assert chapter._fingerprint is not None
+        assert chapter.quests[0]._fingerprint is not None
+
+    def test_edit_rehashes_only_the_edited_path(self, chapter, quest, task):
+        untouched = create_quest("q_untouched", 0, 0)
+        chapter = add_quest_to_chapter(chapter, untouched)
+        before = module.chapter_hash(chapter)
+
+        new_quest = edit_task_in_quest(quest, task.id, task.model_copy(update={'count': 1}))
+        assert new_quest._fingerprint is not None and new_quest._fingerprint != module.quest_hash(quest)
+        updated = edit_quest_in_chapter(chapter, quest.id, new_quest)
+
+        assert updated._fingerprint is not None and updated._fingerprint != before
+        assert updated.quests[1] is untouched # Reused with its cached hash
+        assert module.chapter_hash(chapter) == before
+
+    def test_fingerprint_ignored_by_equality_and_cleared_on_assignment(self, quest):
+        twin = quest.model_copy(deep=True)
+        module.quest_hash(quest)
+        assert quest == twin
+        quest.x = 42.0
+        assert quest._fingerprint is None
+        assert module.quest_hash(quest) != module.quest_hash(twin)
+
+    def test_nested_mutations_invalidate_parent_hashes(self, chapter, tmp_path):
+        original = chapter.model_copy(deep=True)
+        # Assignment at any depth is tracked; lists and dicts are replaced, not changed in place
+        mutations = [
+            lambda c: setattr(c.quests[0], 'x', 99.0),
+            lambda c: setattr(c.quests[0].tasks[0].item, 'id', "minecraft:iron"),
+            lambda c: setattr(c.quests[0].tasks[0].item, 'components', {'damage': 3}),
+            lambda c: setattr(c.quests[0], 'dependencies', [*c.quests[0].dependencies, "another_dep"]),
+            lambda c: setattr(c.quests[0].rewards[0], 'count', 7),
+        ]
+        db_path = str(tmp_path / "book.db")
+        module.export_to_sqlite({"key": chapter}, db_path)
+        for mutate in mutations:
+            before = module.chapter_hash(chapter)
+            mutate(chapter)
+            assert module.chapter_hash(chapter) != before
+            assert module.changed_chapter_keys({"key": chapter}, {"key": original}) == ["key"]
+            assert module.export_to_sqlite({"key": chapter}, db_path)['written'] == 1
+        assert module.load_chapters_from_sqlite(db_path, lazy=False)["key"] == chapter
+
+    def test_cached_hash_is_a_cache_hit(self, chapter):
+        module.chapter_hash(chapter)
+        with patch('module.controller.quest_hash.content_hash') as rehash, \
+             patch.object(type(chapter), 'model_dump') as dump:
+            module.chapter_hash(chapter)
+        rehash.assert_not_called()
+        dump.assert_not_called()
+
+
+# --- Test Component: Book Lint ---
+
+class TestLint(TestDataFixtures):
+    """Verifies module/controller/quest_lint.py and the lint command."""
+
+    @pytest.fixture
+    def broken_book(self, chapter):
+        other = Chapter(
+            id="chap_other", filename="other", group="tests", order_index=2, autofocus_quest_id="nowhere",
+            quests=[
+                create_quest("q_test_edit", 0, 0, title="Clash"),
+                create_quest("q_lonely", 1, 1, dependencies=["q_ghost"]),
+            ],
+        )
+        return {"main": chapter, "other": other}
+
+    def _codes(self, diagnostics):
+        return sorted((d.code, d.object_id) for d in diagnostics)
+
+    def test_clean_book_has_no_errors(self, chapter):
+        good = chapter.model_copy(update={'quests': [q.model_copy(update={'dependencies': [], 'title': 'Gold'}) for q in chapter.quests]})
+        assert module.lint_book({"main": good}, workers=1) == []
+
+    def test_all_checks(self, broken_book):
+        lang = {"quest.q_lonely.title": "Lonely", "quest.DEADBEEF.title": "Orphan"}
+        diagnostics = module.lint_book(broken_book, lang, workers=1)
+        assert self._codes(diagnostics) == [
+            ('duplicate-id', 'q_test_edit'),
+            ('missing-autofocus', 'nowhere'),
+            ('missing-dependency', 'q_lonely'),
+            ('missing-dependency', 'q_test_edit'),
+            ('missing-title', 'q_test_edit'),
+            ('no-tasks', 'q_lonely'),
+            ('no-tasks', 'q_test_edit'),
+            ('orphan-lang-key', 'DEADBEEF'),
+        ]
+        assert diagnostics[0].severity == 'error' # Errors sort first
+
+    def test_process_pool_matches_inline(self, broken_book):
+        assert module.lint_book(broken_book, workers=2) == module.lint_book(broken_book, workers=1)
+
+    def test_lint_runs_inline_by_default(self, broken_book):
+        with patch('module.controller.quest_lint.ProcessPoolExecutor', side_effect=AssertionError("pool used")):
+            assert module.lint_book(broken_book) == module.lint_book(broken_book, workers=1)
+
+    @patch('cli.load_data_for_cli')
+    def test_lint_command_ndjson_and_exit_code(self, mock_loader, broken_book, monkeypatch, capfd):
+        from cli import main
+        mock_loader.return_value = broken_book
+        monkeypatch.setattr(sys, 'argv', ['cli.py', 'lint', '--format', 'ndjson', '--workers', '1'])
+        with pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code == 1
+        import json
+        lines = [json.loads(line) for line in capfd.readouterr().out.splitlines()]
+        assert lines[0]['code'] == 'duplicate-id'
+
+
+# --- Test Component: Multi-Locale Lang Store ---
+
+class TestLangStore(TestDataFixtures):
+    """Verifies module/controller/lang_store.py and display-time title resolution."""
+
+    @pytest.fixture
+    def lang_dir(self, tmp_path):
+        lang = tmp_path / "quests" / "lang"
+        lang.mkdir(parents=True)
+        (tmp_path / "quests" / "chapters").mkdir()
+        (lang / "en_us.snbt").write_text(
+            '{\n"quest.q_test_edit.title": "Gold Rush"\n"quest.q_test_edit.quest_subtitle": "Shiny"\n'
+            '"task.t_gold_collect.title": "Collect gold"\n"chapter.chap_test_edit.title": "Edit Chapter"\n}'
+        )
+        (lang / "de_de.snbt").write_text('{\n"quest.q_test_edit.title": "Goldrausch"\n}')
+        return lang
+
+    def test_discovers_locales_and_loads_lazily(self, lang_dir):
+        store = module.LangStore.for_chapters_dir(str(lang_dir.parent / "chapters"))
+        assert store.locales == ["de_de", "en_us"]
+        assert not store.is_loaded("de_de") and not store.is_loaded("en_us")
+        assert store.text('quest', 'q_test_edit') == "Gold Rush"
+        assert store.is_loaded("en_us") and not store.is_loaded("de_de")
+
+    def test_locale_fallback_and_fields(self, lang_dir, quest, task, chapter):
+        store = module.LangStore(str(lang_dir), locale="de_de")
+        assert store.title_for(quest) == "Goldrausch"
+        assert store.text('quest', quest.id, 'subtitle') == "Shiny" # Falls back to en_us
+        assert store.title_for(task) == "Collect gold"
+        assert store.title_for(chapter) == "Edit Chapter"
+        assert store.text('quest', 'unknown') is None
+
+    def test_parallel_preload(self, lang_dir):
+        store = module.LangStore(str(lang_dir))
+        store.preload(parallel=True)
+        assert store.is_loaded("de_de") and store.is_loaded("en_us")
+        assert store.merged("de_de")["quest.q_test_edit.quest_subtitle"] == "Shiny"
+
+    def test_parallel_preload_of_large_locales(self, tmp_path):
+        # ftb_snbt_lib is not thread-safe; parallel preloading must still parse every locale
+        lang_dir = tmp_path / "lang"
+        lang_dir.mkdir()
+        locales = [f"l{i}_xx" for i in range(8)]
+        for locale in locales:
+            entries = "\n".join(f'"quest.{k:016X}.title": "{locale} {k}"' for k in range(1500))
+            (lang_dir / f"{locale}.snbt").write_text("{\n" + entries + "\n}")
+        store = module.LangStore(str(lang_dir))
+        with patch('os.cpu_count', return_value=8):
+            store.preload(parallel=True)
+        for locale in locales:
+            assert len(store.load_locale(locale)) == 1500
+            assert store.text('quest', f"{1499:016X}", locale=locale) == f"{locale} 1499"
+
+    def test_parse_chapters_does_not_mutate_raw_dicts(self):
+        import copy
+        raw = {"mock.snbt": copy.deepcopy(MOCK_SNBT_CHAPTER_DICT)}
+        with patch('builtins.print'):
+            parsed = parse_chapters(raw, {"quest.q_alpha.title": "Alpha"})
+        assert parsed["mock"].quests[0].title == "Alpha"
+        assert 'title' not in raw["mock.snbt"]["quests"][0]
+
+    def test_display_resolves_titles_through_store(self, lang_dir, chapter, quest, capfd):
+        store = module.LangStore(str(lang_dir))
+        display_quests(chapter, store)
+        display_quest_details(quest, store)
+        out, err = capfd.readouterr()
+        assert "Gold Rush" in out
+        assert "Subtitle: Shiny" in out
+
+
+# --- Test Component: Translation Coverage ---
+
+class TestLangCoverage(TestDataFixtures):
+    """Verifies module/controller/lang_coverage.py and the 'lang coverage' command."""
+
+    @pytest.fixture
+    def store(self):
+        return module.LangStore(preloaded={
+            "en_us": {
+                "chapter.chap_test_edit.title": "Edit",
+                "quest.q_test_edit.title": "Gold Rush",
+                "quest.q_test_edit.quest_desc": ["Collect gold"],
+            },
+            "de_de": {
+                "chapter.chap_test_edit.title": "Edit",
+                "quest.q_test_edit.title": "Goldrausch",
+                "quest.GONE.title": "Weg",
+            },
+        })
+
+    def test_required_keys_per_chapter(self, parsed_chapters):
+        needed = module.required_lang_keys(parsed_chapters, ["quest.q_test_edit.quest_desc", "quest.OTHER.title"])
+        assert needed == {"test_chapter_key": {
+            "chapter.chap_test_edit.title", "quest.q_test_edit.title", "quest.q_test_edit.quest_desc",
+        }}
+
+    def test_coverage_report(self, parsed_chapters, store):
+        report = module.lang_coverage(parsed_chapters, store)
+        assert report['needed'] == 3
+        en, de = report['locales']['en_us'], report['locales']['de_de']
+        assert en['coverage'] == 100.0 and en['identical'] == []
+        assert de['missing'] == ["quest.q_test_edit.quest_desc"]
+        assert de['orphaned'] == ["quest.GONE.title"]
+        assert de['identical'] == ["chapter.chap_test_edit.title"]
+        assert de['chapters'] == {"test_chapter_key": 66.7}
+
+    def test_unreadable_locale_is_an_error(self, parsed_chapters, tmp_path, monkeypatch, capfd):
+        import cli
+        lang_dir = tmp_path / "lang"
+        lang_dir.mkdir()
+        (lang_dir / "en_us.snbt").write_text('{\n"quest.q_test_edit.title": "Gold Rush"\n}')
+        (lang_dir / "de_de.snbt").write_text('{\n"quest.q_test_edit.title": \n')
+        store = module.LangStore(str(lang_dir))
+        with patch('builtins.print'):
+            report = module.lang_coverage(parsed_chapters, store)
+        assert report['locales']['en_us']['present'] == 1
+        assert set(report['locales']['de_de']) == {'error'}
+
+        monkeypatch.setattr(cli, 'load_data_for_cli', lambda **kwargs: parsed_chapters)
+        monkeypatch.setitem(cli._session, 'lang', module.LangStore(str(lang_dir)))
+        monkeypatch.setattr(sys, 'argv', ['cli.py', 'lang', 'coverage'])
+        with pytest.raises(SystemExit) as exit_info:
+            cli.main()
+        out, err = capfd.readouterr()
+        assert exit_info.value.code == 1
+        assert "de_de" in out and "could not be loaded" in out
+
+    @patch('cli.load_data_for_cli')
+    def test_lang_coverage_command(self, mock_loader, parsed_chapters, store, monkeypatch, capfd):
+        import cli
+        mock_loader.return_value = parsed_chapters
+        monkeypatch.setitem(cli._session, 'lang', store)
+        monkeypatch.setattr(sys, 'argv', ['cli.py', 'lang', 'coverage', '--locales', 'de_de', '--show-keys'])
+        cli.main()
+        out, err = capfd.readouterr()
+        assert "de_de" in out and "66.7%" in out
+        assert "missing:" in out and "quest.q_test_edit.quest_desc" in out
+
+
+# --- Test Component: Incremental Validation ---
+
+class TestIncrementalValidation(TestDataFixtures):
+    """Verifies module/controller/quest_validate.py."""
+
+    @pytest.fixture
+    def book(self, chapter):
+        base = Quest(id="dep_quest_id", x=0.0, y=0.0, tasks=[Task(id="t_base", type="checkmark")])
+        return {"test_chapter_key": add_quest_to_chapter(chapter, base)}
+
+    def test_clean_edit_has_no_diagnostics(self, book):
+        validator = module.IncrementalValidator(book)
+        chapter = book["test_chapter_key"]
+        moved = edit_quest_position(chapter.quests[0], 1.0, 2.0)
+        assert validator.apply("test_chapter_key", edit_quest_in_chapter(chapter, moved.id, moved)) == []
+
+    def test_only_edited_subtree_is_revalidated(self, book):
+        validator = module.IncrementalValidator(book)
+        chapter = book["test_chapter_key"]
+        broken = chapter.quests[0].model_copy(update={'dependencies': ["no_such_quest"]})
+        with patch.object(Task, 'model_validate', wraps=Task.model_validate) as task_validate, \
+                patch.object(Quest, 'model_validate', wraps=Quest.model_validate) as quest_validate:
+            diagnostics = validator.apply("test_chapter_key", edit_quest_in_chapter(chapter, broken.id, broken))
+        assert [d.code for d in diagnostics] == ['missing-dependency']
+        assert diagnostics[0].object_id == "q_test_edit"
+        assert quest_validate.call_count == 1
+        task_validate.assert_not_called()
+
+    def test_cross_references_of_edit(self, book):
+        validator = module.IncrementalValidator(book)
+        chapter = book["test_chapter_key"]
+        removed = remove_quest_from_chapter(chapter, "dep_quest_id")
+        diagnostics = validator.apply("test_chapter_key", removed)
+        assert [(d.code, d.object_id) for d in diagnostics] == [('missing-dependency', 'q_test_edit')]
+
+        clone = create_quest("q_test_edit", 9.0, 9.0)
+        diagnostics = validator.apply("test_chapter_key", add_quest_to_chapter(removed, clone))
+        assert [(d.code, d.object_id) for d in diagnostics] == [('duplicate-id', 'q_test_edit')]
+
+
+# --- Test Component: Async Loading ---
+
+class TestAsyncLoading:
+    """Verifies module/controller/async_loader.py."""
+
+    @pytest.fixture
+    def modpack(self, tmp_path):
+        quests = tmp_path / "config" / "ftbquests" / "quests"
+        (quests / "chapters").mkdir(parents=True)
+        (quests / "lang").mkdir()
+        for key in ("alpha", "beta"):
+            (quests / "chapters" / f"{key}.snbt").write_text(
+                f'{{\n id: "{key}_id"\n filename: "{key}"\n group: ""\n order_index: 0\n'
+                f' quests: [{{ id: "q_{key}", x: 0.0d, y: 0.0d }}]\n}}'
+            )
+        (quests / "chapters" / "broken.snbt").write_text('{ id: "broken" }')
+        (quests / "lang" / "en_us.snbt").write_text('{\n"quest.q_alpha.title": "Alpha"\n}')
+        return tmp_path
+
+    def test_load_book_async_matches_blocking_loader(self, modpack):
+        import asyncio
+        with patch('builtins.print'):
+            chapters = asyncio.run(module.load_book_async(str(modpack)))
+            expected = module.load_book_from_directory(str(modpack))
+        assert list(chapters) == ["alpha", "beta"]
+        assert chapters == expected
+        assert chapters["alpha"].quests[0].title == "Alpha"
+
+    def test_many_large_chapters_parse_concurrently(self, tmp_path):
+        # ftb_snbt_lib shares one lexer per process; concurrent parses must not interleave
+        import asyncio
+        chapters_dir = tmp_path / "chapters"
+        chapters_dir.mkdir()
+        for c in range(40):
+            quests = " ".join(
+                f'{{ id: "q{c}_{i}" x: {i}.0d y: 0.0d dependencies: ["q{c}_{i - 1}"] '
+                f'tasks: [{{ id: "t{c}_{i}" type: "item" item: {{ id: "minecraft:stone" count: 1 }} count: 8L }}] }}'
+                for i in range(60)
+            )
+            (chapters_dir / f"chapter_{c:02d}.snbt").write_text(
+                f'{{ id: "c{c}" filename: "chapter_{c:02d}" group: "" order_index: {c} quests: [{quests}] }}'
+            )
+        expected = module.parse_chapters(module.load_chapter_data(str(chapters_dir)))
+        chapters = asyncio.run(module.load_book_async(str(chapters_dir)))
+        assert len(chapters) == 40
+        assert chapters == dict(sorted(expected.items()))
+
+    def test_stream_can_be_closed_early(self, modpack):
+        import asyncio
+
+        async def first_chapter():
+            stream = module.iter_book_async(str(modpack))
+            async for item in stream:
+                await stream.aclose()
+                return item, [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+
+        with patch('builtins.print'):
+            (chapter_key, chapter), leftover = asyncio.run(first_chapter())
+        assert chapter_key in ("alpha", "beta")
+        assert isinstance(chapter, Chapter)
+        assert leftover == []
+
+
+# --- Test Component: Batch Analysis ---
+
+class TestBatchAnalysis:
+    """Verifies module/controller/quest_batch.py and the 'batch' command."""
+
+    @pytest.fixture
+    def instances(self, tmp_path):
+        for name, item in (("pack_a", "minecraft:gold_ingot"), ("pack_b", "minecraft:iron_ingot")):
+            chapters = tmp_path / name / "config" / "ftbquests" / "quests" / "chapters"
+            chapters.mkdir(parents=True)
+            (chapters / "main.snbt").write_text(
+                '{ id: "c1" filename: "main" group: "" order_index: 0 quests: [\n'
+                f' {{ id: "q1" title: "One" x: 0.0d y: 0.0d tasks: [{{ id: "t1" type: "item" item: {{ id: "{item}" }} }}]\n'
+                '   rewards: [{ id: "r1" type: "item" item: { id: "minecraft:gold_ingot" } }] }\n'
+                ' { id: "q2" title: "Two" x: 1.0d y: 0.0d dependencies: ["MISSING"] }\n]}'
+            )
+        return tmp_path
+
+    def test_batch_aggregates_instances(self, instances):
+        roots = module.expand_roots([str(instances / "pack_*"), str(instances / "nowhere")])
+        with patch('builtins.print'):
+            report = module.batch_analyze(roots, workers=1)
+        totals = report['totals']
+        assert (totals['loaded'], totals['failed'], totals['quests']) == (2, 1, 4)
+        assert report['diagnostics'] == {'missing-dependency': 2, 'no-tasks': 2}
+        assert report['items']['minecraft:gold_ingot'] == {'uses': 3, 'instances': 2}
+        assert report['items']['minecraft:iron_ingot'] == {'uses': 1, 'instances': 1}
+
+    @patch('cli.load_data_for_cli')
+    def test_batch_command_does_not_load_book(self, mock_loader, instances, monkeypatch, capfd):
+        import cli
+        monkeypatch.setattr(sys, 'argv', ['cli.py', 'batch', str(instances / "pack_*"), '--workers', '1', '--format', 'json'])
+        cli.main()
+        mock_loader.assert_not_called()
+        out, err = capfd.readouterr()
+        report = json.loads(out)
+        assert report['totals']['chapters'] == 2
+
+    def test_batch_json_reports_load_errors_per_instance(self, instances, monkeypatch, capfd):
+        import cli
+        chapters = instances / "pack_b" / "config" / "ftbquests" / "quests" / "chapters"
+        (chapters / "broken.snbt").write_text("{ id: ")
+        (chapters / "invalid.snbt").write_text('{ id: "c2" }')
+        monkeypatch.setattr(sys, 'argv', ['cli.py', 'batch', str(instances / "pack_*"), '--workers', '1', '--format', 'json'])
+        cli.main()
+        out, err = capfd.readouterr()
+        report = json.loads(out)
+        assert err == ""
+        pack_a, pack_b = report['instances']
+        assert [m.split(":")[0] for m in pack_a['load_errors']] == ["Warning"]
+        assert pack_b['chapters'] == 1
+        assert any(m.startswith("Failed to read chapter broken") for m in pack_b['load_errors'])
+        assert any(m.startswith("Failed to mount chapter invalid") for m in pack_b['load_errors'])
+
+
+# --- Test Component: Launcher Instance Scanner ---
+
+class TestInstanceScanner:
+    """Verifies module/controller/instance_scanner.py and --root discovery."""
+
+    @pytest.fixture
+    def instances_dir(self, tmp_path):
+        instances = tmp_path / "PrismLauncher" / "instances"
+        for name, game_dir in (("Pack A", ".minecraft"), ("Pack B", "minecraft")):
+            chapters = instances / name / game_dir / "config" / "ftbquests" / "quests" / "chapters"
+            chapters.mkdir(parents=True)
+            (chapters / "main.snbt").write_text("{}")
+        (instances / "Vanilla" / ".minecraft" / "mods").mkdir(parents=True)
+        return instances
+
+    def test_scan_finds_instances_within_depth(self, instances_dir):
+        found = module.scan_instances([str(instances_dir)])
+        assert [Path(p).parts[-6] for p in found] == ["Pack A", "Pack B"]
+        assert module.scan_for_chapters(str(instances_dir), max_depth=1) == []
+
+    def test_root_discovery_is_not_remembered(self, instances_dir, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config_home"))
+        monkeypatch.setattr(sys, 'platform', 'linux')
+        with patch('builtins.print'):
+            found = find_chapters_directory(str(instances_dir / "Pack B"))
+        assert found.endswith(os.path.join("minecraft", "config", "ftbquests", "quests", "chapters"))
+        assert module.load_remembered_chapters_dir() is None
+
+    def test_scanned_discovery_is_remembered(self, instances_dir, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config_home"))
+        monkeypatch.setattr(sys, 'platform', 'linux')
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(sys, 'argv', [str(tmp_path / "cli.py")])
+        pack_b = str(instances_dir / "Pack B" / "minecraft" / "config" / "ftbquests" / "quests" / "chapters")
+        with patch('module.controller.ftb_loader.scan_instances', return_value=[pack_b]), patch('builtins.print'):
+            assert find_chapters_directory() == pack_b
+        assert module.load_remembered_chapters_dir() == os.path.abspath(pack_b)
+        with patch('builtins.print'), patch('builtins.input', side_effect=AssertionError("prompted")):
+            assert find_chapters_directory() == os.path.abspath(pack_b)
+
+    def test_ambiguous_or_empty_root_fails_without_prompting(self, instances_dir, tmp_path, monkeypatch, capsys):
+        import cli
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config_home"))
+        monkeypatch.setattr(sys, 'platform', 'linux')
+        for root in (instances_dir, tmp_path / "empty"):
+            monkeypatch.setattr(sys, 'argv', ['cli.py', '--root', str(root), 'view', 'chapters'])
+            with patch('builtins.input', side_effect=AssertionError("prompted")), pytest.raises(SystemExit) as exc:
+                cli.main()
+            assert exc.value.code == 1
+        out, err = capsys.readouterr()
+        assert "Pack A" in err and "Pack B" in err
+        assert "No FTB Quests chapters found under --root" in err
+        assert module.load_remembered_chapters_dir() is None
+
+    @pytest.mark.parametrize("command", [
+        ['view', 'chapters', '--format', 'json'],
+        ['view', 'chapters', '--format', 'ndjson'],
+        ['economy', '--format', 'json'],
+        ['progression', '--format', 'json'],
+        ['chapter-graph', '--format', 'json'],
+        ['stats', '--format', 'json'],
+        ['lint', '--format', 'json'],
+    ])
+    def test_machine_formats_keep_discovery_off_stdout(self, command, instances_dir, tmp_path, monkeypatch, capfd):
+        import cli
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config_home"))
+        monkeypatch.setattr(sys, 'platform', 'linux')
+        chapters = instances_dir / "Pack A" / ".minecraft" / "config" / "ftbquests" / "quests" / "chapters"
+        (chapters / "main.snbt").write_text(
+            '{ id: "c1" filename: "main" group: "" order_index: 0 quests: [{ id: "q1" x: 0.0d y: 0.0d }] }'
+        )
+        (chapters / "broken.snbt").write_text("{ id: ")
+        monkeypatch.setattr(sys, 'argv', ['cli.py', '--root', str(instances_dir / "Pack A"), *command])
+        try:
+            cli.main()
+        except SystemExit:
+            pass  # lint exits 1 on findings
+        out, err = capfd.readouterr()
+        if 'ndjson' in command:
+            assert [json.loads(line)['key'] for line in out.splitlines()] == ["main"]
+        else:
+            json.loads(out)
+        assert "Found Quests" in err and "broken" in err
+
+
+# --- Test Component: Buffered Rendering ---
+
+class TestBufferedRendering(TestDataFixtures):
+    """Verifies module/view/render.py and the render_* string API of the views."""
+
+    @pytest.fixture
+    def big_chapter(self, chapter):
+        quests = [create_quest(f"q{i:04d}", float(i), 0.0, title=f"Quest {i}") for i in range(2000)]
+        return chapter.model_copy(update={'quests': quests})
+
+    def test_render_functions_return_text(self, parsed_chapters, chapter, quest, task):
+        assert "TEST_CHAPTER_KEY" in module.render_chapters(parsed_chapters)
+        assert "\x1b[" in module.render_quests(chapter)
+        details = module.render_quest_details(quest, color=False)
+        assert "\x1b[" not in details and "Dependencies: dep_quest_id" in details
+        assert "Optional Task: Yes" in module.render_task_reward_details(task, quest.id, color=False)
+
+    def test_display_writes_one_screen_at_once(self, big_chapter, monkeypatch):
+        import module.view.render as render
+        stream = MagicMock()
+        stream.isatty.return_value = True
+        monkeypatch.setattr(render, '_color_mode', None)
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        monkeypatch.setattr(sys, 'stdout', stream)
+        display_quests(big_chapter)
+        assert stream.write.call_count == 1
+        text = stream.write.call_args[0][0]
+        assert text.count("\n") == 2000 + 4
+        assert "\x1b[" in text
+
+    def test_no_color_option(self, parsed_chapters, monkeypatch, capfd):
+        import cli
+        import module.view.render as render
+        monkeypatch.setattr(render, '_color_mode', True)
+        monkeypatch.setattr(cli, 'load_data_for_cli', lambda **kwargs: parsed_chapters)
+        monkeypatch.setattr(sys, 'argv', ['cli.py', '--no-color', 'view', 'chapters'])
+        cli.main()
+        out, err = capfd.readouterr()
+        assert "TEST_CHAPTER_KEY" in out and "\x1b[" not in out
+
+
+# --- Test Component: Quest Pager ---
+
+class TestQuestPager(TestDataFixtures):
+    """Verifies module/view/quest_pager.py and paging in the interactive CLI."""
+
+    @pytest.fixture
+    def big_chapter(self, chapter):
+        quests = [create_quest(f"q{i:04d}", float(i), 0.0, title=f"Quest {i}") for i in range(95)]
+        quests[50] = quests[50].model_copy(update={'title': "Iron Age"})
+        return chapter.model_copy(update={'quests': quests})
+
+    def test_pages_and_filter(self, big_chapter):
+        pager = module.QuestPager(page_size=40)
+        first = pager.render(big_chapter, color=False)
+        assert "[0] Quest 0" in first and "[40]" not in first
+        assert "Page 1/3 (quests 1-40 of 95)" in first
+
+        assert pager.go_to(3) and not pager.next_page()
+        assert "[94] Quest 94" in pager.render(big_chapter, color=False)
+
+        pager.set_filter("IRON")
+        filtered = pager.render(big_chapter, color=False)
+        assert "[50] Iron Age q0050" in filtered
+        assert "Page 1/1 (quests 1-1 of 1) | filter: 'iron'" in filtered
+
+    def test_rows_cached_until_chapter_changes(self, big_chapter):
+        pager = module.QuestPager()
+        with patch('module.view.quest_pager.format_quest_row', return_value="row") as fmt:
+            pager.render(big_chapter)
+            pager.next_page()
+            pager.render(big_chapter)
+            assert fmt.call_count == 95
+            moved = edit_quest_position(big_chapter.quests[0], 9.0, 9.0)
+            pager.render(edit_quest_in_chapter(big_chapter, moved.id, moved))
+            assert fmt.call_count == 190
+        assert pager.page == 1  # same chapter, so the page is kept
+
+    def test_interactive_paging_redraws_only_on_change(self, big_chapter, monkeypatch, capfd):
+        from cli import interactive_cli_main
+        inputs = iter(['0', 'next', 'bogus', 'page 9', 'filter iron', 'exit'])
+        monkeypatch.setattr('builtins.input', lambda prompt: next(inputs))
+        interactive_cli_main({"big": big_chapter})
+        out, err = capfd.readouterr()
+        assert "Page 2/3 (quests 41-80 of 95)" in out
+        assert "No such page (1-3)." in out
+        assert "filter: 'iron'" in out
+        assert out.count("CHAPTER: EDIT.SNBT") == 3
+
+    def test_page_usage_and_titles_that_look_like_commands(self, big_chapter, monkeypatch, capfd):
+        from cli import interactive_cli_main
+        quests = list(big_chapter.quests)
+        quests[7] = quests[7].model_copy(update={'title': "Filter Press"})
+        quests[8] = quests[8].model_copy(update={'title': "Next Steps"})
+        chapter = big_chapter.model_copy(update={'quests': quests})
+        inputs = iter(['0', 'page', 'page abc', 'filter press', 'back', 'next steps', 'back', 'exit'])
+        monkeypatch.setattr('builtins.input', lambda prompt: next(inputs))
+        interactive_cli_main({"big": chapter})
+        out, err = capfd.readouterr()
+        assert out.count("Usage: page <n>") == 2
+        assert "filter: 'press'" not in out
+        assert "Filter Press" in out and "Next Steps" in out
+        assert out.count("QUEST DETAILS") == 2
+
+
+# --- Test Component: Tab Completion ---
+
+class TestTabCompletion(TestDataFixtures):
+    """Verifies module/controller/completion.py and selection by ID/title in the interactive CLI."""
+
+    def test_prefix_index_is_case_insensitive_and_sorted(self):
+        index = module.PrefixIndex(["Iron Age", "iron_ore", "Gold", "back", "IRON"])
+        assert index.complete("iro") == ["IRON", "Iron Age", "iron_ore"]
+        assert index.complete("iron a") == ["Iron Age"]
+        assert index.complete("x") == []
+        assert index.complete("", limit=2) == ["back", "Gold"]
+
+    def test_prefix_index_scales(self):
+        import time
+        index = module.PrefixIndex(f"{i:016X}" for i in range(50000))
+        start = time.perf_counter()
+        for _ in range(1000):
+            matches = index.complete("0000000000000C3")
+        assert len(matches) == 16
+        assert time.perf_counter() - start < 0.5
+
+    def test_quest_index_and_completer(self, chapter, quest):
+        index = module.QuestIndex(chapter.model_copy(update={'quests': [quest.model_copy(update={'title': "Gold Rush"})]}))
+        assert index.find("GOLD RUSH") == 0 and index.find("q_test_edit") == 0
+        assert index.find("nothing") is None
+
+        completer = module.Completer()
+        completer.set_index(index.completions)
+        assert [completer.complete("g", state) for state in range(2)] == ["Gold Rush", None]
+        completer.set_index(module.quest_detail_completions(quest))
+        assert completer.complete("ta", 0) == "task 0"
+
+    def test_select_quest_by_id_or_title(self, chapter, monkeypatch, capfd):
+        from cli import interactive_cli_main
+        quests = [create_quest("AAAA0000", 0.0, 0.0, title="First"), create_quest("BBBB1111", 1.0, 0.0, title="Second Step")]
+        book = {"book": chapter.model_copy(update={'quests': quests})}
+        inputs = iter(['0', 'bbbb1111', 'back', 'second step', 'exit'])
+        monkeypatch.setattr('builtins.input', lambda prompt: next(inputs))
+        interactive_cli_main(book)
+        out, err = capfd.readouterr()
+        assert out.count("QUEST DETAILS: Second Step BBBB1111") == 2
+
+
+# --- Test Component: Script Mode and Saving ---
+
+class TestScriptMode:
+    """Verifies module/controller/ftb_saver.py and the 'run' command."""
+
+    CHAPTER_SNBT = (
+        '{{ id: "{key}_id" filename: "{key}" group: "" order_index: 0 size: 1.5f quests: [\n'
+        ' {{ id: "{key}_q" x: 0.0d y: 0.0d shape: "gear" tasks: [{{ id: "{key}_t" type: "item" item: {{ id: "minecraft:stone" }} count: 8L }}] }}\n]}}'
+    )
+
+    @pytest.fixture
+    def modpack(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config_home"))
+        monkeypatch.setattr(sys, 'platform', 'linux')
+        chapters = tmp_path / "pack" / "config" / "ftbquests" / "quests" / "chapters"
+        chapters.mkdir(parents=True)
+        for key in ("alpha", "beta"):
+            (chapters / f"{key}.snbt").write_text(self.CHAPTER_SNBT.format(key=key))
+        return chapters
+
+    def test_saved_snbt_keeps_unknown_keys_and_tag_types(self, modpack):
+        import ftb_snbt_lib as fslib
+        raw = fslib.loads((modpack / "alpha.snbt").read_text())
+        chapter = module.parse_chapters({"alpha.snbt": raw})["alpha"]
+        moved = edit_quest_position(chapter.quests[0], 4.5, -2.0)
+        text = module.chapter_to_snbt(edit_quest_in_chapter(chapter, moved.id, moved), raw)
+        assert "x: 4.5d" in text and "size: 1.5f" in text and 'shape: "gear"' in text and "count: 8L" in text
+        assert module.parse_chapters({"alpha.snbt": fslib.loads(text)})["alpha"].quests[0].x == 4.5
+
+    def test_saved_chapter_with_new_keys_reloads(self, modpack):
+        import ftb_snbt_lib as fslib
+        raw = fslib.loads((modpack / "alpha.snbt").read_text())
+        chapter = module.parse_chapters({"alpha.snbt": raw})["alpha"]
+        task = chapter.quests[0].tasks[0]
+        item = task.item.model_copy(update={'components': {"minecraft:custom_name": "Named", "a key": {"true_flag": 1}}})
+        quest = edit_task_in_quest(chapter.quests[0], task.id, task.model_copy(update={'item': item}))
+        edited = edit_quest_in_chapter(chapter, quest.id, quest)
+        module.save_chapter("alpha", edited, str(modpack), raw)
+
+        reloaded = module.parse_chapters(module.load_chapter_data(str(modpack)))
+        assert set(reloaded) == {"alpha", "beta"}
+        assert reloaded["alpha"].quests[0].tasks[0].item.components == {"minecraft:custom_name": "Named", "a key": {"true_flag": 1}}
+        assert reloaded["alpha"].quests[0].tasks[0].count == 8
+
+    def test_run_script_saves_only_changed_chapters_once(self, modpack, tmp_path, monkeypatch, capfd):
+        import cli
+        script = tmp_path / "build.txt"
+        script.write_text(
+            "# move a quest twice, then save\n"
+            "edit quest alpha_q position 1 2\n"
+            "edit quest alpha_q position 3 4\n"
+            "view quest alpha_q\n"
+            "save\n"
+        )
+        beta_before = (modpack / "beta.snbt").read_text()
+        monkeypatch.setattr(sys, 'argv', ['cli.py', '--root', str(tmp_path / "pack"), 'run', str(script)])
+        with patch('cli.save_changed_chapters', wraps=cli.save_changed_chapters) as save:
+            cli.main()
+        out, err = capfd.readouterr()
+        assert save.call_count == 1
+        assert "Coords: (3.0, 4.0)" in out
+        assert "Saved 1 chapter file(s)" in out
+        assert "x: 3.0d" in (modpack / "alpha.snbt").read_text()
+        assert (modpack / "beta.snbt").read_text() == beta_before
+
+    def test_run_script_rejects_bad_lines_before_running(self, modpack, tmp_path, monkeypatch, capfd):
+        import cli
+        monkeypatch.setattr(sys, 'stdin', io.StringIO("edit quest alpha_q position 1 2\nsave\nfrobnicate\n"))
+        monkeypatch.setattr(sys, 'argv', ['cli.py', '--root', str(tmp_path / "pack"), 'run', '-'])
+        with pytest.raises(SystemExit):
+            cli.main()
+        out, err = capfd.readouterr()
+        assert "<stdin>:3: invalid command: frobnicate" in out
+        assert "x: 0.0d" in (modpack / "alpha.snbt").read_text()
+
+    def test_run_script_does_not_save_after_a_failed_command(self, modpack, tmp_path, monkeypatch, capfd):
+        import cli
+        monkeypatch.setattr(sys, 'stdin', io.StringIO(
+            "edit quest alpha_q position 1 2\n"
+            "transform alpah --translate 5 5\n"
+            "edit quest missing_q position 0 0\n"
+            "save\n"
+        ))
+        monkeypatch.setattr(sys, 'argv', ['cli.py', '--root', str(tmp_path / "pack"), 'run', '-'])
+        with pytest.raises(SystemExit) as exc, patch('cli.save_changed_chapters') as save:
+            cli.main()
+        assert exc.value.code == 1
+        save.assert_not_called()
+        out, err = capfd.readouterr()
+        assert "Error: Chapter 'alpah' not found." in out
+        assert "Command(s) on line(s) 2, 3 failed." in out
+        assert "Not saving because of the failed command(s)." in out
+        assert "x: 0.0d" in (modpack / "alpha.snbt").read_text()
+
+
+# --- Test Component: JSON Output ---
+
+@patch('cli.load_data_for_cli', return_value={"mock_key": Chapter(**MOCK_SNBT_CHAPTER_DICT)})
+class TestJsonOutput:
+    """Verifies module/view/json_output.py and '--format json|ndjson' on the view commands."""
+
+    @pytest.fixture(autouse=True)
+    def setup_sys_argv(self, monkeypatch):
+        import cli
+        monkeypatch.setattr(sys, 'argv', ['cli.py'])
+        monkeypatch.setitem(cli._session, 'lang', None)
+
+    def run_main(self, args: List[str]):
+        from cli import main
+        sys.argv.extend(args)
+        main()
+
+    def test_view_chapters_json(self, mock_loader, capfd):
+        self.run_main(['view', 'chapters', '--format', 'json'])
+        out, err = capfd.readouterr()
+        assert "\x1b[" not in out
+        records = json.loads(out)
+        assert [r['key'] for r in records] == ['mock_key']
+        assert records[0]['quest_count'] == len(MOCK_SNBT_CHAPTER_DICT['quests'])
+
+    def test_view_chapters_ndjson(self, mock_loader, capfd):
+        self.run_main(['view', 'chapters', '--format', 'ndjson'])
+        out, err = capfd.readouterr()
+        lines = out.splitlines()
+        assert len(lines) == 1 and json.loads(lines[0])['key'] == 'mock_key'
+
+    def test_view_quest_json(self, mock_loader, capfd):
+        self.run_main(['view', 'quest', 'q_alp', '--format', 'json'])
+        out, err = capfd.readouterr()
+        record = json.loads(out)
+        assert record['chapter'] == 'mock_key' and record['id'] == 'q_alpha'
+        assert record['tasks'] or record['rewards']
+
+    def test_view_quest_json_not_found_goes_to_stderr(self, mock_loader, capfd):
+        self.run_main(['view', 'quest', 'missing_id', '--format', 'json'])
+        out, err = capfd.readouterr()
+        assert out == "" and "not found" in err
+
+    def test_write_records_streams_a_generator(self, mock_loader):
+        buf = io.StringIO()
+        assert module.write_records(({'n': i} for i in range(3)), 'json', buf) == 3
+        assert json.loads(buf.getvalue()) == [{'n': 0}, {'n': 1}, {'n': 2}]
+        assert module.write_records(iter(()), 'json', io.StringIO()) == 0
+
+
+# --- Test Component: Reward Economy ---
+
+class TestRewardEconomy:
+    """Verifies module/controller/quest_economy.py and the 'economy' command."""
+
+    @pytest.fixture
+    def book(self):
+        def item(item_id, count=1):
+            return Item(id=item_id, count=count)
+        early = Chapter(id="c1", filename="early", group="start", order_index=0, quests=[
+            Quest(id="q1", x=0, y=0,
+                  tasks=[Task(id="t1", type="item", item=item("minecraft:iron_ingot"), count="16L")],
+                  rewards=[Reward(id="r1", type="item", item=item("minecraft:diamond", 2)),
+                           Reward(id="r2", type="xp", xp=100)]),
+        ])
+        late = Chapter(id="c2", filename="late", group="", order_index=1, quests=[
+            Quest(id="q2", x=0, y=0,
+                  tasks=[Task(id="t2", type="item", item=item("minecraft:diamond"), count=5)],
+                  rewards=[Reward(id="r3", type="item", item=item("minecraft:diamond"), count=3),
+                           Reward(id="r4", type="xp_levels", count=5)]),
+        ])
+        return {"early": early, "late": late}
+
+    def test_item_totals_and_breakdowns(self, book):
+        report = module.economy_report(book)
+        diamond = report['items']['minecraft:diamond']
+        assert (diamond['given'], diamond['required'], diamond['balance']) == (5, 5, 0)
+        assert diamond['chapters'] == {"late": 3, "early": 2}
+        assert diamond['groups'] == {"": 3, "start": 2}
+        assert report['items']['minecraft:iron_ingot']['balance'] == -16
+        assert list(report['items']) == ['minecraft:diamond', 'minecraft:iron_ingot']
+
+    def test_xp_and_type_totals(self, book):
+        report = module.economy_report(book)
+        assert report['xp'] == {'xp': 100, 'xp_levels': 5}
+        assert report['reward_types'] == {'item': 2, 'xp': 1, 'xp_levels': 1}
+        assert report['groups']['start'] == {'items_required': 16, 'rewards': 2, 'items_given': 2, 'xp': 100}
+
+    def test_item_filter(self, book):
+        assert list(module.economy_report(book, items=["minecraft:iron_ingot"])['items']) == ['minecraft:iron_ingot']
+
+    def test_quest_details_show_xp_amounts(self, book):
+        assert "Type: xp | XP: 100" in module.render_quest_details(book["early"].quests[0], color=False)
+        assert "Type: xp_levels | XP levels: 5" in module.render_quest_details(book["late"].quests[0], color=False)
+        assert "XP: 100" in module.render_task_reward_details(book["early"].quests[0].rewards[1], color=False)
+
+    def test_economy_command(self, book, monkeypatch, capfd):
+        from cli import main
+        import module.view.render as render
+        monkeypatch.setattr(render, '_color_mode', None)
+        monkeypatch.setattr(sys, 'argv', ['cli.py', '--no-color', 'economy', '--item', 'minecraft:diamond'])
+        with patch('cli.load_data_for_cli', return_value=book):
+            main()
+        out, err = capfd.readouterr()
+        assert "minecraft:diamond: 5 / 5 (+0)" in out
+        assert "chapter late: 3" in out and "group [no group]: 3" in out
+
+
+# --- Test Component: Progression ---
+
+class TestProgression:
+    """Verifies module/controller/quest_progression.py and the 'progression' command."""
+
+    @pytest.fixture
+    def book(self):
+        # a -> b -> c (cross-chapter) and a -> c directly; d stands alone; e <-> f form a cycle
+        start = Chapter(id="c1", filename="start", group="", order_index=0, quests=[
+            Quest(id="a", x=0, y=0),
+            Quest(id="b", x=0, y=0, dependencies=["a", "missing"]),
+            Quest(id="d", x=0, y=0),
+        ])
+        end = Chapter(id="c2", filename="end", group="", order_index=1, quests=[
+            Quest(id="c", title="Endgame", x=0, y=0, dependencies=["a", "b"]),
+            Quest(id="e", x=0, y=0, dependencies=["f"]),
+            Quest(id="f", x=0, y=0, dependencies=["e"]),
+        ])
+        return {"start": start, "end": end}
+
+    def test_depths_follow_longest_chain(self, book):
+        progression = module.compute_progression(book)
+        assert {qid: progression['depth'][qid] for qid in "abcd"} == {"a": 0, "b": 1, "c": 2, "d": 0}
+        assert progression['cyclic'] == ["e", "f"]
+        assert module.critical_path(progression, "c") == ["a", "b", "c"]
+
+    def test_histograms_and_report(self, book):
+        report = module.progression_report(book, target="c")
+        assert report['max_depth'] == 2 and report['deepest'] == ["c"]
+        assert report['chapters']['start']['histogram'] == {0: 2, 1: 1}
+        assert [step['id'] for step in report['critical_path']] == ["a", "b", "c"]
+        assert report['critical_path'][-1] == {'id': "c", 'chapter': "end", 'depth': 2, 'title': "Endgame"}
+
+    def test_self_dependency_is_reported_as_cyclic(self):
+        chapter = Chapter(id="c", filename="c", group="", order_index=0, quests=[
+            Quest(id="a", x=0, y=0),
+            Quest(id="s", x=0, y=0, dependencies=["a", "s"]),
+            Quest(id="t", x=0, y=0, dependencies=["s"]),
+        ])
+        progression = module.compute_progression({"c": chapter})
+        assert progression['cyclic'] == ["s"]
+        assert progression['blocked'] == []
+        assert {qid: progression['depth'][qid] for qid in "ast"} == {"a": 0, "s": 1, "t": 2}
+        assert module.progression_report({"c": chapter})['cyclic'] == ["s"]
+
+    def test_quests_behind_a_cycle_are_blocked_not_cyclic(self, monkeypatch, capfd):
+        from cli import main
+        import module.view.render as render
+        # x <-> y is the cycle; z and w only sit downstream of it, v depends on z and on a placed quest
+        chapter = Chapter(id="c", filename="c", group="", order_index=0, quests=[
+            Quest(id="w", x=0, y=0, dependencies=["z"]),
+            Quest(id="v", x=0, y=0, dependencies=["z", "u"]),
+            Quest(id="z", x=0, y=0, dependencies=["y"]),
+            Quest(id="u", x=0, y=0),
+            Quest(id="x", x=0, y=0, dependencies=["y"]),
+            Quest(id="y", x=0, y=0, dependencies=["x"]),
+        ])
+        progression = module.compute_progression({"c": chapter})
+        assert progression['cyclic'] == ["x", "y"]
+        assert progression['blocked'] == ["w", "v", "z"]
+        assert {qid: progression['depth'][qid] for qid in "xyzwv"} == {"x": 0, "y": 1, "z": 2, "w": 3, "v": 3}
+        assert module.critical_path(progression, "w") == ["x", "y", "z", "w"]
+
+        monkeypatch.setattr(render, '_color_mode', None)
+        monkeypatch.setattr(sys, 'argv', ['cli.py', '--no-color', 'progression'])
+        with patch('cli.load_data_for_cli', return_value={"c": chapter}):
+            main()
+        out, err = capfd.readouterr()
+        assert "2 quest(s) in dependency cycles: x, y" in out
+        assert "3 quest(s) blocked behind a cycle: w, v, z" in out
+
+    def test_long_chain_stays_linear(self):
+        quests = [Quest(id=f"q{i}", x=0, y=0, dependencies=[f"q{i - 1}"] if i else []) for i in range(20000)]
+        chapter = Chapter(id="long", filename="long", group="", order_index=0, quests=quests[::-1])
+        progression = module.compute_progression({"long": chapter})
+        assert progression['depth']["q19999"] == 19999
+        assert len(module.critical_path(progression, "q19999")) == 20000
+
+    def test_progression_command(self, book, monkeypatch, capfd):
+        from cli import main
+        monkeypatch.setattr(sys, 'argv', ['cli.py', 'progression', '--target', 'c', '--format', 'json'])
+        with patch('cli.load_data_for_cli', return_value=book):
+            main()
+        out, err = capfd.readouterr()
+        report = json.loads(out)
+        assert report['target'] == "c" and report['chapters']['end']['histogram'] == {"0": 1, "1": 1, "2": 1}
+
+
+# --- Test Component: Chapter Graph ---
+
+class TestChapterGraph:
+    """Verifies module/controller/chapter_graph.py and the 'chapter-graph' command."""
+
+    @pytest.fixture
+    def book(self):
+        basics = Chapter(id="c1", filename="basics", group="main", order_index=1, quests=[
+            Quest(id="b1", x=0, y=0),
+            Quest(id="b2", x=0, y=0, dependencies=["b1"]),
+        ])
+        tools = Chapter(id="c2", filename="tools", group="main", order_index=0, quests=[
+            Quest(id="t1", x=0, y=0, dependencies=["b1", "b2"]),
+            Quest(id="t2", x=0, y=0, dependencies=["b2", "x1"]),
+        ])
+        extra = Chapter(id="c3", filename="extra", group="side", order_index=0, quests=[
+            Quest(id="x1", x=0, y=0, dependencies=["t1"]),
+        ])
+        return {"basics": basics, "tools": tools, "extra": extra}
+
+    def test_edges_and_order(self, book):
+        graph = module.ChapterGraph(book)
+        assert graph.edges == {("basics", "tools"): 3, ("tools", "extra"): 1, ("extra", "tools"): 1}
+        report = graph.report()
+        assert report['cyclic'] == ["extra", "tools"]
+        assert [entry['key'] for entry in report['order']] == ["basics", "extra", "tools"]
+        assert report['out_of_order'] == [{'from': "basics", 'to': "tools", 'links': 3}]
+        assert len(report['cross_group']) == 2
+
+    def test_apply_matches_a_rebuild(self, book):
+        graph = module.ChapterGraph(book)
+        tools = book["tools"]
+        edited = edit_quest_in_chapter(tools, "t2", tools.quests[1].model_copy(update={'dependencies': ["b1"]}))
+        graph.apply("tools", edited)
+        assert graph.edges == module.ChapterGraph({**book, "tools": edited}).edges
+        assert module.ChapterGraph(book).report()['cyclic'] and not graph.report()['cyclic']
+        graph.apply("basics", None)
+        assert graph.edges == {("tools", "extra"): 1}
+
+    def test_apply_moves_a_quest_between_chapters_in_either_order(self, book):
+        basics, tools = book["basics"], book["tools"]
+        b1 = basics.quests[0]
+        without_b1 = remove_quest_from_chapter(basics, "b1")
+        with_b1 = add_quest_to_chapter(tools, b1)
+        for steps in ((("tools", with_b1), ("basics", without_b1)), (("basics", without_b1), ("tools", with_b1))):
+            graph = module.ChapterGraph(book)
+            for chapter_key, chapter in steps:
+                graph.apply(chapter_key, chapter)
+            assert graph.edges == module.ChapterGraph(graph.chapters).edges
+            assert graph.edges == {("tools", "basics"): 1, ("basics", "tools"): 2, ("tools", "extra"): 1, ("extra", "tools"): 1}
+
+    def test_chapter_graph_command(self, book, monkeypatch, capfd):
+        from cli import main
+        monkeypatch.setattr(sys, 'argv', ['cli.py', 'chapter-graph', '--format', 'json'])
+        with patch('cli.load_data_for_cli', return_value=book):
+            main()
+        out, err = capfd.readouterr()
+        assert json.loads(out)['edges'][0] == {'from': "basics", 'to': "tools", 'links': 3}
+
+
+# --- Test Component: Book Statistics ---
+
+class TestBookStats:
+    """Verifies module/controller/quest_stats.py and the 'stats' command."""
+
+    @pytest.fixture
+    def book(self):
+        first = Chapter(id="c1", filename="first", group="", order_index=0, quests=[
+            Quest(id="a", x=-2, y=1, hide_lock_icon=True,
+                  tasks=[Task(id="t1", type="item", optional_task=True), Task(id="t2", type="checkmark")],
+                  rewards=[Reward(id="r1", type="xp")]),
+            Quest(id="b", x=4, y=-3, dependencies=["a"]),
+        ])
+        second = Chapter(id="c2", filename="second", group="", order_index=1, quests=[
+            Quest(id="c", x=0, y=0, dependencies=["a", "b", "a"], tasks=[Task(id="t3", type="item")]),
+        ])
+        return {"first": first, "second": second}
+
+    def test_chapter_and_overall_totals(self, book):
+        stats = module.book_stats(book)
+        first, overall = stats['chapters']['first'], stats['overall']
+        assert first['tasks'] == {'item': 1, 'checkmark': 1} and first['optional_tasks'] == 1
+        assert first['hidden']['hide_lock_icon'] == 1 and first['hidden']['hide_until_deps_complete'] == 0
+        assert first['extent'] == {'min_x': -2, 'min_y': -3, 'max_x': 4, 'max_y': 1}
+        assert overall['tasks'] == {'item': 2, 'checkmark': 1} and overall['reward_count'] == 1
+        assert overall['fan_out'] == {0: 1, 1: 1, 2: 1}
+        assert 'extent' not in overall  # chapters do not share a coordinate space
+
+    def test_fan_in_counts_cross_chapter_dependents(self, book):
+        stats = module.book_stats(book)
+        assert stats['chapters']['first']['fan_in'] == {1: 1, 2: 1}
+        assert stats['chapters']['second']['fan_in'] == {0: 1}
+
+    def test_stats_command(self, book, monkeypatch, capfd):
+        from cli import main
+        monkeypatch.setattr(sys, 'argv', ['cli.py', 'stats', '--format', 'json'])
+        with patch('cli.load_data_for_cli', return_value=book):
+            main()
+        out, err = capfd.readouterr()
+        assert json.loads(out)['overall']['quests'] == 3
+
+
+# --- Test Component: Item Migration ---
+
+class TestItemMigration:
+    """Verifies module/controller/item_migrate.py and the 'migrate-items' command."""
+
+    @pytest.fixture
+    def book(self):
+        ported = Chapter(id="c1", filename="ported", group="", order_index=0, icon=Item(id="oldmod:gear"), quests=[
+            Quest(id="q1", x=0, y=0,
+                  tasks=[Task(id="t1", type="item", item=Item(id="oldmod:gear", count=4)), Task(id="t2", type="checkmark")],
+                  rewards=[Reward(id="r1", type="item", item=Item(id="oldmod:plate", components={"damage": 1}))]),
+            Quest(id="q2", x=0, y=0, tasks=[Task(id="t3", type="item", item=Item(id="minecraft:stone"))]),
+        ])
+        vanilla = Chapter(id="c2", filename="vanilla", group="", order_index=1, quests=[
+            Quest(id="q3", x=0, y=0, rewards=[Reward(id="r2", type="item", item=Item(id="minecraft:stone"))]),
+        ])
+        return {"ported": ported, "vanilla": vanilla}
+
+    def test_index_lists_every_occurrence(self, book):
+        index = module.item_index(book)
+        assert index["oldmod:gear"] == [("ported", -1, 'icon', -1), ("ported", 0, 'task', 0)]
+        assert index["minecraft:stone"] == [("ported", 1, 'task', 0), ("vanilla", 0, 'reward', 0)]
+
+    def test_migrate_only_touches_affected_objects(self, book):
+        mapping = {"oldmod:gear": {'id': "newmod:gear"}, "oldmod:plate": {'id': "newmod:plate", 'components': None}, "gone:item": {'id': "x"}}
+        updated, counts = module.migrate_items(book, mapping)
+        assert counts == {"oldmod:gear": 2, "oldmod:plate": 1, "gone:item": 0}
+        assert list(updated) == ["ported"]
+        chapter = updated["ported"]
+        assert chapter.icon.id == "newmod:gear"
+        assert chapter.quests[0].tasks[0].item == Item(id="newmod:gear", count=4)
+        assert chapter.quests[0].rewards[0].item.components is None
+        assert chapter.quests[0].tasks[1] is book["ported"].quests[0].tasks[1]
+        assert chapter.quests[1] is book["ported"].quests[1]
+
+    def test_load_item_mapping(self, tmp_path):
+        path = tmp_path / "mapping.json"
+        path.write_text('{"a:b": "c:d", "e:f": {"id": "g:h", "components": {"x": 1}}}')
+        assert module.load_item_mapping(str(path)) == {"a:b": {'id': "c:d"}, "e:f": {'id': "g:h", 'components': {"x": 1}}}
+        path.write_text('{"a:b": 3}')
+        with pytest.raises(ValueError):
+            module.load_item_mapping(str(path))
+
+    def test_migrate_items_command_saves_changed_files(self, tmp_path, monkeypatch, capfd):
+        from cli import main
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config_home"))
+        monkeypatch.setattr(sys, 'platform', 'linux')
+        chapters_dir = tmp_path / "pack" / "config" / "ftbquests" / "quests" / "chapters"
+        chapters_dir.mkdir(parents=True)
+        (chapters_dir / "ported.snbt").write_text(
+            '{ id: "c1" filename: "ported" group: "" order_index: 0 quests: [{ id: "q1" x: 0.0d y: 0.0d '
+            'tasks: [{ id: "t1" type: "item" item: { id: "oldmod:gear" } count: 8L }] }] }'
+        )
+        untouched = '{ id: "c2" filename: "vanilla" group: "" order_index: 1 quests: [] }'
+        (chapters_dir / "vanilla.snbt").write_text(untouched)
+        mapping = tmp_path / "mapping.json"
+        mapping.write_text('{"oldmod:gear": "newmod:gear"}')
+        monkeypatch.setattr(sys, 'argv', ['cli.py', '--root', str(tmp_path / "pack"), 'migrate-items', str(mapping)])
+        main()
+        out, err = capfd.readouterr()
+        assert "oldmod:gear -> newmod:gear: 1 occurrence(s)" in out and "Saved 1 chapter file(s)" in out
+        saved = (chapters_dir / "ported.snbt").read_text()
+        assert 'id: "newmod:gear"' in saved and "count: 8L" in saved
+        assert (chapters_dir / "vanilla.snbt").read_text() == untouched
+
+    def test_migrated_components_replace_the_saved_ones(self, tmp_path, monkeypatch, capfd):
+        from cli import main
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config_home"))
+        monkeypatch.setattr(sys, 'platform', 'linux')
+        chapters_dir = tmp_path / "pack" / "config" / "ftbquests" / "quests" / "chapters"
+        chapters_dir.mkdir(parents=True)
+        (chapters_dir / "ported.snbt").write_text(
+            '{ id: "c1" filename: "ported" group: "" order_index: 0 quests: [{ id: "q1" x: 0.0d y: 0.0d '
+            'rewards: [{ id: "r1" type: "item" item: { id: "oldmod:sword" count: 1 '
+            'components: { "minecraft:damage": 5, "minecraft:unbreakable": {} } } }] }] }'
+        )
+        mapping = tmp_path / "mapping.json"
+        mapping.write_text('{"oldmod:sword": {"id": "newmod:sword", "components": {"minecraft:custom_name": "Blade"}}}')
+        monkeypatch.setattr(sys, 'argv', ['cli.py', '--root', str(tmp_path / "pack"), 'migrate-items', str(mapping)])
+        main()
+        capfd.readouterr()
+
+        saved = (chapters_dir / "ported.snbt").read_text()
+        assert "minecraft:damage" not in saved and "minecraft:unbreakable" not in saved
+        reloaded = module.parse_chapters(module.load_chapter_data(str(chapters_dir)))
+        item = reloaded["ported"].quests[0].rewards[0].item
+        assert (item.id, item.count, item.components) == ("newmod:sword", 1, {"minecraft:custom_name": "Blade"})
+
+
+# --- Test Component: ID Allocation ---
+
+class TestIdAllocator(TestDataFixtures):
+    """Verifies module/controller/id_allocator.py and the 'ids' command."""
+
+    def test_collects_every_book_id(self, parsed_chapters):
+        allocator = module.IdAllocator.from_chapters(parsed_chapters)
+        for object_id in ("chap_test_edit", "q_test_edit", "t_gold_collect", "r_xp_reward"):
+            assert object_id in allocator
+        assert len(allocator) == 4
+
+    def test_allocate_skips_taken_ids(self):
+        import random
+        taken = f"{random.Random(7).getrandbits(64):016X}"
+        allocator = module.IdAllocator([taken.lower()], rng=random.Random(7))
+        new_id = allocator.allocate()
+        assert new_id != taken and module.is_valid_id(new_id) and new_id in allocator
+
+    def test_allocate_many_is_unique(self):
+        allocator = module.IdAllocator()
+        ids = allocator.allocate_many(5000)
+        assert len(set(ids)) == 5000 and len(allocator) == 5000
+        assert all(module.is_valid_id(object_id) for object_id in ids)
+
+    def test_reserve_and_release(self):
+        allocator = module.IdAllocator(["0123456789ABCDEF"])
+        assert not allocator.reserve("0123456789abcdef")
+        assert not allocator.reserve("0000000000000000") and not allocator.reserve("xyz")
+        assert allocator.reserve("FEDCBA9876543210") and not allocator.is_available("FEDCBA9876543210")
+        allocator.release("0123456789ABCDEF")
+        assert allocator.is_available("0123456789ABCDEF")
+
+    def test_ids_command(self, parsed_chapters, monkeypatch, capfd):
+        import cli
+        monkeypatch.setattr(cli, 'load_data_for_cli', lambda **kwargs: parsed_chapters)
+        monkeypatch.setattr(sys, 'argv', ['cli.py', 'ids', 'new', '--count', '3'])
+        cli.main()
+        out, err = capfd.readouterr()
+        assert len(set(out.split())) == 3
+        monkeypatch.setattr(sys, 'argv', ['cli.py', 'ids', 'check', 'ABCDEF0123456789', 'q_test_edit'])
+        with pytest.raises(SystemExit):
+            cli.main()
+        out, err = capfd.readouterr()
+        assert "ABCDEF0123456789: available" in out and "q_test_edit: invalid" in out